@@ -2,10 +2,8 @@
 
 import sys
 import os
-import shutil
 from datetime import datetime
 import threading
-import time
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                            QPushButton, QLineEdit, QLabel, QProgressBar, QCheckBox, QGridLayout,
                            QDialog, QScrollArea, QFormLayout, QMessageBox, QFileDialog, QSizePolicy,
@@ -14,6 +12,23 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QH
 from PyQt6.QtGui import QColor, QFont, QGuiApplication, QIcon, QAction
 from PyQt6.QtCore import Qt, QTimer
 
+# Shared engine lives at the repository root, next to the suite folders
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from organizer_core.categories import MEDIA_FILE_CATEGORIES
+from organizer_core.engine import OrganizerEngine
+from organizer_core.history import UndoHistory
+from organizer_core.job import JobSpec
+from organizer_gui.clock import shared_clock
+from organizer_gui.preview import PlanPreview
+from organizer_gui.recovery import schedule_recovery
+from organizer_gui.rules import edit_rules, load_window_rules
+from organizer_gui.styles import apply_stylesheet, set_state
+from organizer_gui.undo import show_undo_failures, undo_job
+from organizer_gui.watch import keep_organized
+from organizer_gui.worker import start_worker
+
 # --- Constants for Styling ---
 # Orange Theme Colors (From Original Media)
 ORANGE_COLORS = {
@@ -35,6 +50,146 @@ ORANGE_COLORS = {
 
 FONT_FAMILY = "Segoe UI"      # Consistent font
 
+def _stylesheet(colors):
+    """Build the window stylesheet for a palette (compiled once per palette, see organizer_gui.styles)."""
+    return f"""
+        QMainWindow, QDialog {{
+            background-color: {colors['background']};
+        }}
+        QWidget {{
+            color: {colors['text_primary']};
+            font-family: '{FONT_FAMILY}';
+            background-color: transparent;
+        }}
+        QLabel {{
+            background-color: transparent;
+            color: {colors['text_primary']};
+        }}
+        QLabel#TimeLabel {{ /* White, default */ }}
+        QLabel#GreetingLabel {{ color: {colors['text_secondary']}; }}
+        QLabel#app_title {{ color: {colors['primary']}; }} /* Primary Orange title */
+        QLabel#StatusLabel {{ color: {colors['text_secondary']}; }}
+        QLabel#StatusLabel[level="success"] {{ color: {colors['success']}; }}
+        QLabel#StatusLabel[level="warning"] {{ color: {colors['warning']}; }}
+        QLabel#StatusLabel[level="error"] {{ color: {colors['danger']}; }}
+        QLabel#FooterLabel {{ color: #64748B; }} /* Standard footer color */
+        QDialog QLabel {{ padding-top: 2px; }}
+
+        QLineEdit {{
+            background-color: {colors['input_bg']}; /* Use distinct input bg */
+            border: 1px solid {colors['border']};
+            border-radius: 5px;
+            padding: 8px 10px;
+            color: {colors['text_primary']};
+            font-size: 10pt;
+        }}
+        QLineEdit:focus {{
+            border: 1px solid {colors['primary']}; /* Highlight with primary orange */
+        }}
+
+        QPushButton {{
+            border-radius: 5px;
+            padding: 9px 18px;
+            font-size: 10pt;
+            font-weight: 500;
+            border: none;
+            color: {colors['text_primary']}; /* White text on buttons */
+        }}
+        QPushButton:hover {{ opacity: 0.85; }}
+        QPushButton:disabled {{
+            background-color: {colors['secondary']}; /* Use secondary orange */
+            opacity: 0.6;
+        }}
+
+        QPushButton#PrimaryButton {{ background-color: {colors['primary']}; }} /* Primary Orange */
+        QPushButton#SecondaryButton {{ background-color: {colors['secondary']}; }} /* Secondary Orange */
+        QPushButton#AccentButton {{ background-color: {colors['accent']}; }} /* Accent Orange */
+        QPushButton#PrimaryButton[danger="true"] {{ background-color: {colors['danger']}; }} /* Cancel while organizing */
+
+        QPushButton#TextButton {{
+             background-color: transparent;
+             color: {colors['accent']}; /* Use accent orange */
+             font-size: 9pt;
+             font-weight: normal;
+             padding: 4px 8px;
+             text-decoration: underline;
+             opacity: 1.0;
+         }}
+         QPushButton#TextButton:hover {{
+             color: {colors['text_primary']}; /* White on hover */
+             text-decoration: underline;
+             opacity: 1.0;
+         }}
+
+        QProgressBar {{
+            border: none;
+            border-radius: 5px;
+            background-color: {colors['progress_bar_bg']}; /* Use orange progress bg */
+            height: 10px;
+            text-align: center;
+            color: transparent;
+        }}
+        QProgressBar::chunk {{
+            background-color: {colors['progress_bar_chunk']}; /* Use orange chunk color */
+            border-radius: 5px;
+        }}
+
+        QCheckBox {{
+            spacing: 8px;
+            font-size: 10pt;
+            color: {colors['text_primary']};
+        }}
+        QCheckBox::indicator {{
+            width: 16px; height: 16px;
+            border: 1px solid {colors['border']};
+            border-radius: 3px;
+            background-color: {colors['input_bg']}; /* Match input background */
+        }}
+        QCheckBox::indicator:hover {{
+            border: 1px solid {colors['primary']}; /* Highlight with primary orange */
+        }}
+        QCheckBox::indicator:checked {{
+            background-color: {colors['primary']}; /* Use primary orange */
+            border: 1px solid {colors['primary']};
+        }}
+        QCheckBox::indicator:checked:hover {{ opacity: 0.85; }}
+
+        QScrollArea {{ border: none; background-color: transparent; }}
+        QScrollArea > QWidget > QWidget {{ background-color: transparent; }}
+        QScrollArea#DialogScrollArea {{ }} /* No specific style needed now */
+
+        QScrollBar:vertical {{
+            border: none;
+            background: {colors['secondary_bg']}; /* Use secondary bg */
+            width: 10px; margin: 0px; border-radius: 5px;
+        }}
+        QScrollBar::handle:vertical {{
+            background: {colors['primary']}; /* Use primary orange */
+            min-height: 25px; border-radius: 5px;
+        }}
+        QScrollBar::handle:vertical:hover {{ background: {colors['accent']}; }} /* Use accent orange */
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            border: none; background: none; height: 0px;
+        }}
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
+
+        QFrame#divider {{
+             border: none;
+             border-top: 1px solid {colors['border']};
+             height: 1px; margin: 5px 0px;
+         }}
+
+        QMessageBox {{ background-color: {colors['secondary_bg']}; }}
+        QMessageBox QLabel {{ color: {colors['text_primary']}; font-size: 10pt; }}
+        QMessageBox QPushButton {{
+             min-width: 80px;
+             background-color: {colors['primary']}; /* Primary orange for buttons */
+             color: {colors['text_primary']};
+        }}
+        QMessageBox QPushButton:hover {{ opacity: 0.85; }}
+    """
+
+
 class MediaOrganizerApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -43,31 +198,19 @@ class MediaOrganizerApp(QMainWindow):
         # --- Use the Orange Theme ---
         self.current_colors = ORANGE_COLORS
 
-        # --- Media File Categories (From Original Media) ---
-        self.file_categories = {
-            "Videos": [".mp4", ".avi", ".mov", ".wmv", ".mkv", ".flv", ".webm", ".m4v", ".mpeg", ".mpg", ".3gp"],
-            "Sound Effects": [".wav", ".mp3", ".ogg", ".flac", ".aac", ".m4a", ".aiff", ".wma"],
-            "Background Music": [".wav", ".mp3", ".ogg", ".flac", ".aac", ".m4a", ".aiff", ".wma"],
-            "Images": [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif", ".webp", ".svg", ".heif", ".heic", ".raw"],
-            "Overlays": [".mov", ".png", ".tiff", ".webm", ".avi", ".mkv"], # Note overlaps
-            "GIFs": [".gif", ".apng"], # Note overlaps
-            "Archives": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tar.gz", ".tar.bz2", ".tar.xz", ".cab", ".iso", ".dmg"],
-            "Project Files": [".prproj", ".fcpxml", ".veg", ".drp", ".sesx", ".als", ".cpr", ".blend", ".aep", ".c4d", ".ma", ".mb", ".max"],
-            "Vector & Design Files": [".ai", ".eps", ".psd", ".sketch", ".fig", ".indd", ".xd"],
-            "Subtitles & Captions": [".srt", ".vtt", ".ass", ".sub"],
-            "3D & Animation Files": [".obj", ".fbx", ".stl", ".gltf", ".glb", ".bvh"],
-            "Fonts & Text Styles": [".ttf", ".otf", ".woff", ".woff2"],
-            "Code & Scripts": [".jsx", ".py", ".lua", ".xml"]
-            # Consider adding an "Other" category if desired
-        }
-        # Sort categories alphabetically for consistent display order
-        self.file_categories = dict(sorted(self.file_categories.items()))
+        # --- Media File Categories (shared with the headless engine) ---
+        self.file_categories = dict(MEDIA_FILE_CATEGORIES)
         self.custom_folder_names = {k: k for k in self.file_categories.keys()}
 
         # --- State (From Personal/Office refactor) ---
         self.unavailable_file_types = set()
         self.is_organizing = False
-        self.undo_stack = []  # Add undo stack to track file movements
+        self.organize_thread = None
+        self.organize_worker = None
+        self.undo_thread = None
+        self.undo_worker = None
+        self.history = UndoHistory("media")  # Undo history, kept on disk across restarts
+        self.plan_preview = PlanPreview(self, self._job_spec, self._plan_ready, self.update_status)
 
         # --- Window Size (Adapted from Personal/Office refactor) ---
         screen = QGuiApplication.primaryScreen().availableGeometry()
@@ -79,6 +222,7 @@ class MediaOrganizerApp(QMainWindow):
 
         self.setup_ui()
         self.update_stylesheet() # Apply the orange theme stylesheet
+        self.rules = load_window_rules(self, "media")  # Checked before the categories (Rules button)
 
     def setup_ui(self):
         # Structure largely taken from PERSONAL/OFFICE refactor
@@ -144,6 +288,7 @@ class MediaOrganizerApp(QMainWindow):
         source_layout.addWidget(source_label)
         self.source_entry = QLineEdit()
         self.source_entry.setPlaceholderText("Where are the files you want to organize?...") # Placeholder from Media
+        self.source_entry.textChanged.connect(lambda _text: self.plan_preview.forget())
         source_layout.addWidget(self.source_entry)
         source_btn = QPushButton("Browse")
         source_btn.setObjectName("AccentButton") # Use accent color for browse
@@ -162,6 +307,7 @@ class MediaOrganizerApp(QMainWindow):
         dest_layout.addWidget(dest_label)
         self.dest_entry = QLineEdit()
         self.dest_entry.setPlaceholderText("Where do you want to organize your files?...") # Placeholder from Media
+        self.dest_entry.textChanged.connect(lambda _text: self.plan_preview.forget())
         dest_layout.addWidget(self.dest_entry)
         dest_btn = QPushButton("Browse")
         dest_btn.setObjectName("AccentButton") # Use accent color for browse
@@ -210,6 +356,7 @@ class MediaOrganizerApp(QMainWindow):
         for i, file_type in enumerate(self.file_types):
             checkbox = QCheckBox(file_type)
             checkbox.setChecked(True)
+            checkbox.toggled.connect(lambda _checked: self.plan_preview.selection_changed())
             self.check_vars[file_type] = checkbox
             checkbox_layout.addWidget(checkbox, i // num_cols, i % num_cols)
         checkbox_scroll.setWidget(checkbox_widget)
@@ -253,7 +400,7 @@ class MediaOrganizerApp(QMainWindow):
         self.undo_btn.setObjectName("SecondaryButton")
         self.undo_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.undo_btn.clicked.connect(self.undo_last_action)
-        self.undo_btn.setEnabled(False)  # Initially disabled
+        self.undo_btn.setEnabled(self.history.latest() is not None)  # Runs from earlier sessions can be undone too
         action_button_layout.addWidget(self.undo_btn)
         
         self.custom_folder_btn = QPushButton("Customize Folder Names")
@@ -261,6 +408,13 @@ class MediaOrganizerApp(QMainWindow):
         self.custom_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.custom_folder_btn.clicked.connect(self.open_custom_style_dialog)
         action_button_layout.addWidget(self.custom_folder_btn)
+
+        self.rules_btn = QPushButton("Rules")
+        self.rules_btn.setObjectName("SecondaryButton")
+        self.rules_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.rules_btn.setToolTip("Send items to a folder by size, age, name pattern or path")
+        self.rules_btn.clicked.connect(self.open_rules_dialog)
+        action_button_layout.addWidget(self.rules_btn)
         
         # Add About button
         about_btn = QPushButton("About")
@@ -270,6 +424,16 @@ class MediaOrganizerApp(QMainWindow):
         action_button_layout.addWidget(about_btn)
         
         action_button_layout.addStretch(1)
+        self.watch_check = QCheckBox("Keep this folder organized")
+        self.watch_check.setToolTip("After organizing, keep watching the source folder and sort new items as they arrive.")
+        self.watch_check.setCursor(Qt.CursorShape.PointingHandCursor)
+        action_button_layout.addWidget(self.watch_check)
+        self.preview_btn = QPushButton("Preview")
+        self.preview_btn.setObjectName("SecondaryButton")
+        self.preview_btn.setToolTip("Show what would be moved where, without moving anything.")
+        self.preview_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.preview_btn.clicked.connect(self.preview_plan)
+        action_button_layout.addWidget(self.preview_btn)
         self.organize_btn = QPushButton("Start Organizing") # Changed from 'Organize Files' to 'Start Organizing'
         self.organize_btn.setObjectName("PrimaryButton") # Use primary style
         self.organize_btn.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold)) # Consistent bold style
@@ -285,10 +449,11 @@ class MediaOrganizerApp(QMainWindow):
         footer.setAlignment(Qt.AlignmentFlag.AlignRight)
         main_layout.addWidget(footer)
 
-        # --- Timer for Time/Greeting Update (From refactor) ---
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_time_and_greeting)
-        self.update_timer.start(1000)
+        # --- Time/Greeting Update (shared clock; ticks only while this window is visible) ---
+        shared_clock().subscribe(self, self.update_time_and_greeting)
+
+        # --- Offer to recover runs a crash left half done ---
+        schedule_recovery(self, "media")
 
         # --- Apply initial colors ---
         self.update_ui_colors() # Set initial label colors etc.
@@ -380,6 +545,15 @@ class MediaOrganizerApp(QMainWindow):
                 self.custom_folder_names[category] = category
         dialog.accept()
         self.update_status("Custom folder names saved.", "info")
+        self.plan_preview.selection_changed()
+
+    def open_rules_dialog(self):
+        """Edit the rules checked before the categories (saved for the next session too)."""
+        rules = edit_rules(self, "media", self.rules)
+        if rules is not None:
+            self.rules = rules
+            self.update_status(f"{len(rules)} rule(s) saved." if rules else "Rules cleared.", "info")
+            self.plan_preview.selection_changed()
 
     # --- organize_files, reset_ui_state, update_status, _update_status_ui ---
     # --- show_unavailable_types_popup, start_organizing remain functionally the same ---
@@ -393,161 +567,201 @@ class MediaOrganizerApp(QMainWindow):
         
         self.is_organizing = True
         self.organize_btn.setText("Cancel Organization")
-        self.organize_btn.setObjectName("DangerButton")
-        self.update_stylesheet()
+        set_state(self.organize_btn, "danger", True)
         self.progress_bar.setValue(0)
         self.update_status("Starting organization...", "info")
         
-        # Start organization in a separate thread
-        self.organize_thread = threading.Thread(target=self.organize_files)
-        self.organize_thread.daemon = True
+        # Run organization on a worker thread; its signals are queued back to this window
+        spec = self._job_spec()
+        plan = self.plan_preview.current(spec)  # A preview of exactly these settings runs without rescanning
+        self.plan_preview.forget()
+        watch = self.watch_check.isChecked()
+        self.organize_thread, worker = start_worker(lambda worker: self.organize_files(worker, spec, plan, watch))
+        self.organize_worker = worker
+        worker.progress.connect(self._update_progress)
+        worker.status.connect(self.update_status)
+        worker.counts.connect(self._update_counts)
+        worker.movements.connect(self._moves_recorded)
+        worker.items_skipped.connect(self._items_skipped)
+        worker.finished.connect(lambda: self._organize_finished(worker))
         self.organize_thread.start()
 
     def cancel_organizing(self):
         """Cancel the ongoing organization process."""
         self.is_organizing = False
+        if self.organize_worker is not None:
+            self.organize_worker.cancel()
         self.update_status("Organization cancelled by user.", "warning")
         self.reset_ui_state()
 
+    def _organize_finished(self, worker):
+        """Reset the UI once the current run's worker is done (a cancelled older run is ignored)."""
+        if worker is self.organize_worker:
+            self.organize_worker = None
+            self.reset_ui_state()
+            if worker.result is not None:
+                self._items_skipped(worker.result, show=worker.should_continue())
+
+    def _stop_worker(self):
+        """Cancel a running worker and wait for its thread, e.g. before the window closes."""
+        if self.organize_worker is not None:
+            self.organize_worker.cancel()
+        if self.undo_worker is not None:
+            self.undo_worker.cancel()
+        self.plan_preview.stop()
+        if self.organize_thread is not None:
+            self.organize_thread.wait()
+        if self.undo_thread is not None:
+            self.undo_thread.wait()
+
     def reset_ui_state(self):
         """Reset UI to initial state after organization."""
         self.is_organizing = False
         self.organize_btn.setText("Start Organizing")
-        self.organize_btn.setObjectName("PrimaryButton")
-        self.update_stylesheet()
+        set_state(self.organize_btn, "danger", False)
         self.progress_bar.setValue(0)
 
-    def organize_files(self):
-        """Organize files in the background thread."""
+    def _job_spec(self):
+        """Snapshot the current selections as a JobSpec (built on the GUI thread)."""
+        return JobSpec.create(
+            "media", self.source_entry.text(), self.dest_entry.text(),
+            file_types=[ft for ft in self.file_categories if self.check_vars[ft].isChecked()],
+            folder_names=self.custom_folder_names,
+            rules=self.rules)
+
+    def organize_files(self, worker, spec, plan=None, watch=False):
+        """Organize files on the worker thread, reporting back through its signals.
+
+        plan is the previewed MovePlan for spec, if any: its moves are carried out as shown.
+        watch keeps sorting new items afterwards, until cancelled. Returns the
+        extensions left in place, for _organize_finished to show; no widget or
+        window state is touched from this thread.
+        """
         try:
-            if not self.source_entry.text() or not self.dest_entry.text():
-                QTimer.singleShot(0, lambda: self.update_status("Please select both source and destination folders.", "warning"))
-                QTimer.singleShot(0, self.reset_ui_state)
+            source_dir = spec.sources[0]
+            dest_dir = spec.destination
+            if not source_dir or not dest_dir:
+                worker.report_status("Please select both source and destination folders.", "warning")
                 return
 
-            source_dir = self.source_entry.text()
-            dest_dir = self.dest_entry.text()
-
             if not os.path.exists(source_dir):
-                QTimer.singleShot(0, lambda: self.update_status("Source directory does not exist.", "error"))
-                QTimer.singleShot(0, self.reset_ui_state)
+                worker.report_status("Source directory does not exist.", "error")
                 return
 
             if not os.path.exists(dest_dir):
                 try:
                     os.makedirs(dest_dir)
                 except Exception as e:
-                    QTimer.singleShot(0, lambda: self.update_status(f"Error creating destination directory: {str(e)}", "error"))
-                    QTimer.singleShot(0, self.reset_ui_state)
+                    worker.report_status(f"Error creating destination directory: {str(e)}", "error")
                     return
 
-            # Clear undo stack when starting new organization
-            QTimer.singleShot(0, self._clear_undo_stack)
-
-            # Get selected file types
-            selected_types = [ft for ft in self.file_categories.keys() if self.check_vars[ft].isChecked()]
-            if not selected_types:
-                QTimer.singleShot(0, lambda: self.update_status("Please select at least one file type to organize.", "warning"))
-                QTimer.singleShot(0, self.reset_ui_state)
+            engine = OrganizerEngine(spec)
+            if not engine.has_work():
+                worker.report_status("Please select at least one file type (or add a rule) to organize.", "warning")
                 return
 
-            # Create a dictionary to store file movements for undo
-            file_movements = {}
-
-            # Get total files for progress calculation
-            total_files = sum(1 for f in os.listdir(source_dir) if os.path.isfile(os.path.join(source_dir, f)))
-            processed_files = 0
-
-            # Process each file
-            for filename in os.listdir(source_dir):
-                if not self.is_organizing:  # Check if organization was cancelled
-                    break
-
-                if not os.path.isfile(os.path.join(source_dir, filename)):
-                    continue
-
-                file_ext = os.path.splitext(filename)[1].lower()
-                moved = False
-
-                for category in selected_types:
-                    if file_ext in self.file_categories[category]:
-                        category_dir = os.path.join(dest_dir, self.custom_folder_names[category])
-                        if not os.path.exists(category_dir):
-                            os.makedirs(category_dir)
-
-                        source_path = os.path.join(source_dir, filename)
-                        dest_path = os.path.join(category_dir, filename)
-
-                        # Store original location for undo
-                        file_movements[filename] = {
-                            'source': source_path,
-                            'destination': dest_path,
-                            'category': category
-                        }
-
-                        shutil.move(source_path, dest_path)
-                        moved = True
-                        break
-
-                if not moved:
-                    self.unavailable_file_types.add(file_ext)
-
-                processed_files += 1
-                progress = int((processed_files / total_files) * 100)
-                QTimer.singleShot(0, lambda p=progress: self._update_progress(p))
+            def report(stats):
+                worker.report_progress(int(stats.fraction() * 100), stats.describe())
+                worker.report_counts(stats.categories)
+
+            def new_undo_step():
+                """Start a step of the undo history; return the on_moves callback that saves moved files to it."""
+                recorder = self.history.recorder(source_dir)
+
+                def record_moves(moves):
+                    recorder.add(moves)
+                    worker.movements.emit(len(moves))
+                return record_moves
+
+            # Stream scan -> classify -> plan -> move; leftovers of the last run with these settings are skipped
+            # Moves are saved to the undo history as they finish, so a run that fails part-way can still be undone
+            result = engine.organize(
+                source_dir,
+                should_continue=worker.should_continue,
+                on_progress=report,
+                progress_interval=worker.interval,
+                on_status=lambda message: worker.report_status(message, "info"),
+                plan=plan,
+                on_moves=new_undo_step())
+            skipped = set(engine.unavailable_types)
+
+            if worker.should_continue():  # Only show success if not cancelled
+                if result.errors:
+                    error_msg = f"Files organized, but {len(result.errors)} could not be moved: {result.errors[0][1]}"
+                    worker.report_status(error_msg, "warning")
+                else:
+                    worker.report_status("Files organized successfully!", "success")
+
+            # Keep this folder organized: sort new items as they arrive, until cancelled
+            if watch and worker.should_continue():
+                worker.items_skipped.emit(skipped)  # Shown now: the worker only finishes once watching stops
+                keep_organized(worker, engine, source_dir, new_undo_step)
+                return None
+            return skipped
 
-            # Add the file movements to undo stack if any files were moved
-            if file_movements:
-                QTimer.singleShot(0, lambda: self._add_to_undo_stack(file_movements))
+        except Exception as e:
+            worker.report_status(f"Error organizing files: {str(e)}", "error")
 
-            if self.is_organizing:  # Only show success if not cancelled
-                QTimer.singleShot(0, lambda: self.update_status("Files organized successfully!", "success"))
-                if self.unavailable_file_types:
-                    QTimer.singleShot(0, self.show_unavailable_types_popup)
+    def _update_progress(self, value, detail=None):
+        """Update the progress bar value and the per-stage throughput line."""
+        self.progress_bar.setValue(value)
+        if detail:
+            self._update_status_ui(detail, "info")
 
-        except Exception as e:
-            QTimer.singleShot(0, lambda: self.update_status(f"Error organizing files: {str(e)}", "error"))
-        finally:
-            QTimer.singleShot(0, self.reset_ui_state)
+    def _update_counts(self, counts):
+        """Show files moved per category in the progress bar tooltip."""
+        self.progress_bar.setToolTip("\n".join(f"{category}: {count:,}" for category, count in sorted(counts.items())))
 
-    def _clear_undo_stack(self):
-        """Clear the undo stack and disable the undo button."""
-        self.undo_stack = []
-        self.undo_btn.setEnabled(False)
+    def preview_plan(self):
+        """Work out what organizing would do with the current selections, without moving anything."""
+        if self.is_organizing or self.undo_worker is not None:
+            self.update_status("Wait for the current run to finish before previewing.", "warning")
+            return
+        self.update_status("Previewing...", "info")
+        self.plan_preview.preview()
 
-    def _update_progress(self, value):
-        """Update the progress bar value."""
-        self.progress_bar.setValue(value)
+    def _plan_ready(self, plan):
+        """Show a preview's per-category counts and sizes in the progress bar tooltip."""
+        if plan is not None:
+            self.progress_bar.setToolTip(plan.breakdown())
 
-    def _add_to_undo_stack(self, file_movements):
-        """Add file movements to the undo stack and enable the undo button."""
-        self.undo_stack.append(file_movements)
+    def _moves_recorded(self, count):
+        """A run's moves were saved to the undo history: enable the undo button."""
         self.undo_btn.setEnabled(True)
 
     def undo_last_action(self):
-        """Undo the last file organization action."""
-        if not self.undo_stack:
+        """Undo the most recent run in the history on a worker thread, or cancel the undo in progress."""
+        if self.undo_worker is not None:
+            self.undo_worker.cancel()
+            return
+        if self.is_organizing:
+            self.update_status("Wait for the current run to finish before undoing.", "warning")
+            return
+        run = self.history.latest()
+        if run is None:
             self.update_status("Nothing to undo.", "info")
+            self.undo_btn.setEnabled(False)
             return
 
-        try:
-            # Get the last set of file movements
-            last_movements = self.undo_stack.pop()
-            
-            # Move files back to their original locations
-            for filename, movement in last_movements.items():
-                if os.path.exists(movement['destination']):
-                    shutil.move(movement['destination'], movement['source'])
-            
-            # Update UI
-            self.undo_btn.setEnabled(len(self.undo_stack) > 0)
-            self.update_status("Last action undone successfully!", "success")
-            
-        except Exception as e:
-            self.update_status(f"Error undoing last action: {str(e)}", "error")
-            # If there was an error, we should clear the undo stack to prevent further issues
-            self.undo_stack = []
-            self.undo_btn.setEnabled(False)
+        self.undo_btn.setText("Cancel Undo")
+        self.organize_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.update_status(f"Undoing the last action ({run.items:,} items)...", "info")
+        self.undo_thread, worker = start_worker(undo_job(self.history, run))
+        self.undo_worker = worker
+        worker.progress.connect(self._update_progress)
+        worker.status.connect(self.update_status)
+        worker.finished.connect(lambda: self._undo_finished(worker))
+        self.undo_thread.start()
+
+    def _undo_finished(self, worker):
+        """Restore the buttons after an undo and list any items that could not be put back."""
+        self.undo_worker = None
+        self.undo_btn.setText("Undo Last Action")
+        self.undo_btn.setEnabled(self.history.latest() is not None)
+        self.organize_btn.setEnabled(True)
+        self.plan_preview.forget()  # Items are back in the source folder: a shown preview is out of date
+        show_undo_failures(self, worker.result)
 
     def update_status(self, message, level="info", temporary=False):
         """Update status label with colored message."""
@@ -558,16 +772,9 @@ class MediaOrganizerApp(QMainWindow):
 
     def _update_status_ui(self, message, level="info", temporary=False):
         """Update status UI with appropriate color."""
-        color_map = {
-            "success": self.current_colors['success'],
-            "warning": self.current_colors['warning'],
-            "error": self.current_colors['danger'],
-            "info": self.current_colors['text_secondary']
-        }
-        color = color_map.get(level, self.current_colors['text_secondary'])
-
         self.status_label.setText(message)
-        self.status_label.setStyleSheet(f"color: {color};")
+        # The colour comes from the QLabel#StatusLabel[level=...] rules of the stylesheet
+        set_state(self.status_label, "level", level)
 
         if hasattr(self, '_status_reset_timer') and self._status_reset_timer and self._status_reset_timer.isActive():
             self._status_reset_timer.stop()
@@ -579,6 +786,12 @@ class MediaOrganizerApp(QMainWindow):
             self._status_reset_timer.timeout.connect(lambda: self._update_status_ui("Ready to organize.", "info"))
             self._status_reset_timer.start(5000)
 
+    def _items_skipped(self, extensions, show=True):
+        """Take in the extensions a run left in place (on the GUI thread) and tell the user."""
+        self.unavailable_file_types.update(extensions)
+        if show:
+            self.show_unavailable_types_popup()
+
     def show_unavailable_types_popup(self):
         """Show popup for uncategorized file types."""
         if not self.unavailable_file_types:
@@ -629,155 +842,22 @@ class MediaOrganizerApp(QMainWindow):
                                          QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.Yes:
                 self.is_organizing = False
-                time.sleep(0.1)
+                self._stop_worker()  # Cancel and wait, so the thread never outlives the window
                 event.accept()
             else:
                 event.ignore()
         else:
+            self._stop_worker()
             event.accept()
 
     def update_stylesheet(self):
-        # Stylesheet structure from refactor, using ORANGE_COLORS
-        # No code changes needed here, as it dynamically uses self.current_colors
-        sheet = f"""
-            QMainWindow, QDialog {{
-                background-color: {self.current_colors['background']};
-            }}
-            QWidget {{
-                color: {self.current_colors['text_primary']};
-                font-family: '{FONT_FAMILY}';
-                background-color: transparent;
-            }}
-            QLabel {{
-                background-color: transparent;
-                color: {self.current_colors['text_primary']};
-            }}
-            QLabel#TimeLabel {{ /* White, default */ }}
-            QLabel#GreetingLabel {{ color: {self.current_colors['text_secondary']}; }}
-            QLabel#app_title {{ color: {self.current_colors['primary']}; }} /* Primary Orange title */
-            QLabel#StatusLabel {{ color: {self.current_colors['text_secondary']}; }}
-            QLabel#FooterLabel {{ color: #64748B; }} /* Standard footer color */
-            QDialog QLabel {{ padding-top: 2px; }}
-
-            QLineEdit {{
-                background-color: {self.current_colors['input_bg']}; /* Use distinct input bg */
-                border: 1px solid {self.current_colors['border']};
-                border-radius: 5px;
-                padding: 8px 10px;
-                color: {self.current_colors['text_primary']};
-                font-size: 10pt;
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {self.current_colors['primary']}; /* Highlight with primary orange */
-            }}
-
-            QPushButton {{
-                border-radius: 5px;
-                padding: 9px 18px;
-                font-size: 10pt;
-                font-weight: 500;
-                border: none;
-                color: {self.current_colors['text_primary']}; /* White text on buttons */
-            }}
-            QPushButton:hover {{ opacity: 0.85; }}
-            QPushButton:disabled {{
-                background-color: {self.current_colors['secondary']}; /* Use secondary orange */
-                opacity: 0.6;
-            }}
-
-            QPushButton#PrimaryButton {{ background-color: {self.current_colors['primary']}; }} /* Primary Orange */
-            QPushButton#SecondaryButton {{ background-color: {self.current_colors['secondary']}; }} /* Secondary Orange */
-            QPushButton#AccentButton {{ background-color: {self.current_colors['accent']}; }} /* Accent Orange */
-
-            QPushButton#TextButton {{
-                 background-color: transparent;
-                 color: {self.current_colors['accent']}; /* Use accent orange */
-                 font-size: 9pt;
-                 font-weight: normal;
-                 padding: 4px 8px;
-                 text-decoration: underline;
-                 opacity: 1.0;
-             }}
-             QPushButton#TextButton:hover {{
-                 color: {self.current_colors['text_primary']}; /* White on hover */
-                 text-decoration: underline;
-                 opacity: 1.0;
-             }}
-
-            QProgressBar {{
-                border: none;
-                border-radius: 5px;
-                background-color: {self.current_colors['progress_bar_bg']}; /* Use orange progress bg */
-                height: 10px;
-                text-align: center;
-                color: transparent;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.current_colors['progress_bar_chunk']}; /* Use orange chunk color */
-                border-radius: 5px;
-            }}
-
-            QCheckBox {{
-                spacing: 8px;
-                font-size: 10pt;
-                color: {self.current_colors['text_primary']};
-            }}
-            QCheckBox::indicator {{
-                width: 16px; height: 16px;
-                border: 1px solid {self.current_colors['border']};
-                border-radius: 3px;
-                background-color: {self.current_colors['input_bg']}; /* Match input background */
-            }}
-            QCheckBox::indicator:hover {{
-                border: 1px solid {self.current_colors['primary']}; /* Highlight with primary orange */
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.current_colors['primary']}; /* Use primary orange */
-                border: 1px solid {self.current_colors['primary']};
-            }}
-            QCheckBox::indicator:checked:hover {{ opacity: 0.85; }}
-
-            QScrollArea {{ border: none; background-color: transparent; }}
-            QScrollArea > QWidget > QWidget {{ background-color: transparent; }}
-            QScrollArea#DialogScrollArea {{ }} /* No specific style needed now */
-
-            QScrollBar:vertical {{
-                border: none;
-                background: {self.current_colors['secondary_bg']}; /* Use secondary bg */
-                width: 10px; margin: 0px; border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {self.current_colors['primary']}; /* Use primary orange */
-                min-height: 25px; border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical:hover {{ background: {self.current_colors['accent']}; }} /* Use accent orange */
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                border: none; background: none; height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
-
-            QFrame#divider {{
-                 border: none;
-                 border-top: 1px solid {self.current_colors['border']};
-                 height: 1px; margin: 5px 0px;
-             }}
-
-            QMessageBox {{ background-color: {self.current_colors['secondary_bg']}; }}
-            QMessageBox QLabel {{ color: {self.current_colors['text_primary']}; font-size: 10pt; }}
-            QMessageBox QPushButton {{
-                 min-width: 80px;
-                 background-color: {self.current_colors['primary']}; /* Primary orange for buttons */
-                 color: {self.current_colors['text_primary']};
-            }}
-            QMessageBox QPushButton:hover {{ opacity: 0.85; }}
-        """
-        self.setStyleSheet(sheet)
+        # Theme for the current palette, compiled once and shared with any other window using it
+        apply_stylesheet(self, _stylesheet, self.current_colors)
 
 
     def update_ui_colors(self):
         # Simplified: Most colors handled by stylesheet + object names
         self.greeting_label.setStyleSheet(f"color: {self.current_colors['text_secondary']};")
-        self.status_label.setStyleSheet(f"color: {self.current_colors['text_secondary']};") # Initial status color
         footer = self.findChild(QLabel, "FooterLabel")
         if footer:
             footer.setStyleSheet("color: #64748B;") # Standard footer color
@@ -1,15 +1,31 @@
 import sys
 import os
-import shutil
 from datetime import datetime
-import threading
 import time
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                            QPushButton, QLineEdit, QLabel, QProgressBar, QCheckBox, QGridLayout,
                            QDialog, QScrollArea, QFormLayout, QMessageBox, QFileDialog, QSizePolicy,
                            QFrame, QButtonGroup, QRadioButton)
 from PyQt6.QtGui import QPainter, QLinearGradient, QColor, QFont, QPalette, QGuiApplication, QIcon, QAction
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
+
+# Shared engine lives at the repository root, next to the suite folders
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+from organizer_core.categories import PERSONAL_FILE_CATEGORIES, PERSONAL_FOLDER_CATEGORIES
+from organizer_core.engine import OrganizerEngine
+from organizer_core.history import UndoHistory
+from organizer_core.folder_matcher import FolderCategoryMatcher
+from organizer_core.job import JobSpec
+from organizer_gui.clock import shared_clock
+from organizer_gui.preview import PlanPreview
+from organizer_gui.recovery import schedule_recovery
+from organizer_gui.rules import edit_rules, load_window_rules
+from organizer_gui.styles import apply_stylesheet, set_state
+from organizer_gui.undo import show_undo_failures, undo_job
+from organizer_gui.watch import keep_organized
+from organizer_gui.worker import start_worker
 
 # --- Constants for Styling ---
 # Purple Theme Colors (Ensure good contrast)
@@ -32,6 +48,281 @@ PURPLE_COLORS = {
 
 FONT_FAMILY = "Segoe UI"      # Consistent font
 
+def _stylesheet(colors):
+    """Build the window stylesheet for a palette (compiled once per palette, see organizer_gui.styles)."""
+    return f"""
+    /* Main Window */
+    QMainWindow {{
+        background-color: {colors['background']};
+        color: {colors['text_primary']};
+        font-family: '{FONT_FAMILY}';
+    }}
+    
+    /* Central Widget */
+        QWidget {{
+        background-color: {colors['background']};
+        color: {colors['text_primary']};
+            font-family: '{FONT_FAMILY}';
+        }}
+    
+    /* Labels */
+        QLabel {{
+        color: {colors['text_primary']};
+            background-color: transparent;
+    }}
+    
+    QLabel#TimeLabel {{
+        color: {colors['primary']};
+        font-weight: bold;
+    }}
+    
+    QLabel#GreetingLabel {{
+        color: {colors['text_secondary']};
+    }}
+    
+    QLabel#app_title {{
+        color: {colors['text_primary']};
+        font-weight: bold;
+    }}
+    
+    QLabel#StatusLabel {{
+        color: {colors['text_primary']};
+        padding: 5px;
+    }}
+
+    QLabel#StatusLabel[level="success"] {{ color: {colors['success']}; }}
+    QLabel#StatusLabel[level="warning"] {{ color: {colors['warning']}; }}
+    QLabel#StatusLabel[level="error"] {{ color: {colors['danger']}; }}
+    
+    QLabel#FooterLabel {{
+        color: {colors['text_secondary']};
+    }}
+    
+    /* Line Edits */
+        QLineEdit {{
+        background-color: {colors['input_bg']};
+        border: 2px solid {colors['border']};
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: {colors['text_primary']};
+        font-size: 11px;
+    }}
+    
+        QLineEdit:focus {{
+        border-color: {colors['primary']};
+        background-color: {colors['secondary_bg']};
+        }}
+
+    QLineEdit::placeholder {{
+        color: {colors['text_secondary']};
+    }}
+    
+    /* Buttons */
+        QPushButton {{
+            border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: bold;
+        font-size: 11px;
+        min-height: 20px;
+    }}
+    
+    QPushButton#PrimaryButton {{
+        background-color: {colors['primary']};
+        color: {colors['text_primary']};
+    }}
+    
+    QPushButton#PrimaryButton:hover {{
+        background-color: {colors['accent']};
+    }}
+    
+    QPushButton#PrimaryButton:pressed {{
+        background-color: {colors['secondary']};
+    }}
+    
+    QPushButton#SecondaryButton {{
+        background-color: {colors['secondary']};
+        color: {colors['text_primary']};
+    }}
+    
+    QPushButton#SecondaryButton:hover {{
+        background-color: {colors['primary']};
+    }}
+    
+    QPushButton#SecondaryButton:pressed {{
+        background-color: {colors['border']};
+    }}
+    
+    QPushButton#AccentButton {{
+        background-color: {colors['accent']};
+        color: {colors['text_primary']};
+    }}
+    
+    QPushButton#AccentButton:hover {{
+        background-color: {colors['primary']};
+    }}
+    
+    QPushButton#AccentButton:pressed {{
+        background-color: {colors['secondary']};
+    }}
+
+        QPushButton#TextButton {{
+             background-color: transparent;
+        color: {colors['accent']};
+             text-decoration: underline;
+        padding: 5px 10px;
+         }}
+    
+         QPushButton#TextButton:hover {{
+        color: {colors['primary']};
+    }}
+    
+    QPushButton#DangerButton, QPushButton#PrimaryButton[danger="true"] {{
+        background-color: {colors['danger']};
+        color: {colors['text_primary']};
+    }}
+    
+    QPushButton#DangerButton:hover, QPushButton#PrimaryButton[danger="true"]:hover {{
+        background-color: #D32F2F;
+    }}
+    
+    QPushButton:disabled {{
+        background-color: {colors['border']};
+        color: {colors['text_secondary']};
+    }}
+    
+    /* Checkboxes */
+        QCheckBox {{
+        color: {colors['text_primary']};
+            spacing: 8px;
+        font-size: 11px;
+        }}
+    
+        QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+            border-radius: 3px;
+        border: 2px solid {colors['border']};
+        }}
+    
+    QCheckBox::indicator:unchecked {{
+        background-color: {colors['input_bg']};
+        }}
+    
+        QCheckBox::indicator:checked {{
+        background-color: {colors['primary']};
+        border-color: {colors['primary']};
+    }}
+    
+    QCheckBox::indicator:hover {{
+        border-color: {colors['accent']};
+    }}
+    
+    /* Radio Buttons */
+    QRadioButton {{
+        color: {colors['text_primary']};
+        spacing: 8px;
+        font-size: 11px;
+    }}
+    
+    QRadioButton::indicator {{
+        width: 18px;
+        height: 18px;
+        border-radius: 9px;
+        border: 2px solid {colors['border']};
+    }}
+    
+    QRadioButton::indicator:unchecked {{
+        background-color: {colors['input_bg']};
+    }}
+    
+    QRadioButton::indicator:checked {{
+        background-color: {colors['primary']};
+        border-color: {colors['primary']};
+    }}
+    
+    QRadioButton::indicator:hover {{
+        border-color: {colors['accent']};
+    }}
+    
+    /* Progress Bar */
+    QProgressBar {{
+        border: 2px solid {colors['border']};
+        border-radius: 8px;
+        background-color: {colors['progress_bar_bg']};
+        text-align: center;
+        height: 25px;
+    }}
+    
+    QProgressBar::chunk {{
+        background-color: {colors['progress_bar_chunk']};
+        border-radius: 6px;
+    }}
+    
+    /* Scroll Areas */
+    QScrollArea {{
+        border: 1px solid {colors['border']};
+        border-radius: 8px;
+        background-color: {colors['secondary_bg']};
+    }}
+    
+    QScrollArea#CheckboxScrollArea {{
+        background-color: transparent;
+        border: 1px solid {colors['border']};
+    }}
+    
+    QWidget#CheckboxWidget {{
+        background-color: transparent;
+    }}
+    
+    /* Scroll Bars */
+        QScrollBar:vertical {{
+        background-color: {colors['secondary_bg']};
+        width: 12px;
+        border-radius: 6px;
+    }}
+    
+        QScrollBar::handle:vertical {{
+        background-color: {colors['accent']};
+        border-radius: 6px;
+        min-height: 20px;
+    }}
+    
+    QScrollBar::handle:vertical:hover {{
+        background-color: {colors['primary']};
+    }}
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    
+    /* Frames and Dividers */
+        QFrame#divider {{
+        color: {colors['border']};
+        background-color: {colors['border']};
+    }}
+    
+    /* Message Boxes */
+    QMessageBox {{
+        background-color: {colors['background']};
+        color: {colors['text_primary']};
+    }}
+    
+        QMessageBox QPushButton {{
+        background-color: {colors['primary']};
+        color: {colors['text_primary']};
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+             min-width: 80px;
+    }}
+    
+    QMessageBox QPushButton:hover {{
+        background-color: {colors['accent']};
+    }}
+    """
+
+
 class PersonalOrganizerApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -40,45 +331,26 @@ class PersonalOrganizerApp(QMainWindow):
         # --- Use the single Purple Theme ---
         self.current_colors = PURPLE_COLORS
 
-        # --- File Categories ---
-        self.file_categories = {
-             "Videos": [".mp4", ".avi", ".mov", ".wmv", ".mkv", ".flv", ".webm", ".m4v", ".mpeg", ".mpg", ".3gp"],
-            "Audio": [".wav", ".mp3", ".ogg", ".flac", ".aac", ".m4a", ".aiff", ".wma"],
-            "Images": [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif", ".webp", ".svg", ".heif", ".heic", ".raw", ".psd", ".ai"],
-            "Archives": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tar.gz", ".tar.bz2", ".tar.xz", ".cab", ".iso", ".dmg"],
-            "Fonts": [".ttf", ".otf", ".woff", ".woff2"],
-            "Scripts & Code": [".jsx", ".py", ".lua", ".xml", ".js", ".html", ".css", ".java", ".cpp", ".c", ".cs", ".sh", ".bat"],
-            "Documents": [".doc", ".docx", ".pdf", ".txt", ".rtf", ".odt", ".xls", ".xlsx", ".ppt", ".pptx", ".csv", ".md"],
-            "Ebooks": [".epub", ".mobi", ".azw", ".azw3"],
-            "Executables & Installers": [".exe", ".msi", ".dmg", ".pkg", ".deb", ".rpm", ".app"],
-            "Logs & Data": [".log", ".csv", ".json", ".yaml", ".yml", ".xml"],
-            "Configuration": [".ini", ".cfg", ".conf", ".plist"],
-            "Other": []
-        }
-        
-        # Folder categories based on common naming patterns
-        self.folder_categories = {
-            "Project Folders": ["project", "projects", "work", "workspace", "development", "dev", "code"],
-            "Media Folders": ["videos", "movies", "music", "audio", "photos", "pictures", "images", "media"],
-            "Document Folders": ["documents", "docs", "papers", "reports", "files"],
-            "Download Folders": ["downloads", "download", "temp", "temporary"],
-            "Archive Folders": ["archive", "archives", "backup", "backups", "old"],
-            "System Folders": ["system", "config", "configuration", "settings", "program files", "applications"],
-            "Personal Folders": ["personal", "private", "my", "desktop", "home"],
-            "Other Folders": []
-        }
-
-        self.file_categories = dict(sorted(self.file_categories.items()))
-        self.folder_categories = dict(sorted(self.folder_categories.items()))
-        
+        # --- File and Folder Categories (shared with the headless engine) ---
+        self.file_categories = dict(PERSONAL_FILE_CATEGORIES)
+        self.folder_categories = dict(PERSONAL_FOLDER_CATEGORIES)
+
         self.custom_folder_names = {k: k for k in self.file_categories.keys()}
         self.custom_folder_names.update({k: k for k in self.folder_categories.keys()})
 
+        # Keyword automaton for folder names, compiled once
+        self.folder_matcher = FolderCategoryMatcher(self.folder_categories)
+
         # --- Enhanced State ---
         self.unavailable_file_types = set()
         self.uncategorized_folders = set()
         self.is_organizing = False
-        self.undo_stack = []
+        self.organize_thread = None
+        self.organize_worker = None
+        self.undo_thread = None
+        self.undo_worker = None
+        self.history = UndoHistory("personal")  # Undo history, kept on disk across restarts
+        self.plan_preview = PlanPreview(self, self._job_spec, self._plan_ready, self.update_status)
         self.organize_mode = "both"  # "files", "folders", or "both"
 
         # --- Window Size ---
@@ -90,6 +362,7 @@ class PersonalOrganizerApp(QMainWindow):
 
         self.setup_ui()
         self.update_stylesheet()
+        self.rules = load_window_rules(self, "personal")  # Checked before the categories (Rules button)
 
     def setup_ui(self):
         central_widget = QWidget(self)
@@ -154,6 +427,7 @@ class PersonalOrganizerApp(QMainWindow):
         source_layout.addWidget(source_label)
         self.source_entry = QLineEdit()
         self.source_entry.setPlaceholderText("Where are the files and folders you want to organize?")
+        self.source_entry.textChanged.connect(lambda _text: self.plan_preview.forget())
         source_layout.addWidget(self.source_entry)
         source_btn = QPushButton("Browse")
         source_btn.setObjectName("AccentButton")
@@ -172,6 +446,7 @@ class PersonalOrganizerApp(QMainWindow):
         dest_layout.addWidget(dest_label)
         self.dest_entry = QLineEdit()
         self.dest_entry.setPlaceholderText("Where do you want to save the organized files and folders?")
+        self.dest_entry.textChanged.connect(lambda _text: self.plan_preview.forget())
         dest_layout.addWidget(self.dest_entry)
         dest_btn = QPushButton("Browse")
         dest_btn.setObjectName("AccentButton")
@@ -256,6 +531,7 @@ class PersonalOrganizerApp(QMainWindow):
         for i, file_type in enumerate(self.file_types):
             checkbox = QCheckBox(file_type)
             checkbox.setChecked(True)
+            checkbox.toggled.connect(lambda _checked: self.plan_preview.selection_changed())
             self.file_check_vars[file_type] = checkbox
             file_checkbox_layout.addWidget(checkbox, i // num_cols, i % num_cols)
         
@@ -274,6 +550,11 @@ class PersonalOrganizerApp(QMainWindow):
         self.folder_type_label.setFont(QFont(FONT_FAMILY, 10, QFont.Weight.Bold))
         folder_type_header_layout.addWidget(self.folder_type_label)
         folder_type_header_layout.addStretch()
+
+        self.whole_word_check = QCheckBox("Whole words only")
+        self.whole_word_check.setToolTip("Match keywords as whole words, so 'my' no longer matches 'dummy'")
+        self.whole_word_check.toggled.connect(lambda _checked: self.plan_preview.selection_changed())
+        folder_type_header_layout.addWidget(self.whole_word_check)
         
         self.folder_select_all_btn = QPushButton("Select All")
         self.folder_select_all_btn.setObjectName("TextButton")
@@ -307,6 +588,7 @@ class PersonalOrganizerApp(QMainWindow):
         for i, folder_type in enumerate(self.folder_types):
             checkbox = QCheckBox(folder_type)
             checkbox.setChecked(True)
+            checkbox.toggled.connect(lambda _checked: self.plan_preview.selection_changed())
             self.folder_check_vars[folder_type] = checkbox
             folder_checkbox_layout.addWidget(checkbox, i // num_cols, i % num_cols)
         
@@ -356,7 +638,7 @@ class PersonalOrganizerApp(QMainWindow):
         self.undo_btn.setObjectName("SecondaryButton")
         self.undo_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.undo_btn.clicked.connect(self.undo_last_action)
-        self.undo_btn.setEnabled(False)
+        self.undo_btn.setEnabled(self.history.latest() is not None)  # Runs from earlier sessions can be undone too
         action_button_layout.addWidget(self.undo_btn)
         
         self.custom_folder_btn = QPushButton("Customize Folder Names")
@@ -364,6 +646,13 @@ class PersonalOrganizerApp(QMainWindow):
         self.custom_folder_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.custom_folder_btn.clicked.connect(self.open_custom_style_dialog)
         action_button_layout.addWidget(self.custom_folder_btn)
+
+        self.rules_btn = QPushButton("Rules")
+        self.rules_btn.setObjectName("SecondaryButton")
+        self.rules_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.rules_btn.setToolTip("Send items to a folder by size, age, name pattern or path")
+        self.rules_btn.clicked.connect(self.open_rules_dialog)
+        action_button_layout.addWidget(self.rules_btn)
         
         # Add About button
         about_btn = QPushButton("About")
@@ -373,6 +662,16 @@ class PersonalOrganizerApp(QMainWindow):
         action_button_layout.addWidget(about_btn)
         
         action_button_layout.addStretch(1)
+        self.watch_check = QCheckBox("Keep this folder organized")
+        self.watch_check.setToolTip("After organizing, keep watching the source folder and sort new items as they arrive.")
+        self.watch_check.setCursor(Qt.CursorShape.PointingHandCursor)
+        action_button_layout.addWidget(self.watch_check)
+        self.preview_btn = QPushButton("Preview")
+        self.preview_btn.setObjectName("SecondaryButton")
+        self.preview_btn.setToolTip("Show what would be moved where, without moving anything.")
+        self.preview_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.preview_btn.clicked.connect(self.preview_plan)
+        action_button_layout.addWidget(self.preview_btn)
         self.organize_btn = QPushButton("Start Organizing")
         self.organize_btn.setObjectName("PrimaryButton")
         self.organize_btn.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold))
@@ -381,10 +680,11 @@ class PersonalOrganizerApp(QMainWindow):
         action_button_layout.addWidget(self.organize_btn)
         main_layout.addWidget(action_button_widget)
 
-        # --- Timer for Time/Greeting Update ---
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_time_and_greeting)
-        self.update_timer.start(1000)
+        # --- Time/Greeting Update (shared clock; ticks only while this window is visible) ---
+        shared_clock().subscribe(self, self.update_time_and_greeting)
+
+        # --- Offer to recover runs a crash left half done ---
+        schedule_recovery(self, "personal")
 
         # --- Apply initial colors ---
         self.update_ui_colors()
@@ -413,6 +713,7 @@ class PersonalOrganizerApp(QMainWindow):
             self.organize_mode = "both"
             self.file_type_widget.setVisible(True)
             self.folder_type_widget.setVisible(True)
+        self.plan_preview.selection_changed()
 
     def toggle_file_checkboxes(self, state):
         for checkbox in self.file_check_vars.values():
@@ -432,135 +733,82 @@ class PersonalOrganizerApp(QMainWindow):
         if folder:
             self.dest_entry.setText(folder)
 
-    def categorize_folder(self, folder_name):
-        """Categorize folder based on name patterns."""
-        folder_lower = folder_name.lower()
-        for category, keywords in self.folder_categories.items():
-            if category == "Other Folders":
-                continue
-            for keyword in keywords:
-                if keyword in folder_lower:
-                    return category
-        return "Other Folders"
-
-    def organize_files(self):
-        """Organize files and/or folders in the background thread."""
+    def categorize_folder(self, folder_name, matcher=None):
+        """Categorize folder based on name patterns (first matching category wins)."""
+        return (matcher or self.folder_matcher).categorize(folder_name)
+
+    def _job_spec(self):
+        """Snapshot the current selections as a JobSpec (built on the GUI thread)."""
+        file_types = [ft for ft in self.file_categories if self.file_check_vars[ft].isChecked()]
+        folder_types = [ft for ft in self.folder_categories if self.folder_check_vars[ft].isChecked()]
+        return JobSpec.create(
+            "personal", self.source_entry.text(), self.dest_entry.text(),
+            file_types=file_types if self.organize_mode in ["files", "both"] else [],
+            folder_types=folder_types if self.organize_mode in ["folders", "both"] else [],
+            mode=self.organize_mode,
+            folder_names=self.custom_folder_names,
+            whole_word=self.whole_word_check.isChecked(),
+            rules=self.rules)
+
+    def organize_files(self, worker, spec, plan=None, watch=False):
+        """Organize files and/or folders on the worker thread, reporting back through its signals.
+
+        plan is the previewed MovePlan for spec, if any: its moves are carried out as shown.
+        watch keeps sorting new items afterwards, until cancelled. Returns the
+        (extensions, folder names) left in place, for _organize_finished to
+        show; no widget or window state is touched from this thread.
+        """
         try:
-            if not self.source_entry.text() or not self.dest_entry.text():
-                QTimer.singleShot(0, lambda: self.update_status("Please select both source and destination folders.", "warning"))
-            QTimer.singleShot(0, self.reset_ui_state)
-            return
-
-            source_dir = self.source_entry.text()
-            dest_dir = self.dest_entry.text()
+            source_dir = spec.sources[0]
+            dest_dir = spec.destination
+            if not source_dir or not dest_dir:
+                worker.report_status("Please select both source and destination folders.", "warning")
+                return
 
             if not os.path.exists(source_dir):
-                QTimer.singleShot(0, lambda: self.update_status("Source directory does not exist.", "error"))
-            QTimer.singleShot(0, self.reset_ui_state)
-            return
+                worker.report_status("Source directory does not exist.", "error")
+                return
 
             if not os.path.exists(dest_dir):
                 try:
                     os.makedirs(dest_dir)
                 except Exception as e:
-                    QTimer.singleShot(0, lambda: self.update_status(f"Error creating destination directory: {str(e)}", "error"))
-                QTimer.singleShot(0, self.reset_ui_state)
-                return
-
-            # Clear undo stack when starting new organization
-            QTimer.singleShot(0, self._clear_undo_stack)
+                    worker.report_status(f"Error creating destination directory: {str(e)}", "error")
+                    return
 
-            # Get selected types based on mode
-            organize_files = self.organize_mode in ["files", "both"]
-            organize_folders = self.organize_mode in ["folders", "both"]
-
-            selected_file_types = []
-            selected_folder_types = []
-
-            if organize_files:
-                selected_file_types = [ft for ft in self.file_categories.keys() if self.file_check_vars[ft].isChecked()]
-            
-            if organize_folders:
-                selected_folder_types = [ft for ft in self.folder_categories.keys() if self.folder_check_vars[ft].isChecked()]
-
-            if not selected_file_types and not selected_folder_types:
-                QTimer.singleShot(0, lambda: self.update_status("Please select at least one type to organize.", "warning"))
-                QTimer.singleShot(0, self.reset_ui_state)
+            engine = OrganizerEngine(spec)
+            if not engine.has_work():
+                worker.report_status("Please select at least one type (or add a rule) to organize.", "warning")
                 return
 
-            # Create a dictionary to store movements for undo
-            file_movements = {}
-
-            # Get total items for progress calculation
-            items = os.listdir(source_dir)
-            total_items = len(items)
-            processed_items = 0
-
-            # Process each item
-            for item_name in items:
-                if not self.is_organizing:  # Check if organization was cancelled
-                     break
-
-                item_path = os.path.join(source_dir, item_name)
-                
-                if os.path.isfile(item_path) and organize_files:
-                    # Process file
-                    file_ext = os.path.splitext(item_name)[1].lower()
-                    moved = False
-
-                    for category in selected_file_types:
-                        if file_ext in self.file_categories[category]:
-                            category_dir = os.path.join(dest_dir, self.custom_folder_names[category])
-                            if not os.path.exists(category_dir):
-                                os.makedirs(category_dir)
-
-                            dest_path = os.path.join(category_dir, item_name)
-                            file_movements[item_name] = {
-                                'source': item_path,
-                                'destination': dest_path,
-                                'category': category,
-                                'type': 'file'
-                            }
-
-                            shutil.move(item_path, dest_path)
-                            moved = True
-                            break
-
-                    if not moved:
-                        self.unavailable_file_types.add(file_ext)
-
-                elif os.path.isdir(item_path) and organize_folders:
-                    # Process folder
-                    folder_category = self.categorize_folder(item_name)
-                    
-                    if folder_category in selected_folder_types:
-                        category_dir = os.path.join(dest_dir, self.custom_folder_names[folder_category])
-                        if not os.path.exists(category_dir):
-                            os.makedirs(category_dir)
-
-                        dest_path = os.path.join(category_dir, item_name)
-                        file_movements[item_name] = {
-                            'source': item_path,
-                            'destination': dest_path,
-                            'category': folder_category,
-                            'type': 'folder'
-                        }
-
-                        shutil.move(item_path, dest_path)
-                else:
-                        self.uncategorized_folders.add(item_name)
-
-                processed_items += 1
-                progress = int((processed_items / total_items) * 100)
-                QTimer.singleShot(0, lambda p=progress: self._update_progress(p))
-
-            # Add the movements to undo stack if any items were moved
-            if file_movements:
-                QTimer.singleShot(0, lambda: self._add_to_undo_stack(file_movements))
-
-            if self.is_organizing:  # Only show success if not cancelled
-                files_organized = sum(1 for m in file_movements.values() if m['type'] == 'file')
-                folders_organized = sum(1 for m in file_movements.values() if m['type'] == 'folder')
+            def report(stats):
+                worker.report_progress(int(stats.fraction() * 100), stats.describe())
+                worker.report_counts(stats.categories)
+
+            def new_undo_step():
+                """Start a step of the undo history; return the on_moves callback that saves moved items to it."""
+                recorder = self.history.recorder(source_dir)
+
+                def record_moves(moves):
+                    recorder.add(moves)
+                    worker.movements.emit(len(moves))
+                return record_moves
+
+            # Stream scan -> classify -> plan -> move; leftovers of the last run with these settings are skipped
+            # Moves are saved to the undo history as they finish, so a run that fails part-way can still be undone
+            result = engine.organize(
+                source_dir,
+                should_continue=worker.should_continue,
+                on_progress=report,
+                progress_interval=worker.interval,
+                on_status=lambda message: worker.report_status(message, "info"),
+                plan=plan,
+                on_moves=new_undo_step())
+            skipped = (set(engine.unavailable_types), set(engine.uncategorized_folders))
+
+            if worker.should_continue():  # Only show success if not cancelled
+                folders_organized = result.stats.moved_folders
+                files_organized = result.stats.moved - folders_organized
                 
                 success_msg = f"Organization complete! "
                 if files_organized > 0:
@@ -569,15 +817,29 @@ class PersonalOrganizerApp(QMainWindow):
                     success_msg += f"{folders_organized} folder(s) "
                 success_msg += "organized successfully!"
                 
-                QTimer.singleShot(0, lambda: self.update_status(success_msg, "success"))
-                
-                if self.unavailable_file_types or self.uncategorized_folders:
-                    QTimer.singleShot(0, self.show_uncategorized_popup)
+                if result.errors:
+                    error_msg = f"{success_msg} {len(result.errors)} item(s) could not be moved: {result.errors[0][1]}"
+                    worker.report_status(error_msg, "warning")
+                else:
+                    worker.report_status(success_msg, "success")
+
+            # Keep this folder organized: sort new items as they arrive, until cancelled
+            if watch and worker.should_continue():
+                worker.items_skipped.emit(skipped)  # Shown now: the worker only finishes once watching stops
+                keep_organized(worker, engine, source_dir, new_undo_step)
+                return None
+            return skipped
 
         except Exception as e:
-            QTimer.singleShot(0, lambda: self.update_status(f"Error organizing items: {str(e)}", "error"))
-        finally:
-            QTimer.singleShot(0, self.reset_ui_state)
+            worker.report_status(f"Error organizing items: {str(e)}", "error")
+
+    def _items_skipped(self, skipped, show=True):
+        """Take in the (extensions, folder names) a run left in place (on the GUI thread) and tell the user."""
+        extensions, folders = skipped
+        self.unavailable_file_types.update(extensions)
+        self.uncategorized_folders.update(folders)
+        if show and (self.unavailable_file_types or self.uncategorized_folders):
+            self.show_uncategorized_popup()
 
     def show_uncategorized_popup(self):
         """Show popup for uncategorized files and folders."""
@@ -612,87 +874,146 @@ class PersonalOrganizerApp(QMainWindow):
         
         self.is_organizing = True
         self.organize_btn.setText("Cancel Organization")
-        self.organize_btn.setObjectName("DangerButton")
-        self.update_stylesheet()
+        set_state(self.organize_btn, "danger", True)
         self.progress_bar.setValue(0)
         self.update_status("Starting organization...", "info")
         
-        # Start organization in a separate thread
-        self.organize_thread = threading.Thread(target=self.organize_files)
-        self.organize_thread.daemon = True
+        # Run organization on a worker thread; its signals are queued back to this window
+        spec = self._job_spec()
+        plan = self.plan_preview.current(spec)  # A preview of exactly these settings runs without rescanning
+        self.plan_preview.forget()
+        watch = self.watch_check.isChecked()
+        self.organize_thread, worker = start_worker(lambda worker: self.organize_files(worker, spec, plan, watch))
+        self.organize_worker = worker
+        worker.progress.connect(self._update_progress)
+        worker.status.connect(self.update_status)
+        worker.counts.connect(self._update_counts)
+        worker.movements.connect(self._moves_recorded)
+        worker.items_skipped.connect(self._items_skipped)
+        worker.finished.connect(lambda: self._organize_finished(worker))
         self.organize_thread.start()
 
     def cancel_organizing(self):
         """Cancel the ongoing organization process."""
         self.is_organizing = False
+        if self.organize_worker is not None:
+            self.organize_worker.cancel()
         self.update_status("Organization cancelled by user.", "warning")
         self.reset_ui_state()
 
+    def _organize_finished(self, worker):
+        """Reset the UI once the current run's worker is done (a cancelled older run is ignored)."""
+        if worker is self.organize_worker:
+            self.organize_worker = None
+            self.reset_ui_state()
+            if worker.result is not None:
+                self._items_skipped(worker.result, show=worker.should_continue())
+
+    def _stop_worker(self):
+        """Cancel a running worker and wait for its thread, e.g. before the window closes."""
+        if self.organize_worker is not None:
+            self.organize_worker.cancel()
+        if self.undo_worker is not None:
+            self.undo_worker.cancel()
+        self.plan_preview.stop()
+        if self.organize_thread is not None:
+            self.organize_thread.wait()
+        if self.undo_thread is not None:
+            self.undo_thread.wait()
+
     def reset_ui_state(self):
         """Reset UI to initial state after organization."""
         self.is_organizing = False
         self.organize_btn.setText("Start Organizing")
-        self.organize_btn.setObjectName("PrimaryButton")
-        self.update_stylesheet()
+        set_state(self.organize_btn, "danger", False)
 
-    def _update_progress(self, value):
-        """Update progress bar (called from thread)."""
+    def _update_progress(self, value, detail=None):
+        """Update progress bar and per-stage throughput (called from thread)."""
         self.progress_bar.setValue(value)
+        if detail:
+            self.status_label.setText(detail)
 
-    def _add_to_undo_stack(self, movements):
-        """Add movements to undo stack (called from thread)."""
-        self.undo_stack.append(movements)
-        if len(self.undo_stack) > 10:  # Keep only last 10 operations
-            self.undo_stack.pop(0)
-        self.undo_btn.setEnabled(True)
+    def _update_counts(self, counts):
+        """Show items moved per category in the progress bar tooltip."""
+        self.progress_bar.setToolTip("\n".join(f"{category}: {count:,}" for category, count in sorted(counts.items())))
+
+    def preview_plan(self):
+        """Work out what organizing would do with the current selections, without moving anything."""
+        if self.is_organizing or self.undo_worker is not None:
+            self.update_status("Wait for the current run to finish before previewing.", "warning")
+            return
+        self.update_status("Previewing...", "info")
+        self.plan_preview.preview()
 
-    def _clear_undo_stack(self):
-        """Clear the undo stack (called from thread)."""
-        self.undo_stack.clear()
-        self.undo_btn.setEnabled(False)
+    def _plan_ready(self, plan):
+        """Show a preview's per-category counts and sizes in the progress bar tooltip."""
+        if plan is not None:
+            self.progress_bar.setToolTip(plan.breakdown())
+
+    def _moves_recorded(self, count):
+        """A run's moves were saved to the undo history (called from thread)."""
+        self.undo_btn.setEnabled(True)
 
     def undo_last_action(self):
-        """Undo the last organization action."""
-        if not self.undo_stack:
+        """Undo the most recent run in the history on a worker thread, or cancel the undo in progress."""
+        if self.undo_worker is not None:
+            self.undo_worker.cancel()
+            return
+        if self.is_organizing:
+            self.update_status("Wait for the current run to finish before undoing.", "warning")
+            return
+        run = self.history.latest()
+        if run is None:
             QMessageBox.information(self, "Undo", "No actions to undo.")
+            self.undo_btn.setEnabled(False)
             return
-        
-        last_movements = self.undo_stack.pop()
-        
-        try:
-            for item_name, movement_info in last_movements.items():
-                source_path = movement_info['source']
-                dest_path = movement_info['destination']
-                
-                if os.path.exists(dest_path):
-                    # Move back to original location
-                    shutil.move(dest_path, source_path)
-            
-            self.update_status(f"Undone: {len(last_movements)} items restored to original location.", "success")
-            
-            if not self.undo_stack:
-                self.undo_btn.setEnabled(False)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Undo Error", f"Error undoing action: {str(e)}")
+
+        self.undo_btn.setText("Cancel Undo")
+        self.organize_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.update_status(f"Undoing the last action ({run.items:,} items)...", "info")
+        self.undo_thread, worker = start_worker(undo_job(self.history, run))
+        self.undo_worker = worker
+        worker.progress.connect(self._update_progress)
+        worker.status.connect(self.update_status)
+        worker.finished.connect(lambda: self._undo_finished(worker))
+        self.undo_thread.start()
+
+    def _undo_finished(self, worker):
+        """Restore the buttons after an undo and list any items that could not be put back."""
+        self.undo_worker = None
+        self.undo_btn.setText("Undo Last Action")
+        self.undo_btn.setEnabled(self.history.latest() is not None)
+        self.organize_btn.setEnabled(True)
+        self.plan_preview.forget()  # Items are back in the source folder: a shown preview is out of date
+        show_undo_failures(self, worker.result)
+
+    def closeEvent(self, event):
+        """Stop a running organization before the window closes."""
+        self.is_organizing = False
+        self._stop_worker()
+        event.accept()
 
     def update_status(self, message, status_type="info"):
         """Update status label with colored message."""
         self.status_label.setText(message)
-        if status_type == "success":
-            self.status_label.setStyleSheet(f"color: {self.current_colors['success']};")
-        elif status_type == "warning":
-            self.status_label.setStyleSheet(f"color: {self.current_colors['warning']};")
-        elif status_type == "error":
-            self.status_label.setStyleSheet(f"color: {self.current_colors['danger']};")
-        else:
-            self.status_label.setStyleSheet(f"color: {self.current_colors['text_primary']};")
+        # The colour comes from the QLabel#StatusLabel[level=...] rules of the stylesheet
+        set_state(self.status_label, "level", status_type)
 
     def open_custom_style_dialog(self):
         """Open dialog to customize folder names."""
         dialog = CustomFolderDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.custom_folder_names = dialog.get_custom_names()
+            self.plan_preview.selection_changed()
+
+    def open_rules_dialog(self):
+        """Edit the rules checked before the categories (saved for the next session too)."""
+        rules = edit_rules(self, "personal", self.rules)
+        if rules is not None:
+            self.rules = rules
+            self.update_status(f"{len(rules)} rule(s) saved." if rules else "Rules cleared.", "info")
+            self.plan_preview.selection_changed()
 
     def show_about_dialog(self):
         """Show about dialog."""
@@ -733,278 +1054,8 @@ class PersonalOrganizerApp(QMainWindow):
         self.update_stylesheet()
 
     def update_stylesheet(self):
-        """Apply comprehensive stylesheet to the application."""
-        colors = self.current_colors
-        
-        stylesheet = f"""
-        /* Main Window */
-        QMainWindow {{
-            background-color: {colors['background']};
-            color: {colors['text_primary']};
-            font-family: '{FONT_FAMILY}';
-        }}
-        
-        /* Central Widget */
-            QWidget {{
-            background-color: {colors['background']};
-            color: {colors['text_primary']};
-                font-family: '{FONT_FAMILY}';
-            }}
-        
-        /* Labels */
-            QLabel {{
-            color: {colors['text_primary']};
-                background-color: transparent;
-        }}
-        
-        QLabel#TimeLabel {{
-            color: {colors['primary']};
-            font-weight: bold;
-        }}
-        
-        QLabel#GreetingLabel {{
-            color: {colors['text_secondary']};
-        }}
-        
-        QLabel#app_title {{
-            color: {colors['text_primary']};
-            font-weight: bold;
-        }}
-        
-        QLabel#StatusLabel {{
-            color: {colors['text_primary']};
-            padding: 5px;
-        }}
-        
-        QLabel#FooterLabel {{
-            color: {colors['text_secondary']};
-        }}
-        
-        /* Line Edits */
-            QLineEdit {{
-            background-color: {colors['input_bg']};
-            border: 2px solid {colors['border']};
-            border-radius: 8px;
-            padding: 8px 12px;
-            color: {colors['text_primary']};
-            font-size: 11px;
-        }}
-        
-            QLineEdit:focus {{
-            border-color: {colors['primary']};
-            background-color: {colors['secondary_bg']};
-            }}
-
-        QLineEdit::placeholder {{
-            color: {colors['text_secondary']};
-        }}
-        
-        /* Buttons */
-            QPushButton {{
-                border: none;
-            border-radius: 8px;
-            padding: 10px 20px;
-            font-weight: bold;
-            font-size: 11px;
-            min-height: 20px;
-        }}
-        
-        QPushButton#PrimaryButton {{
-            background-color: {colors['primary']};
-            color: {colors['text_primary']};
-        }}
-        
-        QPushButton#PrimaryButton:hover {{
-            background-color: {colors['accent']};
-        }}
-        
-        QPushButton#PrimaryButton:pressed {{
-            background-color: {colors['secondary']};
-        }}
-        
-        QPushButton#SecondaryButton {{
-            background-color: {colors['secondary']};
-            color: {colors['text_primary']};
-        }}
-        
-        QPushButton#SecondaryButton:hover {{
-            background-color: {colors['primary']};
-        }}
-        
-        QPushButton#SecondaryButton:pressed {{
-            background-color: {colors['border']};
-        }}
-        
-        QPushButton#AccentButton {{
-            background-color: {colors['accent']};
-            color: {colors['text_primary']};
-        }}
-        
-        QPushButton#AccentButton:hover {{
-            background-color: {colors['primary']};
-        }}
-        
-        QPushButton#AccentButton:pressed {{
-            background-color: {colors['secondary']};
-        }}
-
-            QPushButton#TextButton {{
-                 background-color: transparent;
-            color: {colors['accent']};
-                 text-decoration: underline;
-            padding: 5px 10px;
-             }}
-        
-             QPushButton#TextButton:hover {{
-            color: {colors['primary']};
-        }}
-        
-        QPushButton#DangerButton {{
-            background-color: {colors['danger']};
-            color: {colors['text_primary']};
-        }}
-        
-        QPushButton#DangerButton:hover {{
-            background-color: #D32F2F;
-        }}
-        
-        QPushButton:disabled {{
-            background-color: {colors['border']};
-            color: {colors['text_secondary']};
-        }}
-        
-        /* Checkboxes */
-            QCheckBox {{
-            color: {colors['text_primary']};
-                spacing: 8px;
-            font-size: 11px;
-            }}
-        
-            QCheckBox::indicator {{
-            width: 18px;
-            height: 18px;
-                border-radius: 3px;
-            border: 2px solid {colors['border']};
-            }}
-        
-        QCheckBox::indicator:unchecked {{
-            background-color: {colors['input_bg']};
-            }}
-        
-            QCheckBox::indicator:checked {{
-            background-color: {colors['primary']};
-            border-color: {colors['primary']};
-        }}
-        
-        QCheckBox::indicator:hover {{
-            border-color: {colors['accent']};
-        }}
-        
-        /* Radio Buttons */
-        QRadioButton {{
-            color: {colors['text_primary']};
-            spacing: 8px;
-            font-size: 11px;
-        }}
-        
-        QRadioButton::indicator {{
-            width: 18px;
-            height: 18px;
-            border-radius: 9px;
-            border: 2px solid {colors['border']};
-        }}
-        
-        QRadioButton::indicator:unchecked {{
-            background-color: {colors['input_bg']};
-        }}
-        
-        QRadioButton::indicator:checked {{
-            background-color: {colors['primary']};
-            border-color: {colors['primary']};
-        }}
-        
-        QRadioButton::indicator:hover {{
-            border-color: {colors['accent']};
-        }}
-        
-        /* Progress Bar */
-        QProgressBar {{
-            border: 2px solid {colors['border']};
-            border-radius: 8px;
-            background-color: {colors['progress_bar_bg']};
-            text-align: center;
-            height: 25px;
-        }}
-        
-        QProgressBar::chunk {{
-            background-color: {colors['progress_bar_chunk']};
-            border-radius: 6px;
-        }}
-        
-        /* Scroll Areas */
-        QScrollArea {{
-            border: 1px solid {colors['border']};
-            border-radius: 8px;
-            background-color: {colors['secondary_bg']};
-        }}
-        
-        QScrollArea#CheckboxScrollArea {{
-            background-color: transparent;
-            border: 1px solid {colors['border']};
-        }}
-        
-        QWidget#CheckboxWidget {{
-            background-color: transparent;
-        }}
-        
-        /* Scroll Bars */
-            QScrollBar:vertical {{
-            background-color: {colors['secondary_bg']};
-            width: 12px;
-            border-radius: 6px;
-        }}
-        
-            QScrollBar::handle:vertical {{
-            background-color: {colors['accent']};
-            border-radius: 6px;
-            min-height: 20px;
-        }}
-        
-        QScrollBar::handle:vertical:hover {{
-            background-color: {colors['primary']};
-        }}
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-            height: 0px;
-        }}
-        
-        /* Frames and Dividers */
-            QFrame#divider {{
-            color: {colors['border']};
-            background-color: {colors['border']};
-        }}
-        
-        /* Message Boxes */
-        QMessageBox {{
-            background-color: {colors['background']};
-            color: {colors['text_primary']};
-        }}
-        
-            QMessageBox QPushButton {{
-            background-color: {colors['primary']};
-            color: {colors['text_primary']};
-            border: none;
-            border-radius: 6px;
-            padding: 8px 16px;
-                 min-width: 80px;
-        }}
-        
-        QMessageBox QPushButton:hover {{
-            background-color: {colors['accent']};
-        }}
-        """
-        
-        self.setStyleSheet(stylesheet)
+        """Apply the theme stylesheet (compiled once per palette) to the application."""
+        apply_stylesheet(self, _stylesheet, self.current_colors)
 
 
 class CustomFolderDialog(QDialog):
@@ -3,14 +3,16 @@
 
 a = Analysis(
     ['PERSONAL_organizer.py'],
-    pathex=[],
+    pathex=['..'],
     binaries=[],
     datas=[],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Qt only: keep Tcl/Tk (_tcl_data, _tk_data, tcl86t/tk86t) out of the bundle
+    # NumPy is only used by batch classification (CLI --batch), never by the GUI
+    excludes=['tkinter', '_tkinter', 'numpy'],
     noarchive=False,
     optimize=0,
 )
@@ -1,17 +1,19 @@
 import sys
-import os
-import shutil
+import importlib
 from datetime import datetime
-import threading
-import time
-import tkinter as tk
-from tkinter import ttk
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLineEdit, QLabel, QProgressBar, QCheckBox, QGridLayout,
                              QDialog, QScrollArea, QFormLayout, QMessageBox, QFileDialog, QSizePolicy,
                              QTabWidget, QFrame)
 from PyQt6.QtGui import QPainter, QLinearGradient, QColor, QFont, QPalette, QGuiApplication, QIcon
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
+
+# (tab label, icon, module, class); each organizer module is imported when its tab is first shown
+ORGANIZER_TABS = [
+    ("Personal", "app_icons/icon_personal.png", "PersonalOrganizerBuild.PERSONAL_organizer", "PersonalOrganizerApp"),
+    ("Office", "app_icons/icon_office.png", "FILE_ORGANIZER_OFFICE_SUITE.OFFICE_organizer", "OfficeFileOrganizerApp"),
+    ("Media", "app_icons/icon-creators.png", "FILE_ORGANIZER_CREATORS_SUITE.media_organizer", "MediaOrganizerApp"),
+]
 
 class UnifiedOrganizerApp(QMainWindow):
     def __init__(self):
@@ -22,13 +24,6 @@ class UnifiedOrganizerApp(QMainWindow):
         screen = QGuiApplication.primaryScreen().availableGeometry()
         max_width, max_height = screen.width(), screen.height()
 
-
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure('TNotebook.Tab', padding=[20, 10], font=('Segoe UI', 10, 'bold'))
-        style.map('TNotebook.Tab', background=[('selected', '#ffffff')], foreground=[('selected', '#000000')])
-
-
         # Set reasonable default size
         self.setGeometry(100, 100, min(1000, max_width), min(650, max_height))
         self.setMinimumSize(800, 500)
@@ -93,33 +88,54 @@ class UnifiedOrganizerApp(QMainWindow):
             }
         """)
 
-        # Create and add tabs
-        from PersonalOrganizerBuild.PERSONAL_organizer import PersonalOrganizerApp
-        from FILE_ORGANIZER_OFFICE_SUITE.OFFICE_organizer import OfficeFileOrganizerApp
-        from FILE_ORGANIZER_CREATORS_SUITE.media_organizer import MediaOrganizerApp
+        # Tabs are built the first time they are shown; until then each holds an empty placeholder
+        self._tab_builders = {}
+        self._tabs = {}
+        for label, icon, module_name, class_name in ORGANIZER_TABS:
+            placeholder = self._add_placeholder_tab(label, icon)
+            self._tab_builders[placeholder] = lambda m=module_name, c=class_name: self._create_organizer(m, c)
+        help_placeholder = self._add_placeholder_tab("Help", "app_icons/icon_help.png")
+        self._tab_builders[help_placeholder] = self.create_help_tab
 
-        personal_tab = PersonalOrganizerApp()
-        office_tab = OfficeFileOrganizerApp()
-        media_tab = MediaOrganizerApp()
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self.tab_widget.currentIndex())
 
-        # Remove window decorations from tab widgets
-        for tab in [personal_tab, office_tab, media_tab]:
-            tab.setWindowFlags(Qt.WindowType.Widget)
+        main_layout.addWidget(self.tab_widget)
 
-        self.tab_widget.addTab(personal_tab, QIcon("app_icons/icon_personal.png"), "Personal")
-        self.tab_widget.addTab(office_tab, QIcon("app_icons/icon_office.png"), "Office")
-        self.tab_widget.addTab(media_tab, QIcon("app_icons/icon-creators.png"), "Media")
-        
-        # Add Help tab
-        help_tab = self.create_help_tab()
-        self.tab_widget.addTab(help_tab, QIcon("app_icons/icon_help.png"), "Help")
+    def _add_placeholder_tab(self, label, icon):
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.tab_widget.addTab(placeholder, QIcon(icon), label)
+        return placeholder
 
-        main_layout.addWidget(self.tab_widget)
+    def _create_organizer(self, module_name, class_name):
+        """Import an organizer module on first use and build its window as a tab page."""
+        module = importlib.import_module(module_name)
+        tab = getattr(module, class_name)()
+        # Remove window decorations from tab widgets
+        tab.setWindowFlags(Qt.WindowType.Widget)
+        return tab
+
+    def _ensure_tab(self, index):
+        """Build the tab at index if it is still a placeholder."""
+        placeholder = self.tab_widget.widget(index)
+        builder = self._tab_builders.pop(placeholder, None)
+        if builder is None:
+            return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            tab = builder()
+        finally:
+            QApplication.restoreOverrideCursor()
+        placeholder.layout().addWidget(tab)
+        tab.show()  # Children added to an already visible page aren't shown automatically
+        self._tabs[placeholder] = tab
 
-        # Timer for updating time
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_time)
-        self.update_timer.start(1000)
+    def built_tabs(self):
+        """The tab pages built so far, in tab order."""
+        return [self._tabs[self.tab_widget.widget(i)] for i in range(self.tab_widget.count())
+                if self.tab_widget.widget(i) in self._tabs]
 
     def create_help_tab(self):
         help_widget = QWidget()
@@ -292,12 +308,12 @@ class UnifiedOrganizerApp(QMainWindow):
         
         return help_widget
 
-    def update_time(self):
-        # Update time in all tabs
-        for i in range(self.tab_widget.count()):
-            tab = self.tab_widget.widget(i)
-            if hasattr(tab, 'update_time'):
-                tab.update_time()
+    def closeEvent(self, event):
+        # Let each tab's organizing thread stop before the window goes away
+        for tab in self.built_tabs():
+            if hasattr(tab, '_stop_worker'):
+                tab._stop_worker()
+        event.accept()
 
     def setup_menu(self):
         # Removing menu since we now have a Help tab
@@ -0,0 +1,209 @@
+"""Startup audit for the Unified app: unwanted imports, cold start, memory, bundle size.
+
+Starts the app in a fresh interpreter, stops at the first paint, and fails
+(exit code 1) when a toolkit the app doesn't use was imported or a budget
+below is exceeded. With --bundle it also checks what PyInstaller built (the
+one-file .exe, or an output folder): its size, that the spec excludes the
+unwanted modules, and that the build's Analysis TOC collected none of them.
+
+Usage: python benchmarks/audit_startup.py [--runs 3] [--bundle dist/UNIFIED_organizer.exe]
+(set QT_QPA_PLATFORM=offscreen to run it without a display)
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be loaded by the time the window first paints
+FORBIDDEN_MODULES = ("tkinter", "_tkinter", "PyQt5", "PySide2", "PySide6", "numpy", "PIL", "matplotlib",
+                     "PyQt6.QtNetwork", "PyQt6.QtWebEngineCore", "PyQt6.QtQml")
+# Files and folders that must not end up in the bundle
+FORBIDDEN_BUNDLE_ENTRIES = ("_tcl_data", "_tk_data", "tcl8", "_tkinter.pyd", "tcl86t.dll", "tk86t.dll", "numpy",
+                            "numpy.libs")
+# Modules the spec must exclude and the build must not collect (top-level package names)
+FORBIDDEN_BUNDLE_MODULES = ("tkinter", "_tkinter", "numpy")
+SPEC_PATH = os.path.join(REPO_ROOT, "unified_organizer.spec")
+
+# Budgets (median of --runs). Measured offscreen on Linux without cached bytecode:
+# first paint ~185 ms, peak RSS ~65 MB. The Windows bundle was 30.7 MB, 10.2 MB of it Tcl/Tk;
+# the budget applies to the one-file .exe, or to the whole output folder.
+FIRST_PAINT_BUDGET_MS = 350
+PEAK_RSS_BUDGET_MB = 100
+BUNDLE_BUDGET_MB = 22
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        import ctypes
+        from ctypes import wintypes
+
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                 ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / 2**20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def child():
+    start = time.perf_counter()
+    sys.path.insert(0, REPO_ROOT)
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    import UNIFIED_organizer
+
+    app = QApplication(sys.argv)
+    window = UNIFIED_organizer.UnifiedOrganizerApp()
+    result = {}
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and not result:
+                result["first_paint_ms"] = (time.perf_counter() - start) * 1000
+                result["peak_rss_mb"] = _peak_rss_mb()
+                result["forbidden"] = sorted(name for name in FORBIDDEN_MODULES if name in sys.modules)
+                result["modules"] = len(sys.modules)
+                app.quit()
+            return False
+
+    painter = FirstPaint()
+    window.tab_widget.currentWidget().installEventFilter(painter)
+    window.show()
+    QTimer.singleShot(10000, app.quit)  # Never hang if nothing paints
+    app.exec()
+    print(json.dumps(result))
+
+
+def bundle_report(path, toc_path):
+    """Size in MB of the bundle at path, and the forbidden entries it holds, by its listing and the build's TOC.
+
+    A one-file .exe can't be listed, so then only the Analysis TOC (if the
+    build left one at toc_path) shows what went in. Raises FileNotFoundError
+    if there is nothing at path.
+    """
+    found = set()
+    if os.path.isdir(path):
+        size = 0
+        for root, dirs, files in os.walk(path):
+            for name in dirs + files:
+                if name in FORBIDDEN_BUNDLE_ENTRIES:
+                    found.add(os.path.relpath(os.path.join(root, name), path))
+            for name in files:
+                size += os.path.getsize(os.path.join(root, name))
+    else:
+        size = os.path.getsize(path)
+    if toc_path and os.path.exists(toc_path):
+        found.update(toc_entries(toc_path))
+    return size / 2**20, sorted(found)
+
+
+def toc_entries(toc_path):
+    """The forbidden files and modules listed in a PyInstaller Analysis TOC (e.g. build/<spec>/Analysis-00.toc)."""
+    with open(toc_path, encoding="utf-8") as f:
+        data = ast.literal_eval(f.read())
+    found = set()
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple) and len(item) == 3 and all(isinstance(part, str) for part in item):
+            # (name in the bundle, source path, type code)
+            first = re.split(r"[\\/]", item[0])[0]
+            if first in FORBIDDEN_BUNDLE_ENTRIES or first.split(".")[0] in FORBIDDEN_BUNDLE_MODULES:
+                found.add(item[0])
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return found
+
+
+def spec_excludes(spec_path):
+    """The excludes list of the Analysis() call in a PyInstaller spec."""
+    with open(spec_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), spec_path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Analysis":
+            for keyword in node.keywords:
+                if keyword.arg == "excludes":
+                    return set(ast.literal_eval(keyword.value))
+    return set()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--bundle", metavar="PATH", help="PyInstaller output (.exe or folder) to check as well")
+    parser.add_argument("--spec", default=SPEC_PATH, help="spec the bundle was built from (default: %(default)s)")
+    parser.add_argument("--toc", metavar="FILE",
+                        help="the build's Analysis TOC (default: build/<spec name>/Analysis-00.toc)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return 0
+
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, __file__, "--child"], capture_output=True, text=True)
+        if out.returncode != 0 or not out.stdout.strip():
+            print(f"FAIL  the app did not start:\n{out.stderr}")
+            return 1
+        runs.append(json.loads(out.stdout))
+
+    failures = []
+    first_paint = statistics.median(run["first_paint_ms"] for run in runs)
+    peak_rss = statistics.median(run["peak_rss_mb"] for run in runs)
+    forbidden = sorted({name for run in runs for name in run["forbidden"]})
+    print(f"first paint   {first_paint:7.1f} ms   (budget {FIRST_PAINT_BUDGET_MS} ms)")
+    print(f"peak RSS      {peak_rss:7.1f} MB   (budget {PEAK_RSS_BUDGET_MB} MB)")
+    print(f"modules       {runs[0]['modules']:7d}")
+    if first_paint > FIRST_PAINT_BUDGET_MS:
+        failures.append("first paint over budget")
+    if peak_rss > PEAK_RSS_BUDGET_MB:
+        failures.append("peak RSS over budget")
+    if forbidden:
+        failures.append(f"unwanted modules imported at startup: {', '.join(forbidden)}")
+
+    if args.bundle:
+        toc = args.toc or os.path.join(os.path.dirname(os.path.abspath(args.spec)), "build",
+                                       os.path.splitext(os.path.basename(args.spec))[0], "Analysis-00.toc")
+        not_excluded = [name for name in FORBIDDEN_BUNDLE_MODULES if name not in spec_excludes(args.spec)]
+        if not_excluded:
+            failures.append(f"{os.path.basename(args.spec)} doesn't exclude {', '.join(not_excluded)}")
+        try:
+            size, found = bundle_report(args.bundle, toc)
+        except FileNotFoundError:
+            failures.append(f"no bundle at {args.bundle}")
+        else:
+            print(f"bundle        {size:7.1f} MB   (budget {BUNDLE_BUDGET_MB} MB)")
+            if not os.path.exists(toc):
+                print(f"no Analysis TOC at {toc}: contents checked through the spec's excludes only")
+            if size > BUNDLE_BUDGET_MB:
+                failures.append("bundle over budget")
+            if found:
+                failures.append(f"bundle contains Tcl/Tk or NumPy files: {', '.join(found)}")
+
+    for failure in failures:
+        print(f"FAIL  {failure}")
+    if not failures:
+        print("OK")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Benchmark: dry-run planning, first Preview (scan + plan) vs. re-planning from the kept scan.
+
+Creates --files empty files with a mix of extensions, previews an Office job
+over them, then re-plans with a category switched off, as happens when a
+checkbox is toggled while a preview is showing.
+
+Usage: python benchmarks/bench_plan.py [--files 200000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from organizer_core.engine import OrganizerEngine
+from organizer_core.job import JobSpec
+from organizer_core.plan import PlanSource
+
+EXTENSIONS = (".pdf", ".docx", ".xlsx", ".jpg", ".png", ".pptx", ".txt", ".zip", ".py", ".unknown")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = os.path.join(tmp, "source")
+        os.makedirs(source_dir)
+        for i in range(args.files):
+            open(os.path.join(source_dir, f"file_{i:07d}{EXTENSIONS[i % len(EXTENSIONS)]}"), "w").close()
+        dest_dir = os.path.join(tmp, "sorted")
+        spec = JobSpec.create("office", source_dir, dest_dir)
+
+        # First Preview: list the folder, then plan
+        source = PlanSource()
+        start = time.perf_counter()
+        plan = OrganizerEngine(spec).plan(source_dir, source)
+        first = time.perf_counter() - start
+
+        # Checkbox toggled: plan again from the kept scan, with 'Images' switched off
+        toggled = spec._replace(file_types=tuple(t for t in spec.file_types if t != "Images"))
+        start = time.perf_counter()
+        replan = OrganizerEngine(toggled).plan(source_dir, source)
+        again = time.perf_counter() - start
+
+    print(f"{args.files:,} entries")
+    print(f"first preview (scan + plan)   {first:8.2f}s   {args.files / first:12,.0f} entries/s"
+          f"   ({len(plan):,} to move)")
+    print(f"re-plan from the kept scan    {again:8.2f}s   {args.files / again:12,.0f} entries/s"
+          f"   ({len(replan):,} to move)")
+
+
+if __name__ == "__main__":
+    main()
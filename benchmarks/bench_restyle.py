@@ -0,0 +1,61 @@
+"""Benchmark: Start/Cancel restyle, whole-window setStyleSheet vs. dynamic property + polish.
+
+Builds the Personal window with extra category checkboxes and times flipping
+the organize button between Start and Cancel both ways.
+
+Usage: python benchmarks/bench_restyle.py [--checkboxes 500] [--toggles 50]
+(set QT_QPA_PLATFORM=offscreen to run it without a display)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt6.QtWidgets import QApplication, QCheckBox, QWidget
+
+from PersonalOrganizerBuild import PERSONAL_organizer
+from organizer_gui.styles import set_state
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--checkboxes", type=int, default=500)
+    parser.add_argument("--toggles", type=int, default=50)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    window = PERSONAL_organizer.PersonalOrganizerApp()
+    grid = window.findChild(QWidget, "CheckboxWidget").layout()
+    for i in range(args.checkboxes):
+        grid.addWidget(QCheckBox(f"Category {i}"), 100 + i // 2, i % 2)
+    window.show()
+    app.processEvents()
+    button = window.organize_btn
+    widgets = len(window.findChildren(QWidget))
+
+    # Before: rebuild the f-string and set it on the window, re-polishing every widget
+    start = time.perf_counter()
+    for i in range(args.toggles):
+        button.setObjectName("DangerButton" if i % 2 == 0 else "PrimaryButton")
+        window.setStyleSheet(PERSONAL_organizer._stylesheet(window.current_colors))
+    full = (time.perf_counter() - start) / args.toggles
+    button.setObjectName("PrimaryButton")
+    window.update_stylesheet()
+    app.processEvents()
+
+    # After: flip the dynamic property and re-polish the button only
+    start = time.perf_counter()
+    for i in range(args.toggles):
+        set_state(button, "danger", i % 2 == 0)
+    targeted = (time.perf_counter() - start) / args.toggles
+
+    print(f"{widgets} widgets in the window")
+    print(f"whole-window setStyleSheet   {full * 1e6:10.1f} us per toggle")
+    print(f"property + polish            {targeted * 1e6:10.1f} us per toggle")
+    print(f"speed-up: {full / targeted:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark: memory held for undo, per-file dicts in a list vs. the on-disk UndoHistory.
+
+Records N synthetic moves both ways and reports the Python memory still held
+afterwards, the time to record, and the peak memory while streaming the
+moves back for an undo.
+
+Usage: python benchmarks/bench_undo_history.py [--items 1000000] [--folders 200]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from organizer_core.history import UndoHistory
+from organizer_core.pipeline import MoveTask
+
+
+def synthetic_moves(count, folders):
+    for i in range(count):
+        name = f"IMG_{i:08d}.jpg"
+        source = os.path.join("/home/user/Pictures/Camera Uploads", f"album {i % folders}", name)
+        destination = os.path.join("/home/user/Sorted/Images", name)
+        yield MoveTask(name, source, destination, "Images", "file", 0, "rename", i)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000000)
+    parser.add_argument("--folders", type=int, default=200)
+    args = parser.parse_args()
+
+    # Before: {name: {'source', 'destination', 'category', 'type'}} kept in a list in the window
+    tracemalloc.start()
+    start = time.perf_counter()
+    undo_stack = [{task.name: {'source': task.source, 'destination': task.destination,
+                               'category': task.category, 'type': task.kind}
+                   for task in synthetic_moves(args.items, args.folders)}]
+    dict_time = time.perf_counter() - start
+    dict_held = tracemalloc.get_traced_memory()[0]
+    del undo_stack
+    tracemalloc.stop()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = UndoHistory("bench", db_path=os.path.join(tmp, "history.sqlite3"))
+        moves = list(synthetic_moves(args.items, args.folders))  # What a run hands over either way
+        tracemalloc.start()
+        start = time.perf_counter()
+        run = history.record("/home/user/Pictures/Camera Uploads", moves)
+        record_time = time.perf_counter() - start
+        history_held = tracemalloc.get_traced_memory()[0]
+        del moves
+        tracemalloc.stop()
+        db_size = os.path.getsize(history.db_path)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        streamed = sum(1 for move in history.moves(run.id) if move.destination)
+        read_time = time.perf_counter() - start
+        read_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    print(f"{args.items:,} moves from {args.folders} folders")
+    print(f"list of dicts      held {dict_held / 2**20:8.1f} MB   built in {dict_time:.2f}s")
+    print(f"UndoHistory        held {history_held / 2**20:8.1f} MB   recorded in {record_time:.2f}s"
+          f"   ({db_size / 2**20:.1f} MB on disk)")
+    print(f"streaming {streamed:,} back  peak {read_peak / 2**20:8.1f} MB   in {read_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark: Unified app cold start, lazy tabs vs. building every tab up front.
+
+Each run is a fresh interpreter that imports UNIFIED_organizer, creates the
+window, shows it and stops at the first paint. The "eager" mode also builds
+every tab before showing, which is what the app did before tabs became lazy.
+
+Usage: python benchmarks/bench_unified_startup.py [--runs 5]
+(set QT_QPA_PLATFORM=offscreen to run it without a display)
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(eager):
+    start = time.perf_counter()
+    sys.path.insert(0, REPO_ROOT)
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtWidgets import QApplication
+    import UNIFIED_organizer
+
+    app = QApplication(sys.argv)
+    window = UNIFIED_organizer.UnifiedOrganizerApp()
+    if eager:
+        for index in range(window.tab_widget.count()):
+            window._ensure_tab(index)
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                print(f"{time.perf_counter() - start:.4f} {len(window.built_tabs())} {len(sys.modules)}")
+                app.quit()
+            return False
+
+    painter = FirstPaint()
+    window.tab_widget.currentWidget().installEventFilter(painter)
+    window.show()
+    QTimer.singleShot(10000, app.quit)  # Never hang if nothing paints
+    app.exec()
+
+
+def measure(eager, runs):
+    results = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        out = subprocess.run([sys.executable, __file__, "--child", "eager" if eager else "lazy"],
+                             capture_output=True, text=True, check=True).stdout.split()
+        wall = time.perf_counter() - started
+        results.append((float(out[0]), wall, int(out[1]), int(out[2])))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=["lazy", "eager"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child == "eager")
+        return
+
+    timings = {}
+    for mode in ("eager", "lazy"):
+        results = measure(mode == "eager", args.runs)
+        first_paint = statistics.median(r[0] for r in results)
+        wall = statistics.median(r[1] for r in results)
+        timings[mode] = first_paint
+        print(f"{mode:<6} first paint {first_paint * 1000:7.1f} ms   process {wall * 1000:7.1f} ms   "
+              f"tabs built {results[0][2]}   modules {results[0][3]}")
+    print(f"speed-up: {timings['eager'] / timings['lazy']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,10 @@ echo Building Unified File Organizer...
 echo Step 1: Creating executable with PyInstaller...
 pyinstaller --clean --noconfirm unified_organizer.spec
 
+echo Checking startup imports, memory and bundle size...
+python benchmarks\audit_startup.py --bundle dist\UNIFIED_organizer.exe
+if errorlevel 1 exit /b 1
+
 echo Step 2: Preparing installer resources...
 copy app_icons\the_all_in_one.ico unified_installer.ico
 copy media_installer_welcome.bmp unified_installer_welcome.bmp
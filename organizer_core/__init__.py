@@ -0,0 +1,43 @@
+"""Shared, Qt-free organizing engine used by the Personal, Office and Media organizers.
+
+Names are imported from their submodules on first use, so that light entry
+points (python -m organizer_core --help) don't pay for the whole engine.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "BatchClassifier": "batch", "ScanColumns": "batch", "scan_columns": "batch",
+    "Destination": "classifier", "ExtensionClassifier": "classifier",
+    "CONFLICT_POLICIES": "collisions", "DestinationIndex": "collisions",
+    "CopyExecutor": "copier",
+    "JobReport": "engine", "OrganizerEngine": "engine", "SourceReport": "engine",
+    "CopyCancelled": "fastcopy", "copy_file": "fastcopy",
+    "FolderCategoryMatcher": "folder_matcher",
+    "HistoryRun": "history", "UndoHistory": "history", "UndoMove": "history",
+    "JobError": "job", "JobSpec": "job",
+    "InterruptedRun": "journal", "MoveJournal": "journal", "interrupted_runs": "journal",
+    "MODE_COPY": "mover", "MODE_RENAME": "mover", "MoveEngine": "mover", "describe_modes": "mover",
+    "MovePlan": "plan", "PlanError": "plan", "PlanSource": "plan", "load_plans": "plan", "plan_moves": "plan",
+    "save_plans": "plan",
+    "MoveTask": "pipeline", "OrganizePipeline": "pipeline", "PipelineResult": "pipeline",
+    "PipelineStats": "pipeline",
+    "ProgressTracker": "progress", "format_bytes": "progress", "format_duration": "progress",
+    "Rule": "rules", "RuleError": "rules", "RuleSet": "rules", "load_rules": "rules", "parse_rules": "rules",
+    "rules_path": "rules", "save_rules": "rules",
+    "ScanEntry": "scanner", "scan_directory": "scanner", "scan_files": "scanner", "scan_names": "scanner",
+    "SnapshotIndex": "snapshot", "snapshot_signature": "snapshot",
+    "UndoPipeline": "undo", "UndoResult": "undo", "UndoStats": "undo", "undo_run": "undo",
+    "FolderWatcher": "watcher", "WatchStopped": "watcher",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'organizer_core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"organizer_core.{module}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,5 @@
+import sys
+
+from organizer_core.cli import main
+
+sys.exit(main())
@@ -0,0 +1,27 @@
+"""Per-user data folder for the organizers' indexes and history."""
+
+import os
+import sys
+
+APP_DIR_NAME = "TheOrganizer"
+
+
+def app_data_dir(create=True):
+    """Return the folder where the organizers keep their data.
+
+    %APPDATA%\\TheOrganizer on Windows, ~/Library/Application Support/TheOrganizer
+    on macOS and $XDG_DATA_HOME/TheOrganizer (~/.local/share) elsewhere.
+    ORGANIZER_DATA_DIR overrides all of them.
+    """
+    path = os.environ.get("ORGANIZER_DATA_DIR")
+    if not path:
+        if sys.platform == "win32":
+            base = os.environ.get("APPDATA") or os.path.expanduser("~")
+        elif sys.platform == "darwin":
+            base = os.path.expanduser("~/Library/Application Support")
+        else:
+            base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        path = os.path.join(base, APP_DIR_NAME)
+    if create:
+        os.makedirs(path, exist_ok=True)
+    return path
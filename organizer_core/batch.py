@@ -0,0 +1,185 @@
+"""Vectorized classification for folders with millions of entries (optional: needs NumPy).
+
+The per-entry path calls the classifier once per scanned entry. Here the
+scan is recorded as columns instead (names, interned extension ids, kinds,
+sizes, mtimes), and every file's category is assigned at once: the extension
+ids index a small table built from the same file_categories, masked to
+regular files. Only names whose last extension ends a compound suffix such
+as '.tar.gz' are matched one by one. Nothing outside this module imports
+NumPy, and this module is only imported for batch runs.
+"""
+
+import os
+from array import array
+
+from organizer_core.fastcopy import is_partial
+from organizer_core.scanner import ScanEntry
+
+try:
+    import numpy
+except ImportError:  # Optional: without it the engine classifies entry by entry
+    numpy = None
+
+KIND_OTHER = 0
+KIND_FILE = 1
+KIND_DIR = 2
+
+CHECK_EVERY = 65536  # Entries scanned between should_continue() checks
+
+
+def extension_of(name):
+    """The lowercased last extension of name, as os.path.splitext gives it ('' for '.bashrc')."""
+    dot = name.rfind(".")
+    if dot <= 0 or (name[0] == "." and not name[:dot].lstrip(".")):
+        return ""
+    return name[dot:].lower()
+
+
+class ScanColumns:
+    """One listing of source_dir as columns.
+
+    names is a list; ext_ids, kinds, sizes and mtimes are NumPy arrays of the
+    same length. extensions lists the distinct extensions, indexed by ext_id.
+    """
+
+    __slots__ = ("source_dir", "names", "extensions", "ext_ids", "kinds", "sizes", "mtimes")
+
+    def __init__(self, source_dir, names, extensions, ext_ids, kinds, sizes, mtimes):
+        _require_numpy()
+        self.source_dir = source_dir
+        self.names = names
+        self.extensions = extensions
+        self.ext_ids = numpy.frombuffer(ext_ids, numpy.int32)
+        self.kinds = numpy.frombuffer(kinds, numpy.int8)
+        self.sizes = numpy.frombuffer(sizes, numpy.int64)
+        self.mtimes = numpy.frombuffer(mtimes, numpy.float64)
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_entries(cls, source_dir, entries):
+        """Columns for ScanEntries that are already in memory (e.g. for benchmarks)."""
+        builder = _ColumnBuilder()
+        for entry in entries:
+            kind = KIND_FILE if entry.is_file else KIND_DIR if entry.is_dir else KIND_OTHER
+            builder.add(entry.name, kind, entry.size, entry.mtime)
+        return builder.build(source_dir)
+
+    def entry(self, index):
+        """The ScanEntry of one row (inode and device are not recorded)."""
+        kind = self.kinds[index]
+        name = self.names[index]
+        return ScanEntry(name, os.path.join(self.source_dir, name), kind == KIND_FILE, kind == KIND_DIR,
+                         int(self.sizes[index]), float(self.mtimes[index]), 0, 0)
+
+
+class _ColumnBuilder:
+    __slots__ = ("names", "ext_index", "ext_ids", "kinds", "sizes", "mtimes")
+
+    def __init__(self):
+        self.names = []
+        self.ext_index = {}
+        self.ext_ids = array("i")
+        self.kinds = array("b")
+        self.sizes = array("q")
+        self.mtimes = array("d")
+
+    def add(self, name, kind, size, mtime):
+        ext_index = self.ext_index
+        self.names.append(name)
+        self.ext_ids.append(ext_index.setdefault(extension_of(name), len(ext_index)))
+        self.kinds.append(kind)
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+
+    def build(self, source_dir):
+        return ScanColumns(source_dir, self.names, list(self.ext_index), self.ext_ids, self.kinds,
+                           self.sizes, self.mtimes)
+
+
+def scan_columns(source_dir, with_stat=True, should_continue=None, reserved=()):
+    """List source_dir once (like scan_directory) into ScanColumns; None if cancelled part-way.
+
+    Names in reserved and copies still being written are left out, as the pipeline's scan does.
+    """
+    builder = _ColumnBuilder()
+    add = builder.add
+    count = 0
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            count += 1
+            if count % CHECK_EVERY == 0 and should_continue is not None and not should_continue():
+                return None
+            if entry.name in reserved or is_partial(entry.name):
+                continue
+            try:
+                kind = KIND_FILE if entry.is_file() else KIND_DIR if entry.is_dir() else KIND_OTHER
+            except OSError:
+                kind = KIND_OTHER
+            size = mtime = 0
+            if with_stat and kind != KIND_OTHER:
+                try:
+                    st = entry.stat()
+                    size = st.st_size if kind == KIND_FILE else 0
+                    mtime = st.st_mtime
+                except OSError:
+                    pass
+            add(entry.name, kind, size, mtime)
+    return builder.build(source_dir)
+
+
+class BatchClassifier:
+    """Applies an ExtensionClassifier to whole ScanColumns with array lookups.
+
+    classify(columns) returns one code per row: an index into destinations,
+    or -1 for entries left in place (non-files included). Overlaps are resolved
+    exactly as the per-entry classifier does, since the table is its own.
+    """
+
+    __slots__ = ("classifier", "destinations", "_codes", "_compound_tails")
+
+    def __init__(self, classifier):
+        _require_numpy()
+        self.classifier = classifier
+        codes = {}
+        for destination in classifier.table.values():
+            codes.setdefault(destination, len(codes))
+        self.destinations = tuple(codes)
+        self._codes = codes
+        # Last parts of compound suffixes ('.gz' of '.tar.gz'): rows ending in these need the full match
+        self._compound_tails = frozenset("." + suffix.rsplit(".", 1)[1]
+                                         for suffix in classifier.table if suffix.count(".") > 1)
+
+    def classify(self, columns):
+        by_extension = numpy.full(len(columns.extensions), -1, numpy.int32)
+        compound = numpy.zeros(len(columns.extensions), numpy.bool_)
+        table = self.classifier.table
+        for ext_id, ext in enumerate(columns.extensions):
+            destination = table.get(ext)
+            if destination is not None:
+                by_extension[ext_id] = self._codes[destination]
+            if ext in self._compound_tails:
+                compound[ext_id] = True
+
+        codes = by_extension[columns.ext_ids]
+        files = columns.kinds == KIND_FILE
+        codes[~files] = -1
+        if compound.any():
+            names = columns.names
+            match = self.classifier.index.match
+            lookup = self._codes.get
+            rows = numpy.flatnonzero(compound[columns.ext_ids] & files)
+            codes[rows] = [lookup(match(names[row])[1], -1) for row in rows.tolist()]
+        return codes
+
+    @staticmethod
+    def unmatched_extensions(columns, codes):
+        """The extensions of the files classify() left in place, for 'uncategorized' reports."""
+        ids = numpy.unique(columns.ext_ids[(codes < 0) & (columns.kinds == KIND_FILE)])
+        return {columns.extensions[ext_id] for ext_id in ids.tolist()}
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError("Batch classification needs NumPy (pip install numpy)")
@@ -0,0 +1,76 @@
+"""Category tables for the Personal, Office and Media organizers.
+
+Qt-free, so the headless engine and the CLI use the same tables as the apps.
+Each table is sorted by category name, which is also the display order and
+the order in which overlapping extensions are resolved (first selected wins).
+"""
+
+PERSONAL_FILE_CATEGORIES = dict(sorted({
+    "Videos": [".mp4", ".avi", ".mov", ".wmv", ".mkv", ".flv", ".webm", ".m4v", ".mpeg", ".mpg", ".3gp"],
+    "Audio": [".wav", ".mp3", ".ogg", ".flac", ".aac", ".m4a", ".aiff", ".wma"],
+    "Images": [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif", ".webp", ".svg", ".heif", ".heic", ".raw", ".psd", ".ai"],
+    "Archives": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tar.gz", ".tar.bz2", ".tar.xz", ".cab", ".iso", ".dmg"],
+    "Fonts": [".ttf", ".otf", ".woff", ".woff2"],
+    "Scripts & Code": [".jsx", ".py", ".lua", ".xml", ".js", ".html", ".css", ".java", ".cpp", ".c", ".cs", ".sh", ".bat"],
+    "Documents": [".doc", ".docx", ".pdf", ".txt", ".rtf", ".odt", ".xls", ".xlsx", ".ppt", ".pptx", ".csv", ".md"],
+    "Ebooks": [".epub", ".mobi", ".azw", ".azw3"],
+    "Executables & Installers": [".exe", ".msi", ".dmg", ".pkg", ".deb", ".rpm", ".app"],
+    "Logs & Data": [".log", ".csv", ".json", ".yaml", ".yml", ".xml"],
+    "Configuration": [".ini", ".cfg", ".conf", ".plist"],
+    "Other": []
+}.items()))
+
+# Folder categories based on common naming patterns
+PERSONAL_FOLDER_CATEGORIES = dict(sorted({
+    "Project Folders": ["project", "projects", "work", "workspace", "development", "dev", "code"],
+    "Media Folders": ["videos", "movies", "music", "audio", "photos", "pictures", "images", "media"],
+    "Document Folders": ["documents", "docs", "papers", "reports", "files"],
+    "Download Folders": ["downloads", "download", "temp", "temporary"],
+    "Archive Folders": ["archive", "archives", "backup", "backups", "old"],
+    "System Folders": ["system", "config", "configuration", "settings", "program files", "applications"],
+    "Personal Folders": ["personal", "private", "my", "desktop", "home"],
+    "Other Folders": []
+}.items()))
+
+OFFICE_FILE_CATEGORIES = dict(sorted({
+    "Documents": [".doc", ".docx", ".pdf", ".txt", ".rtf", ".odt", ".pages"],
+    "Spreadsheets": [".xls", ".xlsx", ".csv", ".ods", ".numbers"],
+    "Presentations": [".ppt", ".pptx", ".key", ".odp"],
+    "Images": [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif", ".webp", ".heic"],
+    "PDFs": [".pdf"], # Note: Overlaps with Documents, PDF will likely take precedence if listed first
+    "Email Files": [".eml", ".msg", ".vcf", ".ics"],
+    "Archives": [".zip", ".rar", ".7z", ".tar", ".gz"],
+    "Database Files": [".accdb", ".mdb", ".db", ".dbf", ".sql", ".sqlite"],
+    "Project Files": [".mpp", ".mpx", ".xer", ".planner", ".gan"],
+    "Text & Markdown": [".txt", ".md", ".markdown", ".rtf"], # Note: .txt, .rtf overlap with Documents
+    "Web Files": [".html", ".htm", ".css", ".js", ".json", ".xml"],
+    "Financial": [".qbw", ".qbb", ".tax", ".ifx", ".ofx"],
+    "Source Code": [".py", ".java", ".cpp", ".c", ".h", ".js", ".php", ".html", ".css", ".sql"] # Note: Overlaps Web Files
+    # Consider consolidating/refining categories to avoid significant overlap if needed
+}.items()))
+
+MEDIA_FILE_CATEGORIES = dict(sorted({
+    "Videos": [".mp4", ".avi", ".mov", ".wmv", ".mkv", ".flv", ".webm", ".m4v", ".mpeg", ".mpg", ".3gp"],
+    "Sound Effects": [".wav", ".mp3", ".ogg", ".flac", ".aac", ".m4a", ".aiff", ".wma"],
+    "Background Music": [".wav", ".mp3", ".ogg", ".flac", ".aac", ".m4a", ".aiff", ".wma"],
+    "Images": [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif", ".webp", ".svg", ".heif", ".heic", ".raw"],
+    "Overlays": [".mov", ".png", ".tiff", ".webm", ".avi", ".mkv"], # Note overlaps
+    "GIFs": [".gif", ".apng"], # Note overlaps
+    "Archives": [".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tar.gz", ".tar.bz2", ".tar.xz", ".cab", ".iso", ".dmg"],
+    "Project Files": [".prproj", ".fcpxml", ".veg", ".drp", ".sesx", ".als", ".cpr", ".blend", ".aep", ".c4d", ".ma", ".mb", ".max"],
+    "Vector & Design Files": [".ai", ".eps", ".psd", ".sketch", ".fig", ".indd", ".xd"],
+    "Subtitles & Captions": [".srt", ".vtt", ".ass", ".sub"],
+    "3D & Animation Files": [".obj", ".fbx", ".stl", ".gltf", ".glb", ".bvh"],
+    "Fonts & Text Styles": [".ttf", ".otf", ".woff", ".woff2"],
+    "Code & Scripts": [".jsx", ".py", ".lua", ".xml"]
+    # Consider adding an "Other" category if desired
+}.items()))
+
+# profile -> (file categories, folder categories)
+PROFILES = {
+    "personal": (PERSONAL_FILE_CATEGORIES, PERSONAL_FOLDER_CATEGORIES),
+    "office": (OFFICE_FILE_CATEGORIES, {}),
+    "media": (MEDIA_FILE_CATEGORIES, {}),
+}
+
+FOLDER_FALLBACK = "Other Folders"
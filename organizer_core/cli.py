@@ -0,0 +1,317 @@
+"""Command-line organizer for servers and cron: python -m organizer_core ...
+
+Runs the same engine as the Personal, Office and Media apps without importing
+PyQt6. Jobs come from the command line (one job, any number of sources) and/or
+from JSON job files; a JSON report of every run can be written with --report.
+Each source a run organizes is saved as a step of the profile's undo history,
+shared with the app: --undo (or the app's Undo button) puts the last one back.
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+from functools import partial
+
+from organizer_core.categories import PROFILES
+from organizer_core.collisions import CONFLICT_POLICIES
+from organizer_core.job import MODES, JobError, JobSpec
+
+EXIT_OK = 0
+EXIT_PROBLEMS = 1     # Some source was missing, or some item could not be moved
+EXIT_USAGE = 2
+EXIT_CANCELLED = 130
+
+DEFAULT_PROFILE = "personal"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m organizer_core",
+        description="Sort the files (and, for the personal profile, folders) of one or more "
+                    "source folders into category folders, without the GUI.")
+    parser.add_argument("sources", nargs="*", metavar="SOURCE", help="folder(s) to organize")
+    parser.add_argument("-d", "--dest", help="destination folder for the category folders")
+    parser.add_argument("-p", "--profile", choices=sorted(PROFILES),
+                        help="category set to use (default: personal)")
+    parser.add_argument("-t", "--types", help="comma-separated file categories (default: all)")
+    parser.add_argument("--folder-types", help="comma-separated folder categories (personal profile; default: all)")
+    parser.add_argument("-m", "--mode", choices=MODES, help="what to organize (default: both for personal, else files)")
+    parser.add_argument("-n", "--name", action="append", default=[], metavar="CATEGORY=FOLDER",
+                        help="custom destination folder name for a category (repeatable)")
+    parser.add_argument("--whole-word", action="store_true", help="folder keywords must match whole words")
+    parser.add_argument("--rules", metavar="FILE",
+                        help="JSON rules file (e.g. the one the apps save): items matching a rule go to its "
+                             "folder before the categories are looked at")
+    parser.add_argument("--on-conflict", choices=CONFLICT_POLICIES,
+                        help="when a category folder already has an item of the same name: rename (default; "
+                             "keep both as 'name (1).ext'), skip, replace-newer, or dedupe (leave identical files)")
+    parser.add_argument("--batch", action="store_true",
+                        help="classify each source folder as a whole with NumPy (for millions of entries)")
+    parser.add_argument("--full-scan", action="store_true",
+                        help="re-examine every entry, ignoring the index of earlier leftovers")
+    parser.add_argument("-j", "--job", action="append", default=[], metavar="FILE",
+                        help="JSON job file: one job object or a list of them (repeatable)")
+    parser.add_argument("--plan", metavar="FILE",
+                        help="dry run: work out every move and write the plan to FILE, moving nothing")
+    parser.add_argument("--execute", metavar="FILE",
+                        help="carry out a plan written by --plan, without scanning the sources again")
+    parser.add_argument("-r", "--report", metavar="FILE", help="write a JSON report to FILE ('-' for stdout)")
+    parser.add_argument("--list-categories", action="store_true", help="print the profile's categories and exit")
+    parser.add_argument("--undo", action="store_true",
+                        help="put back the items of the profile's last run, made here or in the app (default: personal)")
+    parser.add_argument("--recover", choices=("list", "rollback", "finish", "discard"),
+                        help="deal with runs that were interrupted by a crash (all profiles unless -p is given)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress or summary on stderr")
+    return parser
+
+
+def _split(value):
+    return None if value is None else [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _jobs_from_args(args, parser):
+    from organizer_core.rules import load_rules
+
+    jobs = []
+    for path in args.job:
+        jobs.extend(JobSpec.load(path))
+    if args.sources:
+        if not args.dest:
+            parser.error("--dest is required when sources are given on the command line")
+        names = {}
+        for item in args.name:
+            category, sep, folder = item.partition("=")
+            if not sep or not category or not folder:
+                parser.error(f"--name expects CATEGORY=FOLDER, got {item!r}")
+            names[category] = folder
+        jobs.append(JobSpec.create(args.profile or DEFAULT_PROFILE, tuple(args.sources), args.dest,
+                                   file_types=_split(args.types), folder_types=_split(args.folder_types),
+                                   mode=args.mode, folder_names=names, whole_word=args.whole_word,
+                                   incremental=not args.full_scan, on_conflict=args.on_conflict,
+                                   rules=load_rules(args.rules) if args.rules else None))
+    if not jobs:
+        parser.error("nothing to do: give SOURCE folders with --dest, or --job FILE")
+    return jobs
+
+
+def _progress_printer(stream):
+    if not stream.isatty():
+        return None
+
+    def show(stats):
+        stream.write("\r" + stats.describe()[:150].ljust(150))
+        stream.flush()
+    return show
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    err = sys.stderr
+
+    if args.list_categories:
+        file_categories, folder_categories = PROFILES[args.profile or DEFAULT_PROFILE]
+        for category, extensions in file_categories.items():
+            print(f"{category}: {' '.join(extensions)}")
+        for category, keywords in folder_categories.items():
+            print(f"[folder] {category}: {', '.join(keywords)}")
+        return EXIT_OK
+
+    if args.recover:
+        return _recover(args.recover, args.profile, err)
+    if args.undo:
+        return _undo(args.profile or DEFAULT_PROFILE, None if args.quiet else err)
+
+    try:
+        if args.execute:
+            jobs = _jobs_from_plan_file(args.execute)
+        else:
+            jobs = [(spec, None) for spec in _jobs_from_args(args, parser)]
+    except (JobError, ValueError) as e:
+        print(f"error: {e}", file=err)
+        return EXIT_USAGE
+
+    # Imported only now, so --help and bad arguments answer without loading the engine
+    from organizer_core.engine import OrganizerEngine
+    from organizer_core.history import UndoHistory
+
+    # Ctrl+C cancels like the GUI's Cancel button: running copies stop, the report is still written
+    cancelled = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: cancelled.set())
+
+    if args.plan:
+        return _write_plan(args.plan, [spec for spec, _ in jobs], lambda: not cancelled.is_set(),
+                           None if args.quiet else err)
+
+    progress = None if args.quiet else _progress_printer(err)
+    reports = []
+    code = EXIT_OK
+    for spec, plans in jobs:
+        if cancelled.is_set():
+            break
+        listed = {} if args.report else None
+        try:
+            engine = OrganizerEngine(spec, batch=args.batch)
+            report = engine.run(should_continue=lambda: not cancelled.is_set(), on_progress=progress, plans=plans,
+                                moves_sink=partial(_undo_step, UndoHistory(spec.profile), listed))
+        except JobError as e:
+            print(f"error: {e}", file=err)
+            code = EXIT_PROBLEMS
+            continue
+        if progress is not None:
+            err.write("\n")
+        if listed is not None:
+            for source in report.sources:
+                if source.result is not None:
+                    source.result.moves = listed.get(source.source, [])
+        reports.append(report)
+        if not report.ok:
+            code = EXIT_PROBLEMS
+        if not args.quiet:
+            _print_summary(report, err)
+    if cancelled.is_set():
+        print("cancelled", file=err)
+        code = EXIT_CANCELLED
+
+    if args.report:
+        data = json.dumps({"reports": [report.to_dict() for report in reports], "exit_code": code}, indent=2)
+        if args.report == "-":
+            print(data)
+        else:
+            with open(args.report, "w", encoding="utf-8") as f:
+                f.write(data + "\n")
+    return code
+
+
+def _undo_step(history, listed, source_dir):
+    """on_moves for one source: save its moves as one undo step, and keep them in listed for the report."""
+    recorder = history.recorder(source_dir)
+    if listed is None:
+        return recorder.add
+    moves = listed[source_dir] = []
+
+    def record_moves(tasks):
+        recorder.add(tasks)
+        moves.extend(tasks)
+    return record_moves
+
+
+def _undo(profile, stream):
+    """Put back the items of the profile's last run that is still in the undo history."""
+    from organizer_core.history import UndoHistory
+    from organizer_core.undo import undo_run
+
+    history = UndoHistory(profile)
+    run = history.latest()
+    if run is None:
+        print("nothing to undo", file=stream or sys.stderr)
+        return EXIT_OK
+    cancelled = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: cancelled.set())
+    result = undo_run(history, run, should_continue=lambda: not cancelled.is_set())
+    if stream is not None:
+        print(f"{run.source_dir}: {result.stats.describe()}", file=stream)
+        for move, problem in result.errors[:10]:
+            print(f"  {move.destination} -> {move.source}: {problem}", file=stream)
+    if result.cancelled:
+        return EXIT_CANCELLED
+    return EXIT_PROBLEMS if result.errors else EXIT_OK
+
+
+def _jobs_from_plan_file(path):
+    """(spec, {source: MovePlan}) per job of a plan file, each spec narrowed to its planned sources."""
+    from organizer_core.plan import load_plans
+
+    jobs = {}
+    for plan in load_plans(path):
+        jobs.setdefault(plan.spec, {})[plan.source_dir] = plan
+    return [(spec._replace(sources=tuple(plans)), plans) for spec, plans in jobs.items()]
+
+
+def _write_plan(path, jobs, should_continue, stream):
+    """Plan every source of jobs without moving anything and save the plans to path."""
+    from organizer_core.engine import OrganizerEngine
+    from organizer_core.plan import save_plans
+
+    plans = []
+    code = EXIT_OK
+    for spec in jobs:
+        engine = OrganizerEngine(spec)
+        for source_dir in spec.sources:
+            if not should_continue():
+                print("cancelled", file=stream or sys.stderr)
+                return EXIT_CANCELLED
+            if not os.path.isdir(source_dir):
+                print(f"{source_dir}: Source folder does not exist", file=stream or sys.stderr)
+                code = EXIT_PROBLEMS
+                continue
+            try:
+                plan = engine.plan(source_dir, should_continue=should_continue)
+            except OSError as e:
+                print(f"{source_dir}: {e}", file=stream or sys.stderr)
+                code = EXIT_PROBLEMS
+                continue
+            if plan is None:
+                continue
+            plans.append(plan)
+            if stream is not None:
+                print(f"{source_dir}: {plan.describe()}", file=stream)
+                if plan.categories:
+                    print("  " + plan.breakdown().replace("\n", "\n  "), file=stream)
+    try:
+        save_plans(path, plans)
+    except OSError as e:
+        print(f"error: can't write plan file {path}: {e}", file=stream or sys.stderr)
+        return EXIT_PROBLEMS
+    return code
+
+
+def _recover(action, profile, stream):
+    """List, roll back, finish or discard the runs a crash left unfinished."""
+    from organizer_core.journal import interrupted_runs
+
+    runs = interrupted_runs(profile)
+    if not runs:
+        print("no interrupted runs", file=stream)
+        return EXIT_OK
+    code = EXIT_OK
+    for run in runs:
+        print(f"[{run.profile}] {run.describe()}", file=stream)
+        if action == "list":
+            run.close()
+            continue
+        if action == "discard":
+            run.discard()
+            continue
+        count, problems = run.rollback() if action == "rollback" else run.finish()
+        verb = "restored" if action == "rollback" else "moved"
+        print(f"  {verb} {count:,}", file=stream)
+        for move, problem in problems:
+            print(f"  {move.source} -> {move.destination}: {problem}", file=stream)
+        if problems:
+            code = EXIT_PROBLEMS
+    return code
+
+
+def _print_summary(report, stream):
+    for source in report.sources:
+        if source.error:
+            print(f"{source.source}: {source.error}", file=stream)
+            continue
+        stats = source.result.stats
+        line = f"{source.source}: moved {stats.moved:,}, left {stats.unmatched + stats.unchanged + stats.skipped:,}"
+        if stats.renamed or stats.replaced or stats.skipped:
+            line += (f" (name conflicts: {stats.renamed:,} renamed, {stats.replaced:,} replaced,"
+                     f" {stats.skipped:,} left in place)")
+        if stats.failed:
+            line += f", failed {stats.failed:,} (first: {source.result.errors[0][1]})"
+        print(line + f" in {stats.elapsed:.2f}s", file=stream)
+    if report.unavailable_types:
+        print(f"uncategorized extensions: {', '.join(sorted(report.unavailable_types))}", file=stream)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Name conflicts in the destination folders, resolved in memory before anything moves.
+
+Each destination folder is listed once, the first time the planner sends an
+item there, into a set of case-folded names (so 'Photo.JPG' and 'photo.jpg'
+count as the same name, as they do on Windows and macOS). Names planned
+during the run are added to the set, so checking a target costs a set lookup
+and no stat. Only an actual conflict is looked at on disk, and only when the
+policy needs it (replace-newer and dedupe compare the two files).
+"""
+
+import filecmp
+import os
+import stat
+
+CONFLICT_RENAME = "rename"                # Keep both: the new item becomes 'name (1).ext'
+CONFLICT_SKIP = "skip"                    # Leave the new item in the source folder
+CONFLICT_REPLACE_NEWER = "replace-newer"  # Replace an older file of the same name; skip if not newer
+CONFLICT_DEDUPE = "dedupe"                # Leave the new file in place if identical; else keep both
+CONFLICT_POLICIES = (CONFLICT_RENAME, CONFLICT_SKIP, CONFLICT_REPLACE_NEWER, CONFLICT_DEDUPE)
+
+# What resolve() did about a conflict
+RESOLVED_RENAMED = "renamed"
+RESOLVED_REPLACED = "replaced"
+RESOLVED_SKIPPED = "skipped"
+RESOLVED_DUPLICATE = "duplicate"
+
+_PLANNED = None  # Marks a name taken by a move of this run (not on disk yet)
+
+
+class DestinationIndex:
+    """Case-folded names of the destination folders, for one run.
+
+    resolve(entry, folder) returns (target path, outcome): outcome is None when
+    the name was free, RESOLVED_RENAMED or RESOLVED_REPLACED when the item moves
+    anyway, and RESOLVED_SKIPPED or RESOLVED_DUPLICATE (target None) when it
+    stays where it is. Called from the planner thread only. listings is an
+    optional dict shared between indexes (e.g. by the dry-run planner): folders
+    found in it are not listed again, and new listings are added to it.
+    """
+
+    def __init__(self, policy=CONFLICT_RENAME, listings=None):
+        if policy not in CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy {policy!r}")
+        self.policy = policy
+        self.listings = listings
+        self._folders = {}   # folder -> {case-folded name: name on disk, or _PLANNED}
+        self._next = {}      # (folder, case-folded name) -> next number to try
+
+    def names(self, folder):
+        """The folder's names, listed on first use (an empty set if it doesn't exist yet)."""
+        names = self._folders.get(folder)
+        if names is None:
+            listed = None if self.listings is None else self.listings.get(folder)
+            if listed is None:
+                listed = {}
+                try:
+                    with os.scandir(folder) as it:
+                        for entry in it:
+                            listed[entry.name.casefold()] = entry.name
+                except FileNotFoundError:
+                    pass
+                if self.listings is not None:
+                    self.listings[folder] = listed
+            # This run's planned names go into a copy, so a shared listing stays what is on disk
+            names = self._folders[folder] = dict(listed) if self.listings is not None else listed
+        return names
+
+    def resolve(self, entry, folder):
+        names = self.names(folder)
+        key = entry.name.casefold()
+        existing = names.get(key, "")
+        if existing == "":
+            names[key] = _PLANNED
+            return os.path.join(folder, entry.name), None
+
+        policy = self.policy
+        if policy == CONFLICT_SKIP:
+            return None, RESOLVED_SKIPPED
+        if existing is not _PLANNED and entry.is_file:
+            existing_path = os.path.join(folder, existing)
+            if policy == CONFLICT_REPLACE_NEWER:
+                existing_stat = _stat(existing_path)
+                if existing_stat is None or not stat.S_ISREG(existing_stat.st_mode):
+                    return self._renamed(entry.name, folder, names)
+                if entry.mtime > existing_stat.st_mtime:
+                    return existing_path, RESOLVED_REPLACED
+                return None, RESOLVED_SKIPPED
+            if policy == CONFLICT_DEDUPE and _identical(entry, existing_path):
+                return None, RESOLVED_DUPLICATE
+        return self._renamed(entry.name, folder, names)
+
+    def _renamed(self, name, folder, names):
+        base, ext = os.path.splitext(name)
+        counter_key = (folder, name.casefold())
+        number = self._next.get(counter_key, 1)
+        while True:
+            candidate = f"{base} ({number}){ext}"
+            number += 1
+            if candidate.casefold() not in names:
+                break
+        self._next[counter_key] = number
+        names[candidate.casefold()] = _PLANNED
+        return os.path.join(folder, candidate), RESOLVED_RENAMED
+
+
+def _stat(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _identical(entry, existing_path):
+    """True if the file entry describes has the same size and bytes as existing_path."""
+    existing_stat = _stat(existing_path)
+    if existing_stat is None or not stat.S_ISREG(existing_stat.st_mode):
+        return False
+    if entry.size and entry.size != existing_stat.st_size:
+        return False
+    try:
+        return filecmp.cmp(entry.path, existing_path, shallow=False)
+    except OSError:
+        return False
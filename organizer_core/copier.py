@@ -0,0 +1,180 @@
+"""Parallel cross-device copy engine with per-device-pair I/O lanes."""
+
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from organizer_core.devices import device_of
+from organizer_core.fastcopy import CHUNK_SIZE, CopyCancelled, copy_file, partial_path
+
+DEFAULT_COPY_CONCURRENCY = 4      # Small-file copies in flight per device pair
+DEFAULT_LARGE_CONCURRENCY = 1     # Large-file copies in flight per device pair
+LARGE_FILE_THRESHOLD = 64 * 1024 * 1024
+
+
+class _DeviceLane:
+    """Thread pools and in-flight limits for one (source device, destination device) pair.
+
+    Small files and large files get separate pools, so one multi-GB video can't
+    hold up the hundreds of small files queued behind it.
+    """
+
+    def __init__(self, name, small_workers, large_workers):
+        self.small = ThreadPoolExecutor(small_workers, thread_name_prefix=f"copy-{name}")
+        self.large = ThreadPoolExecutor(large_workers, thread_name_prefix=f"copy-{name}-large")
+        # Allow one queued job per worker on top of the running ones (backpressure)
+        self.small_slots = threading.BoundedSemaphore(small_workers * 2)
+        self.large_slots = threading.BoundedSemaphore(large_workers * 2)
+
+    def shutdown(self):
+        self.small.shutdown(wait=True)
+        self.large.shutdown(wait=True)
+
+
+class CopyExecutor:
+    """Copies files and folders across devices, several at a time.
+
+    submit() picks the lane for the source/destination device pair and blocks
+    once that lane's queue is full, which keeps the caller's memory bounded.
+    Each finished job deletes its source, so a copy here is a complete move.
+    A file is copied to a hidden sibling (fastcopy.partial_path) that only
+    takes the destination's name once complete, so a cancelled or failed copy
+    never leaves a torn file there, nor removes a file it was to replace.
+    Large files are copied in chunk_size pieces by fastcopy.copy_file; on_bytes(n)
+    is called from the copy threads after each chunk, for byte-level progress.
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_COPY_CONCURRENCY,
+                 large_concurrency=DEFAULT_LARGE_CONCURRENCY, large_file_threshold=LARGE_FILE_THRESHOLD,
+                 chunk_size=CHUNK_SIZE, on_bytes=None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.large_concurrency = max(1, large_concurrency)
+        self.large_file_threshold = large_file_threshold
+        self.chunk_size = chunk_size
+        self.on_bytes = on_bytes
+        self._lanes = {}
+        self._devices = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._cancel = threading.Event()
+
+    # --- Device lookup (memoized per parent folder) ---
+    def _device(self, folder):
+        device = self._devices.get(folder)
+        if device is None:
+            device = device_of(folder)
+            self._devices[folder] = device
+        return device
+
+    def _lane(self, source, destination):
+        key = (self._device(os.path.dirname(source)), self._device(os.path.dirname(destination)))
+        lane = self._lanes.get(key)
+        if lane is None:
+            with self._lock:
+                lane = self._lanes.get(key)
+                if lane is None:
+                    lane = _DeviceLane(f"{key[0]}-{key[1]}", self.max_concurrency, self.large_concurrency)
+                    self._lanes[key] = lane
+        return lane
+
+    # --- Public API ---
+    def submit(self, source, destination, size=None, is_dir=None, on_done=None):
+        """Queue a cross-device move and return its Future.
+
+        size and is_dir may be passed from the scanner to avoid extra stat calls;
+        folders always go to the large lane. on_done(future) runs on the copy
+        thread when the job ends.
+        """
+        if is_dir is None:
+            is_dir = os.path.isdir(source)
+        if not is_dir and not size:
+            try:
+                size = os.path.getsize(source)
+            except OSError:
+                size = 0
+        large = is_dir or size >= self.large_file_threshold
+        lane = self._lane(source, destination)
+        pool, slots = (lane.large, lane.large_slots) if large else (lane.small, lane.small_slots)
+
+        slots.acquire()
+        with self._lock:
+            self._pending += 1
+        try:
+            future = pool.submit(self._run_job, source, destination, is_dir, large, size)
+        except BaseException:
+            slots.release()
+            self._job_finished()
+            raise
+
+        def finished(fut):
+            slots.release()
+            try:
+                if on_done is not None:
+                    on_done(fut)
+            finally:
+                self._job_finished()
+
+        future.add_done_callback(finished)
+        return future
+
+    def move(self, source, destination, size=None, is_dir=None):
+        """Synchronous cross-device move through the same lanes."""
+        return self.submit(source, destination, size, is_dir).result()
+
+    def cancel(self):
+        """Skip jobs that haven't started and stop large copies between chunks."""
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        """Wait until no job is pending; return False if the timeout expired first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def shutdown(self):
+        for lane in list(self._lanes.values()):
+            lane.shutdown()
+        self._lanes.clear()
+
+    # --- Workers ---
+    def _job_finished(self):
+        with self._idle:
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def _run_job(self, source, destination, is_dir, large, size):
+        if self._cancel.is_set():
+            raise CopyCancelled(source)
+        if is_dir:
+            shutil.move(source, destination)
+            return
+        partial = partial_path(destination)
+        try:
+            if large:
+                copy_file(source, partial, self.chunk_size, self.on_bytes, self._cancel)
+            else:
+                shutil.copyfile(source, partial)
+                if self.on_bytes is not None:
+                    self.on_bytes(size)
+            shutil.copystat(source, partial)
+            os.replace(partial, destination)
+        except CopyCancelled:
+            _remove_partial(partial)
+            raise CopyCancelled(source)
+        except BaseException:
+            _remove_partial(partial)
+            raise
+        os.unlink(source)
+
+
+def _remove_partial(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
@@ -0,0 +1,16 @@
+"""Device lookups used to tell same-drive renames from cross-drive copies."""
+
+import os
+
+
+def device_of(path):
+    """Return st_dev for path, or for its nearest existing ancestor if it doesn't exist yet."""
+    path = os.path.abspath(path)
+    while True:
+        try:
+            return os.stat(path).st_dev
+        except FileNotFoundError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                raise
+            path = parent
@@ -0,0 +1,325 @@
+"""Headless organizing engine: runs a JobSpec without any GUI."""
+
+import os
+import time
+
+from organizer_core.categories import FOLDER_FALLBACK
+from organizer_core.classifier import Destination, ExtensionClassifier
+from organizer_core.collisions import DestinationIndex
+from organizer_core.folder_matcher import FolderCategoryMatcher
+from organizer_core.job import JobError
+from organizer_core.journal import MoveJournal
+from organizer_core.mover import MoveEngine, describe_modes
+from organizer_core.pipeline import OrganizePipeline
+from organizer_core.plan import PlanSource, plan_moves
+from organizer_core.rules import RuleSet
+from organizer_core.snapshot import SnapshotIndex, snapshot_signature
+
+
+class SourceReport:
+    """Outcome for one source folder: the PipelineResult, or why it didn't run."""
+
+    __slots__ = ("source", "result", "error")
+
+    def __init__(self, source, result=None, error=None):
+        self.source = source
+        self.result = result
+        self.error = error
+
+    def to_dict(self):
+        data = {"source": self.source, "error": self.error}
+        result = self.result
+        if result is not None:
+            stats = result.stats
+            data.update({
+                "cancelled": result.cancelled,
+                "scanned": stats.scanned,
+                "moved": stats.moved,
+                "copied": stats.copied,
+                "unmatched": stats.unmatched,
+                "unchanged": stats.unchanged,
+                "renamed": stats.renamed,
+                "replaced": stats.replaced,
+                "skipped": stats.skipped,
+                "failed": stats.failed,
+                "bytes_moved": stats.bytes.done,
+                "seconds": round(stats.elapsed, 3),
+                "categories": dict(stats.categories),
+                "moves": [{"name": task.name, "source": task.source, "destination": task.destination,
+                           "category": task.category, "kind": task.kind} for task in result.moves],
+                "errors": [{"source": task.source, "destination": task.destination, "error": message}
+                           for task, message in result.errors],
+            })
+        return data
+
+
+class JobReport:
+    """Machine-readable summary of a whole job (all of its sources)."""
+
+    __slots__ = ("spec", "sources", "unavailable_types", "uncategorized_folders", "started", "finished")
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.sources = []
+        self.unavailable_types = set()
+        self.uncategorized_folders = set()
+        self.started = time.time()
+        self.finished = None
+
+    @property
+    def ok(self):
+        """True when every source ran to completion and every move succeeded."""
+        return all(report.error is None and not report.result.cancelled and not report.result.errors
+                   for report in self.sources)
+
+    def to_dict(self):
+        return {
+            "job": self.spec.to_dict(),
+            "ok": self.ok,
+            "started": self.started,
+            "finished": self.finished,
+            "sources": [report.to_dict() for report in self.sources],
+            "unavailable_types": sorted(self.unavailable_types),
+            "uncategorized_folders": sorted(self.uncategorized_folders),
+        }
+
+
+class OrganizerEngine:
+    """Compiles a JobSpec once and organizes its source folders.
+
+    classify(entry) is the per-entry decision the pipeline calls; it records
+    unknown extensions in unavailable_types and, for profiles with folder
+    categories, unhandled folders in uncategorized_folders. The Personal, Office
+    and Media windows and the CLI all run their jobs through this class.
+    batch=True lists each source folder into columns and classifies all of its
+    files at once with NumPy (see batch.py) instead of entry by entry; the
+    snapshot index is not used then, as classifying leftovers again is cheap.
+    The spec's rules (see rules.py) are compiled here too and decide first.
+    """
+
+    def __init__(self, spec, batch=False):
+        self.spec = spec
+        file_categories, folder_categories = spec.file_categories, spec.folder_categories
+        self.classifier = ExtensionClassifier(
+            file_categories, spec.file_types if spec.organizes_files else (),
+            {category: spec.folder_name(category) for category in file_categories})
+        self.folder_matcher = None
+        if folder_categories and spec.organizes_folders:
+            self.folder_matcher = FolderCategoryMatcher(folder_categories, FOLDER_FALLBACK, spec.whole_word)
+        self._folder_types = frozenset(spec.folder_types)
+        self._track_folders = bool(folder_categories)
+        self.unavailable_types = set()
+        self.uncategorized_folders = set()
+        self.rules = RuleSet(spec.rules, spec.organizes_files, spec.organizes_folders) if spec.rules else None
+        if self.rules is not None and not self.rules:
+            self.rules = None  # None of them is for the kinds of items this run organizes
+        self._reserved = {}  # Source folder -> reserved_names()
+        self.batch = None
+        if batch:
+            try:
+                from organizer_core.batch import BatchClassifier
+                self.batch = BatchClassifier(self.classifier)
+            except ImportError as e:
+                raise JobError(str(e))
+
+    def signature(self):
+        """Hash of the settings that decide classification (keys the snapshot index)."""
+        spec = self.spec
+        return snapshot_signature(spec.mode, spec.file_types, spec.folder_types, spec.whole_word,
+                                  spec.file_categories, spec.folder_categories, spec.folder_names, spec.rules)
+
+    def classify(self, entry):
+        """Pick the destination for one scanned entry, or None to leave it in place."""
+        if self.rules is not None:
+            destination = self.rules.match(entry)
+            if destination is not None:
+                return destination
+        if entry.is_file and self.spec.organizes_files:
+            file_ext, destination = self.classifier.match(entry.name)
+            if destination is None:
+                self.unavailable_types.add(file_ext)
+            return destination
+        if entry.is_dir and self.folder_matcher is not None:
+            category = self.folder_matcher.categorize(entry.name)
+            if category in self._folder_types:
+                return Destination(category, self.spec.folder_name(category))
+            return None
+        if entry.is_dir and self._track_folders:
+            self.uncategorized_folders.add(entry.name)
+        return None
+
+    def classify_columns(self, columns):
+        """classify() for a whole ScanColumns at once (needs batch=True); return (moves, left).
+
+        moves yields the (ScanEntry, Destination) pairs to move and left counts
+        the entries left in place. Files are classified by the BatchClassifier
+        and the rules on top; folders the rules leave, usually few, go through
+        classify() one by one.
+        """
+        from organizer_core.batch import KIND_DIR
+
+        codes = self.batch.classify(columns)
+        destinations = self.batch.destinations
+        if self.rules is not None:
+            self.rules.apply_to_columns(columns, codes, len(destinations))
+            destinations += self.rules.destinations
+        if self.spec.organizes_files:
+            self.unavailable_types.update(self.batch.unmatched_extensions(columns, codes))
+        rows = (codes >= 0).nonzero()[0]
+        file_codes = codes[rows].tolist()
+        rows = rows.tolist()
+        folder_moves = []
+        for row in ((columns.kinds == KIND_DIR) & (codes < 0)).nonzero()[0].tolist():
+            entry = columns.entry(row)
+            destination = self.classify(entry)
+            if destination is not None:
+                folder_moves.append((entry, destination))
+
+        entry = columns.entry
+
+        def moves():
+            for row, code in zip(rows, file_codes):
+                yield entry(row), destinations[code]
+            yield from folder_moves
+        return moves(), len(columns) - len(rows) - len(folder_moves)
+
+    def reserved_names(self, source_dir):
+        """Names in source_dir that are never organized, as that would move items already organized.
+
+        When the destination is source_dir itself these are its category folders
+        (of every category and rule, selected or not); when it is further inside,
+        the entry of source_dir that holds it. Empty otherwise.
+        """
+        names = self._reserved.get(source_dir)
+        if names is None:
+            spec = self.spec
+            source = os.path.normcase(os.path.realpath(source_dir))
+            dest = os.path.normcase(os.path.realpath(spec.destination))
+            if dest == source:
+                folders = [spec.folder_name(category) for category in spec.file_categories]
+                folders += [spec.folder_name(category) for category in spec.folder_categories]
+                folders += [rule.folder for rule in spec.rules or ()]
+            elif dest.startswith(os.path.join(source, "")):
+                folders = [os.path.relpath(dest, source)]
+            else:
+                folders = []
+            # Only the first part of a folder name like 'Documents/PDF' is an entry of source_dir
+            names = self._reserved[source_dir] = frozenset(os.path.normpath(folder).split(os.sep)[0]
+                                                           for folder in folders)
+        return names
+
+    def has_work(self):
+        """Whether the job selects a category, or has a rule for the kinds of items it organizes."""
+        return bool(self.selected_categories()) or self.rules is not None
+
+    def selected_categories(self):
+        types = list(self.spec.file_types) if self.spec.organizes_files else []
+        if self.spec.organizes_folders:
+            types += self.spec.folder_types
+        return types
+
+    def plan(self, source_dir, source=None, should_continue=None):
+        """Work out what organizing source_dir would do, without moving anything; return the MovePlan.
+
+        source is a PlanSource to plan from (scanned here if it holds no scan of
+        source_dir); pass the same one again to re-plan without listing the folder.
+        Returns None if cancelled.
+        """
+        if source is None:
+            source = PlanSource()
+        if not source.scanned(source_dir) and not source.scan(source_dir, should_continue,
+                                                              self.reserved_names(source_dir)):
+            return None
+        return plan_moves(self, source, should_continue)
+
+    def organize(self, source_dir, names=None, should_continue=None, on_progress=None,
+                 progress_interval=0.1, on_status=None, plan=None, on_moves=None):
+        """Organize one source folder (or just names inside it) and return the PipelineResult.
+
+        on_status(message) receives the rename/copy plan before moving starts.
+        Moves are written ahead to a MoveJournal, so a run cut short by a crash
+        can be rolled back or finished later (see journal.interrupted_runs).
+        plan is a MovePlan made earlier for source_dir: its moves are carried
+        out without scanning or classifying the folder again. With batch=True
+        the folder is classified as a whole before the moves start.
+        on_moves(tasks) receives the completed moves in batches as they finish
+        (e.g. to save them to the undo history); they are then not kept in the result.
+        """
+        dest_dir = self.spec.destination
+        mover = MoveEngine(source_dir)
+        if on_status is not None:
+            targets = {category: os.path.join(dest_dir, self.spec.folder_name(category))
+                       for category in self.selected_categories()}
+            if self.rules is not None:
+                targets.update((d.category, os.path.join(dest_dir, d.folder_name)) for d in self.rules.destinations)
+            on_status(describe_modes(mover.plan_modes(targets)))
+        planned = None
+        left = skipped = 0
+        if plan is not None:
+            planned = plan.moves
+            left, skipped = plan.unmatched, plan.skipped
+            self.unavailable_types.update(plan.unavailable_types)
+            self.uncategorized_folders.update(plan.uncategorized_folders)
+        elif self.batch is not None and names is None:
+            from organizer_core.batch import scan_columns
+
+            columns = scan_columns(source_dir, should_continue=should_continue,
+                                   reserved=self.reserved_names(source_dir))
+            planned, left = self.classify_columns(columns) if columns is not None else ((), 0)
+        snapshot = None
+        if (self.spec.incremental and names is None and planned is None
+                and (self.rules is None or not self.rules.uses_stat)):
+            snapshot = SnapshotIndex(source_dir, self.spec.profile, self.signature())
+        try:
+            journal = MoveJournal.create(source_dir, dest_dir, self.spec.profile)
+        except OSError:
+            journal = None  # Only needed if the process dies; an unwritable data folder mustn't stop the run
+        pipeline = OrganizePipeline(source_dir, dest_dir, self.classify, mover=mover, snapshot=snapshot,
+                                    names=names, journal=journal, destinations=DestinationIndex(self.spec.on_conflict),
+                                    planned=planned, on_moves=on_moves, reserved=self.reserved_names(source_dir),
+                                    should_continue=should_continue, on_progress=on_progress,
+                                    progress_interval=progress_interval)
+        # Entries decided before the pipeline starts never reach it: count them as scanned and left in place
+        pipeline.stats.unmatched = left
+        pipeline.stats.skipped = skipped
+        pipeline.stats.scanned = left + skipped
+        return pipeline.run()
+
+    def run(self, should_continue=None, on_progress=None, on_status=None, plans=None, moves_sink=None):
+        """Organize every source of the job in turn and return a JobReport.
+
+        A source that is missing or fails is recorded in the report and the
+        remaining sources still run; a cancel stops after the current source.
+        plans maps source folders to MovePlans made earlier (see plan()); those
+        sources run their plan instead of being scanned again. moves_sink(source_dir)
+        returns the on_moves callback (see organize) for a source, e.g. a new
+        step of the undo history; its moves are then not listed in the report.
+        """
+        report = JobReport(self.spec)
+        if not self.has_work():
+            raise JobError("Select at least one category or add a rule to organize")
+        dest_dir = self.spec.destination
+        try:
+            os.makedirs(dest_dir, exist_ok=True)
+        except OSError as e:
+            raise JobError(f"Can't create destination folder {dest_dir}: {e}")
+
+        for source_dir in self.spec.sources:
+            if should_continue is not None and not should_continue():
+                break
+            if not os.path.isdir(source_dir):
+                report.sources.append(SourceReport(source_dir, error="Source folder does not exist"))
+                continue
+            try:
+                result = self.organize(source_dir, should_continue=should_continue, on_progress=on_progress,
+                                       on_status=on_status, plan=(plans or {}).get(source_dir),
+                                       on_moves=None if moves_sink is None else moves_sink(source_dir))
+            except OSError as e:
+                report.sources.append(SourceReport(source_dir, error=str(e)))
+                continue
+            report.sources.append(SourceReport(source_dir, result))
+
+        report.unavailable_types = set(self.unavailable_types)
+        report.uncategorized_folders = set(self.uncategorized_folders)
+        report.finished = time.time()
+        return report
@@ -0,0 +1,156 @@
+"""Zero-copy file transfer for big cross-device moves, with chunked progress.
+
+copy_file() asks the kernel to move the bytes (os.copy_file_range, then
+os.sendfile), so large videos never pass through Python buffers. Only when the
+kernel refuses both does it fall back to readinto() on a small set of reused
+buffers, with a read-ahead thread so reads and writes still overlap.
+Progress is reported and cancellation checked between chunks.
+"""
+
+import errno
+import os
+import queue
+import sys
+import threading
+import zlib
+
+CHUNK_SIZE = 8 * 1024 * 1024
+READ_AHEAD_CHUNKS = 4
+PARTIAL_SUFFIX = ".organizing"
+_MAX_PARTIAL_STEM = 200  # Keeps the partial name under the usual 255-byte limit
+
+# Errors meaning "this kernel/filesystem can't do that transfer", not a real I/O failure
+_UNSUPPORTED = {errno.ENOSYS, errno.EINVAL, errno.EXDEV, errno.EBADF, errno.ETXTBSY,
+                getattr(errno, "EOPNOTSUPP", errno.ENOSYS), getattr(errno, "ENOTSUP", errno.ENOSYS)}
+
+
+class CopyCancelled(Exception):
+    """Raised when a copy is cancelled before it finished."""
+
+
+class _Unsupported(Exception):
+    """The zero-copy call was refused before any byte was transferred."""
+
+
+def partial_path(destination):
+    """The hidden sibling a copy to destination is written to before it takes destination's name."""
+    folder, name = os.path.split(destination)
+    stem = name
+    if len(name) > _MAX_PARTIAL_STEM:
+        stem = f"{name[:_MAX_PARTIAL_STEM]}-{zlib.crc32(name.encode('utf-8', 'surrogateescape')):08x}"
+    return os.path.join(folder, f".{stem}{PARTIAL_SUFFIX}")
+
+
+def is_partial(name):
+    """Whether name is that of a copy still being written (see partial_path)."""
+    return name.endswith(PARTIAL_SUFFIX) and name.startswith(".")
+
+
+def copy_file(source, destination, chunk_size=CHUNK_SIZE, on_progress=None, cancel=None):
+    """Copy source to destination; return the number of bytes copied.
+
+    on_progress(nbytes) is called after every chunk with the bytes just copied.
+    If cancel (a threading.Event) is set, CopyCancelled is raised between chunks.
+    The caller is responsible for removing a partial destination on failure.
+    """
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        for kernel_copy in (_copy_file_range, _sendfile):
+            if kernel_copy is None:
+                continue
+            try:
+                return kernel_copy(infd, outfd, chunk_size, on_progress, cancel)
+            except _Unsupported:
+                continue
+        return _buffered_copy(fsrc, fdst, chunk_size, on_progress, cancel)
+
+
+def _kernel_loop(step, chunk_size, on_progress, cancel):
+    copied = 0
+    while True:
+        if cancel is not None and cancel.is_set():
+            raise CopyCancelled()
+        try:
+            sent = step(chunk_size)
+        except OSError as e:
+            if copied == 0 and e.errno in _UNSUPPORTED:
+                raise _Unsupported() from e
+            raise
+        if sent == 0:
+            if copied == 0:
+                # Some filesystems (procfs-like, some FUSE mounts) report 0 for non-empty files
+                raise _Unsupported()
+            return copied
+        copied += sent
+        if on_progress is not None:
+            on_progress(sent)
+
+
+def _copy_file_range_impl(infd, outfd, chunk_size, on_progress, cancel):
+    size = os.fstat(infd).st_size
+    if size == 0:
+        return 0
+    return _kernel_loop(lambda n: os.copy_file_range(infd, outfd, n), chunk_size, on_progress, cancel)
+
+
+def _sendfile_impl(infd, outfd, chunk_size, on_progress, cancel):
+    size = os.fstat(infd).st_size
+    if size == 0:
+        return 0
+    return _kernel_loop(lambda n: os.sendfile(outfd, infd, None, n), chunk_size, on_progress, cancel)
+
+
+_copy_file_range = _copy_file_range_impl if hasattr(os, "copy_file_range") else None
+# sendfile() to a regular file only works on Linux; elsewhere it wants a socket
+_sendfile = _sendfile_impl if hasattr(os, "sendfile") and sys.platform.startswith("linux") else None
+
+
+def _buffered_copy(fsrc, fdst, chunk_size, on_progress, cancel):
+    """readinto() fallback: a reader thread fills reused buffers while this thread writes."""
+    free = queue.Queue()
+    for _ in range(READ_AHEAD_CHUNKS):
+        free.put(bytearray(chunk_size))
+    filled = queue.Queue()
+    stop = threading.Event()
+    failure = []
+
+    def reader():
+        try:
+            while not stop.is_set():
+                buf = free.get()
+                if buf is None:
+                    break
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                filled.put((buf, n))
+        except BaseException as e:
+            failure.append(e)
+        finally:
+            filled.put(None)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    copied = 0
+    try:
+        while True:
+            item = filled.get()
+            if item is None:
+                break
+            buf, n = item
+            if cancel is not None and cancel.is_set():
+                raise CopyCancelled()
+            with memoryview(buf) as view:
+                fdst.write(view[:n])
+            free.put(buf)
+            copied += n
+            if on_progress is not None:
+                on_progress(n)
+    finally:
+        stop.set()
+        free.put(None)  # Wake the reader if it is waiting for a buffer
+        thread.join()
+
+    if failure:
+        raise failure[0]
+    return copied
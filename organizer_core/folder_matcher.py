@@ -0,0 +1,91 @@
+"""Aho-Corasick keyword matcher for categorizing folders by name."""
+
+from collections import deque
+
+
+class FolderCategoryMatcher:
+    """Finds every category keyword in a folder name in one pass.
+
+    The automaton is compiled once from folder_categories. Priority is the same
+    as the old nested loop: the category listed first wins, and the fallback
+    category (which has no keywords) is returned when nothing matches. With
+    whole_word=True a keyword only counts when it is not glued to other letters
+    or digits, so 'my' matches 'my stuff' but no longer 'dummy'.
+    """
+
+    __slots__ = ("categories", "fallback", "whole_word", "_goto", "_fail", "_best", "_hits")
+
+    def __init__(self, folder_categories, fallback="Other Folders", whole_word=False):
+        self.categories = tuple(c for c in folder_categories if c != fallback)
+        self.fallback = fallback
+        self.whole_word = whole_word
+
+        # Node 0 is the root; _best holds the highest-priority category ending at a
+        # node (following fail links), _hits the (length, priority) of every keyword
+        goto = [{}]
+        best = [len(self.categories)]
+        hits = [()]
+        for priority, category in enumerate(self.categories):
+            for keyword in folder_categories[category]:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                node = 0
+                for char in keyword:
+                    nxt = goto[node].get(char)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[node][char] = nxt
+                        goto.append({})
+                        best.append(len(self.categories))
+                        hits.append(())
+                    node = nxt
+                best[node] = min(best[node], priority)
+                hits[node] += ((len(keyword), priority),)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(char, 0)
+                fail[child] = target if target != child else 0
+                best[child] = min(best[child], best[fail[child]])
+                hits[child] += hits[fail[child]]
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._best = best
+        self._hits = hits
+
+    def categorize(self, folder_name):
+        """Return the category for folder_name, or the fallback category."""
+        text = folder_name.lower()
+        goto, fail = self._goto, self._fail
+        winner = len(self.categories)
+        whole_word = self.whole_word
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if self._best[node] >= winner:
+                continue
+            if not whole_word:
+                winner = self._best[node]
+            else:
+                for length, priority in self._hits[node]:
+                    if priority < winner and self._is_whole_word(text, index + 1 - length, index + 1):
+                        winner = priority
+            if winner == 0:
+                break
+        return self.categories[winner] if winner < len(self.categories) else self.fallback
+
+    @staticmethod
+    def _is_whole_word(text, start, end):
+        return ((start == 0 or not text[start - 1].isalnum())
+                and (end == len(text) or not text[end].isalnum()))
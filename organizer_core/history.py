@@ -0,0 +1,222 @@
+"""Persistent undo history: the moves of every run, kept on disk across restarts.
+
+Each run's moves are stored in a SQLite file in the data folder, with the
+directory part of every path stored once in a table of its own and referred
+to by id. Nothing is held in memory between calls: undoing a run streams its
+moves back as small UndoMove records (the directory strings are shared by
+every record in the same folder), so memory use doesn't grow with the number
+of items or runs.
+"""
+
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+from organizer_core.appdata import app_data_dir
+
+DB_NAME = "history.sqlite3"
+BATCH_SIZE = 10000  # Moves written or read per round trip
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    finished REAL NOT NULL,
+    source_dir TEXT NOT NULL,
+    items INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_profile ON runs (profile, id);
+CREATE TABLE IF NOT EXISTS dirs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS moves (
+    run_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    source_dir INTEGER NOT NULL,
+    source_name TEXT NOT NULL,
+    dest_dir INTEGER NOT NULL,
+    dest_name TEXT,
+    category TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    PRIMARY KEY (run_id, seq)
+) WITHOUT ROWID;
+"""
+
+HistoryRun = namedtuple("HistoryRun", "id finished source_dir items")
+
+
+class UndoMove:
+    """One recorded move; source_dir and dest_dir are shared with the run's other records."""
+
+    __slots__ = ("seq", "source_dir", "source_name", "dest_dir", "dest_name", "category", "kind")
+
+    def __init__(self, seq, source_dir, source_name, dest_dir, dest_name, category, kind):
+        self.seq = seq
+        self.source_dir = source_dir
+        self.source_name = source_name
+        self.dest_dir = dest_dir
+        self.dest_name = dest_name
+        self.category = category
+        self.kind = kind
+
+    @property
+    def source(self):
+        return os.path.join(self.source_dir, self.source_name)
+
+    @property
+    def destination(self):
+        return os.path.join(self.dest_dir, self.dest_name)
+
+
+class UndoHistory:
+    """The undo history of one profile (Personal, Office or Media).
+
+    Safe to use from any thread: every call opens its own short-lived
+    connection, so a worker can record while the GUI thread asks for the latest run.
+    """
+
+    def __init__(self, profile, db_path=None):
+        self.profile = profile
+        self.db_path = db_path
+
+    def _connect(self):
+        if self.db_path is None:
+            self.db_path = os.path.join(app_data_dir(), DB_NAME)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        # WAL: the GUI thread can read the latest run while a worker is recording one
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def record(self, source_dir, moves):
+        """Store a run's completed moves (MoveTasks) as one undo step; return its HistoryRun, or None."""
+        return self.recorder(source_dir).add(moves)
+
+    def recorder(self, source_dir):
+        """A RunRecorder that stores a run's moves as one undo step, a batch at a time."""
+        return RunRecorder(self, source_dir)
+
+    def latest(self):
+        """The most recent run that can still be undone, or None."""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT id, finished, source_dir, items FROM runs WHERE profile = ?"
+                               " ORDER BY id DESC LIMIT 1", (self.profile,)).fetchone()
+        finally:
+            conn.close()
+        return None if row is None else HistoryRun(*row)
+
+    def __len__(self):
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM runs WHERE profile = ?", (self.profile,)).fetchone()[0]
+        finally:
+            conn.close()
+
+    def moves(self, run_id):
+        """Yield the run's moves as UndoMove records, newest first, reading BATCH_SIZE at a time."""
+        conn = self._connect()
+        try:
+            # The run's directories, one string each, shared by every record below
+            dirs = dict(conn.execute(
+                "SELECT id, path FROM dirs WHERE id IN (SELECT source_dir FROM moves WHERE run_id = ?"
+                " UNION SELECT dest_dir FROM moves WHERE run_id = ?)", (run_id, run_id)))
+            cur = conn.execute("SELECT seq, source_dir, source_name, dest_dir, dest_name, category, kind"
+                               " FROM moves WHERE run_id = ? ORDER BY seq DESC", (run_id,))
+            while True:
+                rows = cur.fetchmany(BATCH_SIZE)
+                if not rows:
+                    break
+                for seq, source_dir, source_name, dest_dir, dest_name, category, kind in rows:
+                    yield UndoMove(seq, dirs[source_dir], source_name, dirs[dest_dir],
+                                   source_name if dest_name is None else dest_name, category, kind)
+        finally:
+            conn.close()
+
+    def forget(self, run_id, from_seq=None, keep=()):
+        """Drop moves that have been undone: the whole run, or the moves from from_seq up except keep.
+
+        The run itself is dropped once none of its moves are left.
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                if from_seq is None and not keep:
+                    conn.execute("DELETE FROM moves WHERE run_id = ?", (run_id,))
+                    conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
+                    return
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep (seq INTEGER PRIMARY KEY)")
+                conn.execute("DELETE FROM keep")
+                conn.executemany("INSERT OR IGNORE INTO keep (seq) VALUES (?)", ((seq,) for seq in keep))
+                cur = conn.execute("DELETE FROM moves WHERE run_id = ? AND seq >= ? AND seq NOT IN (SELECT seq FROM keep)",
+                                   (run_id, from_seq or 0))
+                conn.execute("UPDATE runs SET items = items - ? WHERE id = ?", (cur.rowcount, run_id))
+                conn.execute("DELETE FROM runs WHERE id = ? AND items <= 0", (run_id,))
+        finally:
+            conn.close()
+
+
+class RunRecorder:
+    """Stores the moves of one run as they complete, so they never have to be held all at once.
+
+    The run is created with the first batch passed to add() and grows with
+    every later one; run is its HistoryRun so far (None until a move is stored).
+    """
+
+    __slots__ = ("history", "source_dir", "run", "_dir_ids")
+
+    def __init__(self, history, source_dir):
+        self.history = history
+        self.source_dir = source_dir
+        self.run = None
+        self._dir_ids = {}
+
+    def add(self, moves):
+        """Append completed moves (MoveTasks) to the run; return its HistoryRun, or None if still empty."""
+        if not moves:
+            return self.run
+        finished = time.time()
+        dir_ids = dict(self._dir_ids)  # Only kept once the batch is committed
+        conn = self.history._connect()
+        try:
+            with conn:
+                if self.run is None:
+                    cur = conn.execute("INSERT INTO runs (profile, finished, source_dir, items) VALUES (?, ?, ?, 0)",
+                                       (self.history.profile, finished, self.source_dir))
+                    run_id, first = cur.lastrowid, 0
+                else:
+                    run_id, first = self.run.id, self.run.items
+                rows = []
+                for seq, task in enumerate(moves, first):
+                    source_parent, source_name = os.path.split(task.source)
+                    dest_parent, dest_name = os.path.split(task.destination)
+                    rows.append((run_id, seq, _dir_id(conn, dir_ids, source_parent), source_name,
+                                 _dir_id(conn, dir_ids, dest_parent),
+                                 None if dest_name == source_name else dest_name, task.category, task.kind))
+                    if len(rows) >= BATCH_SIZE:
+                        _insert_moves(conn, rows)
+                        rows = []
+                _insert_moves(conn, rows)
+                conn.execute("UPDATE runs SET finished = ?, items = items + ? WHERE id = ?",
+                             (finished, len(moves), run_id))
+        finally:
+            conn.close()
+        self._dir_ids = dir_ids
+        self.run = HistoryRun(run_id, finished, self.source_dir, first + len(moves))
+        return self.run
+
+
+def _dir_id(conn, cache, path):
+    dir_id = cache.get(path)
+    if dir_id is None:
+        conn.execute("INSERT OR IGNORE INTO dirs (path) VALUES (?)", (path,))
+        dir_id = cache[path] = conn.execute("SELECT id FROM dirs WHERE path = ?", (path,)).fetchone()[0]
+    return dir_id
+
+
+def _insert_moves(conn, rows):
+    conn.executemany("INSERT INTO moves (run_id, seq, source_dir, source_name, dest_dir, dest_name, category, kind)"
+                     " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
@@ -0,0 +1,144 @@
+"""Immutable description of one organizing run, loadable from JSON."""
+
+import json
+from collections import namedtuple
+
+from organizer_core.categories import PROFILES
+from organizer_core.collisions import CONFLICT_POLICIES, CONFLICT_RENAME
+
+MODES = ("files", "folders", "both")
+
+
+class JobError(ValueError):
+    """A job spec or job file that can't be run as given."""
+
+
+_JOB_FIELDS = ("profile sources destination file_types folder_types mode folder_names "
+               "whole_word incremental on_conflict rules")
+
+
+class JobSpec(namedtuple("JobSpec", _JOB_FIELDS, defaults=((), "files", (), False, True, CONFLICT_RENAME, ()))):
+    """What to organize, where to, and with which categories.
+
+    Build it with JobSpec.create() (or from_dict()/load()), which fills in the
+    profile's defaults and checks the category names. It is an immutable tuple
+    (folder_names holds (category, folder name) pairs where they differ;
+    incremental skips leftovers recorded by the snapshot index; on_conflict is
+    the collisions policy for names already taken in a category folder; rules
+    holds the user's Rules, checked before the categories), so one spec can be
+    handed to a worker thread, reused for watch batches, or written into a
+    report as-is.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, profile, sources, destination, file_types=None, folder_types=None, mode=None,
+               folder_names=None, whole_word=False, incremental=True, on_conflict=None, rules=None):
+        """Normalize and validate the arguments; None picks every category of the profile."""
+        if profile not in PROFILES:
+            raise JobError(f"Unknown profile {profile!r} (expected one of: {', '.join(PROFILES)})")
+        file_categories, folder_categories = PROFILES[profile]
+        if mode is None:
+            mode = "both" if folder_categories else "files"
+        if mode not in MODES:
+            raise JobError(f"Unknown mode {mode!r} (expected one of: {', '.join(MODES)})")
+        if mode != "files" and not folder_categories:
+            raise JobError(f"The {profile} organizer only organizes files")
+        if on_conflict is None:
+            on_conflict = CONFLICT_RENAME
+        if on_conflict not in CONFLICT_POLICIES:
+            raise JobError(f"Unknown conflict policy {on_conflict!r} (expected one of: {', '.join(CONFLICT_POLICIES)})")
+        if isinstance(sources, str):
+            sources = (sources,)
+
+        file_types = _check_types(file_types, file_categories, "file")
+        folder_types = _check_types(folder_types, folder_categories, "folder")
+        folder_names = dict(folder_names or {})
+        unknown = set(folder_names) - set(file_categories) - set(folder_categories)
+        if unknown:
+            raise JobError(f"Folder names given for unknown categories: {', '.join(sorted(unknown))}")
+        # Imported here: the rules module (and its regex compiling) only matters once a job is built
+        from organizer_core.rules import RuleError, parse_rules
+
+        try:
+            rules = parse_rules(rules)
+        except RuleError as e:
+            raise JobError(str(e))
+        return cls(profile, tuple(sources), destination, file_types, folder_types, mode,
+                   tuple(sorted((c, n) for c, n in folder_names.items() if n and n != c)),
+                   bool(whole_word), bool(incremental), on_conflict, rules)
+
+    @classmethod
+    def from_dict(cls, data):
+        unknown = set(data) - set(cls._fields)
+        if unknown:
+            raise JobError(f"Unknown job field(s): {', '.join(sorted(unknown))}")
+        if "profile" not in data or "sources" not in data or "destination" not in data:
+            raise JobError("A job needs 'profile', 'sources' and 'destination'")
+        return cls.create(**data)
+
+    @classmethod
+    def load(cls, path):
+        """Read a JSON job file holding one job object or a list of them; return a list of specs."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise JobError(f"Can't read job file {path}: {e}")
+        jobs = data if isinstance(data, list) else [data]
+        if not all(isinstance(job, dict) for job in jobs):
+            raise JobError(f"Job file {path} must hold a job object or a list of job objects")
+        return [cls.from_dict(job) for job in jobs]
+
+    def to_dict(self):
+        from organizer_core.rules import rule_to_dict
+
+        return {
+            "profile": self.profile,
+            "sources": list(self.sources),
+            "destination": self.destination,
+            "file_types": list(self.file_types),
+            "folder_types": list(self.folder_types),
+            "mode": self.mode,
+            "folder_names": dict(self.folder_names),
+            "whole_word": self.whole_word,
+            "incremental": self.incremental,
+            "on_conflict": self.on_conflict,
+            "rules": [rule_to_dict(rule) for rule in self.rules],
+        }
+
+    @property
+    def file_categories(self):
+        return PROFILES[self.profile][0]
+
+    @property
+    def folder_categories(self):
+        return PROFILES[self.profile][1]
+
+    @property
+    def organizes_files(self):
+        return self.mode in ("files", "both")
+
+    @property
+    def organizes_folders(self):
+        return self.mode in ("folders", "both")
+
+    def folder_name(self, category):
+        """Destination folder name for a category (the category name unless renamed)."""
+        for renamed, name in self.folder_names:
+            if renamed == category:
+                return name
+        return category
+
+
+def _check_types(types, categories, kind):
+    if types is None:
+        return tuple(categories)
+    if isinstance(types, str):
+        types = (types,)
+    unknown = [t for t in types if t not in categories]
+    if unknown:
+        raise JobError(f"Unknown {kind} categories: {', '.join(unknown)}")
+    # Keep the table order: it decides which category wins an overlapping extension
+    return tuple(c for c in categories if c in types)
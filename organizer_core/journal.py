@@ -0,0 +1,376 @@
+"""Write-ahead journal of a run's moves, for recovering runs that were cut short.
+
+Every run appends its planned and completed moves to a small line-oriented
+file in the data folder and deletes the file when it ends. A journal that is
+still there at the next start belongs to a run whose process died or that
+failed part-way; it can be rolled back (completed moves are put back) or
+finished (the remaining moves are made). Records, one per line, fields
+separated by tabs:
+
+    H  version  started  source_dir  dest_dir  profile               header
+    P  seq  kind  mode  name  destination  category  replace     planned move
+    D  seq                                                       move completed
+    F  seq                                                       move failed, source left in place
+
+kind is f(ile) or d(irectory), mode r(ename) or c(opy), and replace is r when
+the move overwrites a file that was already at destination (else empty).
+name is relative to source_dir and destination to dest_dir. Tabs, newlines
+and backslashes in fields are backslash-escaped.
+"""
+
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from organizer_core.appdata import app_data_dir
+from organizer_core.fastcopy import partial_path
+
+JOURNAL_DIR_NAME = "journal"
+JOURNAL_SUFFIX = ".journal"
+FORMAT_VERSION = "1"
+SYNC_INTERVAL = 0.5     # Completion records are fsynced at least this often...
+SYNC_BATCH = 4096       # ...or every this many records, whichever comes first
+_BUFFER_SIZE = 1 << 16
+
+# Where a journaled move stands, judged from the journal and the file system
+STATE_DONE = "done"           # At the destination, gone from the source
+STATE_PENDING = "pending"     # Still at the source only
+STATE_PARTIAL = "partial"     # Copy ended just before the run died: source intact, destination its copy
+STATE_CONFLICT = "conflict"   # At both places, not as this run's copy (e.g. a file to replace) - left alone
+STATE_MISSING = "missing"     # At neither place - left alone
+
+JournalMove = namedtuple("JournalMove", "seq kind mode source destination category replace")
+
+_ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+_NEEDS_ESCAPE = re.compile(r"[\\\t\n\r]")
+_ESCAPED = re.compile(r"\\(.)")
+
+
+def _escape(text):
+    if _NEEDS_ESCAPE.search(text) is None:
+        return text
+    return _NEEDS_ESCAPE.sub(lambda m: _ESCAPES[m.group()], text)
+
+
+def _unescape(text):
+    if "\\" not in text:
+        return text
+    return _ESCAPED.sub(lambda m: _UNESCAPES.get(m.group(1), m.group(1)), text)
+
+
+def journal_dir(create=True):
+    path = os.path.join(app_data_dir(create), JOURNAL_DIR_NAME)
+    if create:
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _try_lock(f):
+    """Take an exclusive, non-blocking lock on an open journal; False if another process holds it."""
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+class MoveJournal:
+    """Append-only journal of one run, held locked (so it isn't recovered) while the run is alive.
+
+    planned() appends a P record and returns its sequence number. Before a move
+    starts, durable(seq) makes sure its P record is on disk: one fsync covers
+    every record written so far (group commit), and as the planner runs ahead
+    of the movers a single fsync typically covers hundreds of moves. D and F
+    records are only fsynced in batches; if the last few are lost in a crash,
+    recovery reads the outcome from the file system instead.
+    """
+
+    def __init__(self, path, source_dir, dest_dir, profile):
+        self.path = path
+        self._dest_prefix = os.path.join(dest_dir, "")
+        # Absolute, so recovery doesn't depend on the working directory of the next start
+        self.source_dir = source_dir = os.path.abspath(source_dir)
+        self.dest_dir = dest_dir = os.path.abspath(dest_dir)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._synced = 0
+        self._unsynced = 0
+        self._closed = False
+        self._file = open(path, "x", encoding="utf-8", errors="surrogateescape", newline="\n",
+                          buffering=_BUFFER_SIZE)
+        _try_lock(self._file)
+        self._file.write(f"H\t{FORMAT_VERSION}\t{time.time():.3f}\t{_escape(source_dir)}\t"
+                         f"{_escape(dest_dir)}\t{_escape(profile)}\n")
+        self._sync()
+
+    @classmethod
+    def create(cls, source_dir, dest_dir, profile, directory=None):
+        """Start a new journal file in the data folder (or directory)."""
+        if directory is None:
+            directory = journal_dir()
+        name = f"{time.time_ns()}-{os.getpid()}-{threading.get_ident()}{JOURNAL_SUFFIX}"
+        return cls(os.path.join(directory, name), source_dir, dest_dir, profile)
+
+    def planned(self, name, destination, category, kind, mode, replace=False):
+        """Record a planned move of source_dir/name and return its sequence number.
+
+        replace says the move overwrites a file already at destination, which
+        recovery must then never remove.
+        """
+        if destination.startswith(self._dest_prefix):
+            destination = destination[len(self._dest_prefix):]
+        record = (f"{'d' if kind == 'folder' else 'f'}\t{mode[0]}\t{_escape(name)}\t{_escape(destination)}\t"
+                  f"{_escape(category)}\t{'r' if replace else ''}\n")
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._file.write(f"P\t{seq}\t{record}")
+        return seq
+
+    def durable(self, seq):
+        """Block until the P record for seq is on disk (a no-op if an earlier fsync covered it)."""
+        if seq <= self._synced:
+            return
+        with self._lock:
+            if seq > self._synced:
+                self._sync()
+
+    def done(self, seq):
+        self._append(f"D\t{seq}\n")
+
+    def failed(self, seq):
+        self._append(f"F\t{seq}\n")
+
+    def close(self):
+        """The run ended with the process alive, so there is nothing to recover: remove the journal."""
+        if self._release(sync=False):
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def keep(self):
+        """The run failed part-way: flush and release the journal, leaving it to be recovered."""
+        self._release(sync=True)
+
+    def _release(self, sync):
+        with self._lock:
+            if self._closed:
+                return False
+            self._closed = True
+            if sync:
+                try:
+                    self._sync()
+                except OSError:
+                    pass  # Recovery reads any outcome that didn't reach the disk from the file system
+            self._file.close()
+        return True
+
+    def _append(self, record):
+        with self._lock:
+            self._file.write(record)
+            self._unsynced += 1
+            if self._unsynced >= SYNC_BATCH or time.monotonic() - self._last_sync >= SYNC_INTERVAL:
+                self._sync()
+
+    def _sync(self):
+        # Caller holds self._lock (or is the constructor)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._synced = self._seq
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+
+class InterruptedRun:
+    """A journal left behind by a run whose process died; holds its lock until closed."""
+
+    def __init__(self, path, f, source_dir, dest_dir, profile, started, moves, finished):
+        self.path = path
+        self.source_dir = source_dir
+        self.dest_dir = dest_dir
+        self.profile = profile
+        self.started = started
+        self.moves = moves
+        self.finished = finished  # seqs with a D record
+        self._file = f
+
+    def state(self, move):
+        """Where move stands now (one of the STATE_* values)."""
+        at_source = os.path.lexists(move.source)
+        at_destination = os.path.lexists(move.destination)
+        if at_destination and not at_source:
+            return STATE_DONE
+        if at_source and not at_destination:
+            return STATE_PENDING
+        if at_source:
+            if move.mode == "c" and move.kind == "f" and move.seq not in self.finished and not move.replace:
+                return STATE_PARTIAL
+            return STATE_CONFLICT
+        return STATE_MISSING
+
+    def completed(self):
+        """How many planned moves are in place at the destination.
+
+        D records are only fsynced in batches, so the last ones may be lost:
+        moves without one are judged by state() (a few file checks each).
+        """
+        finished = self.finished
+        return len(finished) + sum(1 for move in self.moves
+                                   if move.seq not in finished and self.state(move) == STATE_DONE)
+
+    def describe(self):
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.started))
+        return (f"A run started {when} was interrupted after {self.completed():,} of "
+                f"{len(self.moves):,} planned moves from {self.source_dir} to {self.dest_dir}.")
+
+    def rollback(self, should_continue=None, on_progress=None):
+        """Put completed moves back, newest first; return (items restored, [(move, problem)])."""
+        return self._apply(reversed(self.moves), self._roll_back_one, should_continue, on_progress)
+
+    def finish(self, should_continue=None, on_progress=None):
+        """Make the moves that didn't happen; return (items moved, [(move, problem)])."""
+        return self._apply(self.moves, self._finish_one, should_continue, on_progress)
+
+    def discard(self):
+        """Forget the run, leaving every file where it is now."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def close(self):
+        """Release the journal without changing anything (it is offered again next time)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _apply(self, moves, action, should_continue, on_progress):
+        count = 0
+        problems = []
+        total = len(self.moves)
+        for index, move in enumerate(moves):
+            if should_continue is not None and not should_continue():
+                self.close()
+                return count, problems
+            try:
+                if action(move, self.state(move)):
+                    count += 1
+            except OSError as e:
+                problems.append((move, str(e)))
+            if on_progress is not None and index % 256 == 0:
+                on_progress(index, total)
+        self.discard()
+        return count, problems
+
+    @staticmethod
+    def _roll_back_one(move, state):
+        _remove_copy_leftover(move)
+        if state == STATE_DONE:
+            shutil.move(move.destination, move.source)
+            return True
+        if state == STATE_PARTIAL:
+            os.unlink(move.destination)
+        elif state in (STATE_CONFLICT, STATE_MISSING):
+            raise OSError(f"left alone: {state}")
+        return False
+
+    @staticmethod
+    def _finish_one(move, state):
+        _remove_copy_leftover(move)
+        if state == STATE_PENDING:
+            os.makedirs(os.path.dirname(move.destination), exist_ok=True)
+            shutil.move(move.source, move.destination)
+            return True
+        if state == STATE_PARTIAL:
+            shutil.copy2(move.source, move.destination)
+            os.unlink(move.source)
+            return True
+        if state in (STATE_CONFLICT, STATE_MISSING):
+            raise OSError(f"left alone: {state}")
+        return False
+
+
+def _remove_copy_leftover(move):
+    """Remove the hidden partial file of a copy the crash cut short (the destination itself is untouched)."""
+    if move.mode == "c" and move.kind == "f":
+        try:
+            os.unlink(partial_path(move.destination))
+        except OSError:
+            pass
+
+
+def read_journal(path, f):
+    """Replay a journal; return an InterruptedRun, or None if the file has no usable header."""
+    moves = []
+    finished = set()
+    header = None
+    for line in f:
+        if not line.endswith("\n"):
+            break  # Torn last record: the process died while writing it
+        fields = line[:-1].split("\t")
+        tag = fields[0]
+        try:
+            if tag == "P" and header is not None and len(fields) == 8:
+                source_dir, dest_dir = header[3], header[4]
+                moves.append(JournalMove(int(fields[1]), fields[2], fields[3],
+                                         os.path.join(source_dir, _unescape(fields[4])),
+                                         os.path.join(dest_dir, _unescape(fields[5])), _unescape(fields[6]),
+                                         fields[7] == "r"))
+            elif tag == "D" and len(fields) == 2:
+                finished.add(int(fields[1]))
+            elif tag == "H" and header is None and len(fields) == 6 and fields[1] == FORMAT_VERSION:
+                header = [_unescape(field) for field in fields]
+                float(header[2])
+        except ValueError:
+            break  # Damaged record: trust only what came before it
+    if header is None:
+        return None
+    return InterruptedRun(path, f, header[3], header[4], header[5], float(header[2]), moves, finished)
+
+
+def interrupted_runs(profile=None, directory=None):
+    """Journals left by runs that died, oldest first; journals of live runs are skipped.
+
+    Leftover journals with nothing to recover are removed on the way.
+    """
+    if directory is None:
+        directory = journal_dir(create=False)
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(JOURNAL_SUFFIX))
+    except FileNotFoundError:
+        return []
+    runs = []
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            f = open(path, encoding="utf-8", errors="surrogateescape", newline="\n")
+        except OSError:
+            continue
+        if not _try_lock(f):
+            f.close()  # A run in progress, in this or another process
+            continue
+        run = read_journal(path, f)
+        if run is None or not run.moves:
+            f.close()
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        if profile is not None and run.profile != profile:
+            run.close()
+            continue
+        runs.append(run)
+    return runs
@@ -0,0 +1,73 @@
+"""Move engine: atomic rename on the same device, copy only across devices."""
+
+import errno
+import os
+import threading
+
+from organizer_core.copier import CopyExecutor
+from organizer_core.devices import device_of
+
+MODE_RENAME = "rename"
+MODE_COPY = "copy"
+
+
+class MoveEngine:
+    """Decides once per destination folder whether a move is a rename or a copy.
+
+    The source device is looked up once per run and each category folder's device
+    once per folder (memoized), so the per-file cost of a same-device move is a
+    single os.rename. Only items that really cross devices go to the CopyExecutor.
+    """
+
+    def __init__(self, source_dir, copier=None):
+        self.source_device = device_of(source_dir)
+        self.copier = copier or CopyExecutor()
+        self._modes = {}
+        self._lock = threading.Lock()
+
+    def mode_for(self, target_dir):
+        """Return MODE_RENAME or MODE_COPY for moves into target_dir."""
+        mode = self._modes.get(target_dir)
+        if mode is None:
+            mode = MODE_RENAME if device_of(target_dir) == self.source_device else MODE_COPY
+            with self._lock:
+                self._modes[target_dir] = mode
+        return mode
+
+    def plan_modes(self, target_dirs):
+        """Return {key: mode} for a {key: target_dir} mapping, e.g. category -> folder."""
+        return {key: self.mode_for(target_dir) for key, target_dir in target_dirs.items()}
+
+    def move(self, source, destination, mode, size=None, is_dir=None, replace=False):
+        """Move one file or folder and return the mode that was actually used.
+
+        replace allows overwriting an existing file at destination (a rename
+        refuses to on Windows; a cross-device copy always overwrites).
+        """
+        if mode == MODE_RENAME:
+            try:
+                (os.replace if replace else os.rename)(source, destination)
+                return MODE_RENAME
+            except OSError as e:
+                # Same st_dev but still a different filesystem (e.g. bind mounts)
+                if e.errno != errno.EXDEV:
+                    raise
+        self.copier.move(source, destination, size, is_dir)
+        return MODE_COPY
+
+    def close(self):
+        """Wait for outstanding copies and stop the copy threads."""
+        self.copier.wait()
+        self.copier.shutdown()
+
+
+def describe_modes(modes):
+    """Human-readable summary of plan_modes() output for the status label."""
+    copied = sorted(key for key, mode in modes.items() if mode == MODE_COPY)
+    if not copied:
+        return "All categories are on the same drive: files will be moved instantly (rename)."
+    renamed = sorted(key for key, mode in modes.items() if mode == MODE_RENAME)
+    message = f"Copying to another drive: {', '.join(copied)}."
+    if renamed:
+        message += f" Instant rename: {', '.join(renamed)}."
+    return message
@@ -0,0 +1,456 @@
+"""Streaming scan -> classify -> plan -> execute pipeline with bounded queues.
+
+Each stage runs on its own thread and hands work to the next one through a
+bounded queue, so moves start as soon as the first entry is scanned and memory
+stays flat no matter how many entries the source folder holds: a fast scanner
+simply blocks once the queue in front of a slower stage is full.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from functools import partial
+
+from organizer_core.collisions import RESOLVED_RENAMED, RESOLVED_REPLACED, DestinationIndex
+from organizer_core.copier import CopyCancelled
+from organizer_core.fastcopy import is_partial
+from organizer_core.mover import MODE_COPY, MoveEngine
+from organizer_core.progress import ProgressTracker
+from organizer_core.scanner import scan_directory, scan_names
+
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_WORKERS = 4
+MOVE_BATCH = 4096  # Completed moves handed to on_moves at a time
+
+# One planned move, produced by the planner and consumed by the executor workers;
+# seq is its record number in the run's MoveJournal (None when not journaled) and
+# replace is set when the conflict policy chose to replace an existing file
+MoveTask = namedtuple("MoveTask", "name source destination category kind size mode seq replace",
+                      defaults=(None, False))
+
+_DONE = object()  # End-of-stream marker passed down the queues
+
+
+class PipelineStats:
+    """Per-stage counters, updated by the stage threads and read by the reporter.
+
+    bytes is a ProgressTracker: its total grows as moves are planned and its
+    done count as renames finish and copy chunks land. categories counts the
+    completed moves per category, moved_folders how many of them were folders.
+    """
+
+    __slots__ = ("scanned", "classified", "planned", "moved", "copied", "unmatched", "failed",
+                 "unchanged", "renamed", "replaced", "skipped", "scan_done", "started", "bytes", "categories",
+                 "moved_folders")
+
+    def __init__(self):
+        self.scanned = self.classified = self.planned = 0
+        self.moved = self.copied = self.unmatched = self.failed = self.unchanged = 0
+        self.renamed = self.replaced = self.skipped = 0  # Name conflicts, by how they were resolved
+        self.scan_done = False
+        self.started = time.perf_counter()
+        self.bytes = ProgressTracker()
+        self.categories = {}
+        self.moved_folders = 0
+
+    @property
+    def elapsed(self):
+        return max(time.perf_counter() - self.started, 1e-6)
+
+    @property
+    def finished(self):
+        """Entries that need no more work: moved, left in place, unchanged since last run, or failed."""
+        return self.moved + self.unmatched + self.unchanged + self.skipped + self.failed
+
+    def fraction(self):
+        """Share of the work seen so far that is finished (0.0 - 1.0).
+
+        Weighted by bytes when sizes are known, so one huge video isn't worth the
+        same as a text file; by entry count otherwise.
+        """
+        if self.bytes.total:
+            return self.bytes.fraction()
+        return self.finished / self.scanned if self.scanned else (1.0 if self.scan_done else 0.0)
+
+    def describe(self):
+        """One-line throughput summary for the status label."""
+        elapsed = self.elapsed
+        scanned = f"Scanned {self.scanned:,}" + ("" if self.scan_done else f" ({self.scanned / elapsed:,.0f}/s)")
+        text = (f"{scanned} · Classified {self.classified:,} ({self.classified / elapsed:,.0f}/s)"
+                f" · Moved {self.moved:,} ({self.moved / elapsed:,.0f}/s)")
+        if self.unchanged:
+            text += f" · Unchanged {self.unchanged:,}"
+        conflicts = self.renamed + self.replaced + self.skipped
+        if conflicts:
+            text += f" · Name conflicts {conflicts:,}"
+        if self.bytes.total:
+            text += f" · {self.bytes.describe()}"
+        return text
+
+
+class PipelineResult:
+    """What a pipeline run did: completed moves, per-item errors and final stats.
+
+    moves stays empty when the run handed its moves to an on_moves callback.
+    """
+
+    __slots__ = ("moves", "errors", "cancelled", "stats")
+
+    def __init__(self, stats):
+        self.moves = []
+        self.errors = []
+        self.cancelled = False
+        self.stats = stats
+
+
+class OrganizePipeline:
+    """Runs one organizing pass over source_dir.
+
+    classify(entry) is called on the classifier thread with each ScanEntry and
+    returns a Destination (category, folder_name) or None to leave the entry in
+    place. on_progress(stats) is called from the thread that called run(), at
+    most every progress_interval seconds and once more at the end. mover is a
+    MoveEngine; one is created for source_dir when none is passed, and it is
+    closed when the run ends. Same-device moves are renamed by the executor
+    workers; cross-device ones are handed to the mover's CopyExecutor.
+    with_stat makes the scanner fill in sizes, which progress is weighted by.
+    snapshot is an optional SnapshotIndex: entries the last run left in place
+    that still have the same name and inode are skipped before they are stat'ed
+    or classified, and this run's leftovers are saved back to it. names limits
+    the run to those entries of source_dir instead of listing the whole folder.
+    journal is an optional MoveJournal: each move is recorded there (and made
+    durable) before it starts, and the journal is closed when the run ends,
+    or kept for recovery if a stage failed. That failure is raised from run()
+    once the moves completed before it have gone to on_moves (see below);
+    without on_moves, they are the exception's moves attribute.
+    destinations is the DestinationIndex that settles name conflicts in the
+    destination folders; by default a new one numbers the new item ('name (1).ext').
+    planned is an iterable of (ScanEntry, Destination) pairs, e.g. a MovePlan's
+    moves: they go straight to the planner, so the folder is neither listed nor
+    classified again (name conflicts are still checked against the destination).
+    reserved holds names in source_dir the scan passes over (e.g. the
+    destination's own folders when the destination is inside source_dir), as
+    it does copies still being written (see fastcopy.is_partial): they are
+    neither classified nor counted.
+    on_moves(tasks) is called from the thread that called run() with the
+    completed moves, MOVE_BATCH at a time and once more when the run ends, so
+    a long run never holds all of them; without it they are kept in result.moves.
+    """
+
+    def __init__(self, source_dir, dest_dir, classify, with_stat=True,
+                 queue_size=DEFAULT_QUEUE_SIZE, workers=DEFAULT_WORKERS,
+                 should_continue=None, on_progress=None, progress_interval=0.1, mover=None,
+                 snapshot=None, names=None, journal=None, destinations=None, planned=None, on_moves=None,
+                 reserved=()):
+        self.source_dir = source_dir
+        self.dest_dir = dest_dir
+        self.classify = classify
+        self.mover = mover
+        self.with_stat = with_stat
+        self.workers = max(1, workers)
+        self.should_continue = should_continue
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.snapshot = snapshot
+        self.names = names
+        self.journal = journal
+        self.planned = planned
+        self.reserved = reserved
+        self.destinations = destinations if destinations is not None else DestinationIndex()
+        self._known = None
+        self._seen_known = set()
+        self._leftovers = []
+        self._folders = {}  # Destination folder name -> (category folder, move mode), prepared once
+        self._completed = []  # Moves not yet handed to on_moves
+
+        self._entries = queue.Queue(queue_size)
+        self._classified = queue.Queue(queue_size)
+        self._tasks = queue.Queue(queue_size)
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._fatal = None
+        self.stats = PipelineStats()
+        self.result = PipelineResult(self.stats)
+        self.on_moves = on_moves if on_moves is not None else self.result.moves.extend
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        """Run all stages to completion and return the PipelineResult."""
+        if self.mover is None:
+            self.mover = MoveEngine(self.source_dir)
+        if self.mover.copier.on_bytes is None:
+            self.mover.copier.on_bytes = self.stats.bytes.add_done
+        if self.snapshot is not None:
+            try:
+                self._known = self.snapshot.load()
+            except (OSError, sqlite3.Error):
+                # The index only saves work; without it every entry is simply examined
+                self.snapshot.close()
+                self.snapshot = None
+        if self.planned is not None:
+            first_stages = (self._feed_stage,)
+        else:
+            first_stages = (self._scan_stage, self._classify_stage)
+        threads = [threading.Thread(target=self._guard, args=(stage,), daemon=True)
+                   for stage in first_stages + (self._plan_stage,)]
+        threads += [threading.Thread(target=self._guard, args=(self._execute_stage,), daemon=True)
+                    for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        copier = self.mover.copier
+        last_report = 0.0
+        alive = threads
+        try:
+            while alive or copier.pending:
+                if self.should_continue is not None and not self.should_continue():
+                    self._cancel.set()
+                if self._cancel.is_set():
+                    copier.cancel()
+                if alive:
+                    alive[0].join(self.progress_interval / 2)
+                    alive = [thread for thread in alive if thread.is_alive()]
+                else:
+                    copier.wait(self.progress_interval / 2)
+                self._hand_over_moves(MOVE_BATCH)
+                now = time.perf_counter()
+                self.stats.bytes.sample(now)
+                if self.on_progress and now - last_report >= self.progress_interval:
+                    last_report = now
+                    self.on_progress(self.stats)
+        finally:
+            self.mover.close()
+            self._hand_over_moves(1)
+            if self.journal is not None:
+                if self._fatal is None:
+                    # Every move has ended one way or the other: nothing is left to recover
+                    self.journal.close()
+                else:
+                    self.journal.keep()  # Offered for rollback at the next start
+            if self.snapshot is not None:
+                try:
+                    if self._fatal is None:
+                        # Only a complete listing proves that unseen known entries are gone
+                        complete = self.stats.scan_done and self.names is None
+                        self.snapshot.save(self._leftovers, self._seen_known if complete else None)
+                except (OSError, sqlite3.Error):
+                    pass
+                finally:
+                    self.snapshot.close()
+
+        if self._fatal is not None:
+            self._fatal.moves = self.result.moves  # So the caller can still record what was done
+            raise self._fatal
+        self.result.cancelled = self._cancel.is_set()
+        if self.on_progress:
+            self.on_progress(self.stats)
+        return self.result
+
+    def _hand_over_moves(self, at_least):
+        """Pass the completed moves to on_moves once at_least of them have piled up."""
+        with self._lock:
+            if len(self._completed) < at_least:
+                return
+            moves, self._completed = self._completed, []
+        try:
+            self.on_moves(moves)
+        except Exception as e:  # E.g. the undo history can't be written: stop as if a stage had failed
+            with self._lock:
+                if self._fatal is None:
+                    self._fatal = e
+            self._cancel.set()
+
+    # --- Queue helpers: never block forever, so a cancel always unwinds ---
+    def _put(self, q, item):
+        while not self._cancel.is_set():
+            try:
+                q.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        while not self._cancel.is_set():
+            try:
+                return q.get(timeout=0.05)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _guard(self, stage):
+        try:
+            stage()
+        except BaseException as e:  # Surface the first stage failure from run()
+            with self._lock:
+                if self._fatal is None:
+                    self._fatal = e
+            self._cancel.set()
+
+    # --- Stages ---
+    def _scan_stage(self):
+        stats = self.stats
+        if self.names is not None:
+            entries = scan_names(self.source_dir, self.names, self.with_stat)
+        else:
+            entries = scan_directory(self.source_dir, self.with_stat, self._skip_unchanged if self._known else None)
+        reserved = self.reserved
+        for entry in entries:
+            if entry.name in reserved or is_partial(entry.name):
+                continue
+            stats.scanned += 1
+            if not self._put(self._entries, entry):
+                return
+        stats.scan_done = True
+        self._put(self._entries, _DONE)
+
+    def _skip_unchanged(self, name, inode):
+        if self._known.get(name) != inode:
+            return False
+        self._seen_known.add(name)
+        self.stats.scanned += 1
+        self.stats.unchanged += 1
+        return True
+
+    def _feed_stage(self):
+        """Stand-in for scan and classify when running a plan made earlier."""
+        stats = self.stats
+        for pair in self.planned:
+            stats.scanned += 1
+            stats.classified += 1
+            if not self._put(self._classified, pair):
+                return
+        stats.scan_done = True
+        self._put(self._classified, _DONE)
+
+    def _classify_stage(self):
+        stats = self.stats
+        classify = self.classify
+        while True:
+            entry = self._get(self._entries)
+            if entry is _DONE:
+                break
+            destination = classify(entry)
+            stats.classified += 1
+            if destination is None:
+                with self._lock:
+                    stats.unmatched += 1
+                if self.snapshot is not None and entry.inode:
+                    self._leftovers.append((entry, None))
+                continue
+            if not self._put(self._classified, (entry, destination)):
+                return
+        self._put(self._classified, _DONE)
+
+    def _plan_stage(self):
+        stats = self.stats
+        resolve = self.destinations.resolve
+        folders = self._folders
+        while True:
+            item = self._get(self._classified)
+            if item is _DONE:
+                break
+            entry, destination = item
+            folder = folders.get(destination.folder_name)
+            if folder is None:
+                folder = folders[destination.folder_name] = self._prepare_folder(destination.folder_name)
+            category_dir, mode = folder
+            # No stat per item: the folder's names were listed once into the index
+            target, conflict = resolve(entry, category_dir)
+            if target is None:
+                stats.skipped += 1  # Left in place by the conflict policy
+                continue
+            if conflict == RESOLVED_RENAMED:
+                stats.renamed += 1
+            elif conflict == RESOLVED_REPLACED:
+                stats.replaced += 1
+            kind = "file" if entry.is_file else "folder"
+            seq = None
+            if self.journal is not None:
+                seq = self.journal.planned(entry.name, target, destination.category, kind, mode,
+                                           conflict == RESOLVED_REPLACED)
+            task = MoveTask(entry.name, entry.path, target, destination.category, kind, entry.size, mode, seq,
+                            conflict == RESOLVED_REPLACED)
+            if not self._put(self._tasks, task):
+                return
+            stats.planned += 1
+            stats.bytes.add_total(entry.size)
+        for _ in range(self.workers):
+            self._put(self._tasks, _DONE)
+
+    def _prepare_folder(self, folder_name):
+        """Create a category folder (and any parents) the first time an item is planned into it.
+
+        Done once per folder per run, together with its device lookup and its
+        listing for the conflict index, so neither the planner nor the executor
+        checks folder existence per item. folder_name may hold subfolders.
+        """
+        category_dir = os.path.join(self.dest_dir, folder_name)
+        os.makedirs(category_dir, exist_ok=True)
+        self.destinations.names(category_dir)
+        return category_dir, self.mover.mode_for(category_dir)
+
+    def _execute_stage(self):
+        move = self.mover.move
+        copier = self.mover.copier
+        journal = self.journal
+        while True:
+            task = self._get(self._tasks)
+            if task is _DONE:
+                return
+            if journal is not None:
+                journal.durable(task.seq)  # Write-ahead: the plan is on disk before anything moves
+            is_dir = task.kind == "folder"
+            # A copy that fails, or any error but a cancel, costs only this item; a cancel leaves it in place
+            if task.mode == MODE_COPY:
+                # Cross-device: the copy lanes run it; this worker moves on to the next task
+                try:
+                    copier.submit(task.source, task.destination, task.size, is_dir,
+                                  on_done=partial(self._copy_done, task))
+                except CopyCancelled:
+                    pass
+                except Exception as e:
+                    self._record_failure(task, e)
+                continue
+            try:
+                mode = move(task.source, task.destination, task.mode, task.size, is_dir, task.replace)
+            except CopyCancelled:
+                continue  # The same-device rename fell back to a copy (EXDEV) while the run was cancelled
+            except Exception as e:
+                self._record_failure(task, e)
+                continue
+            if mode != MODE_COPY:
+                # A rename lands every byte at once; the copier reports its own chunks
+                self.stats.bytes.add_done(task.size)
+            self._record_move(task, mode)
+
+    def _copy_done(self, task, future):
+        error = future.exception()
+        if error is None:
+            self._record_move(task, MODE_COPY)
+        elif not isinstance(error, CopyCancelled):
+            self._record_failure(task, error)
+
+    def _record_move(self, task, mode):
+        with self._lock:
+            self.stats.moved += 1
+            self.stats.categories[task.category] = self.stats.categories.get(task.category, 0) + 1
+            if mode == MODE_COPY:
+                self.stats.copied += 1
+            if task.kind == "folder":
+                self.stats.moved_folders += 1
+            self._completed.append(task)
+        if self.journal is not None:
+            self.journal.done(task.seq)
+
+    def _record_failure(self, task, error):
+        with self._lock:
+            self.stats.failed += 1
+            self.result.errors.append((task, str(error)))
+        if self.journal is not None:
+            self.journal.failed(task.seq)
@@ -0,0 +1,229 @@
+"""Dry runs: the full move plan of a run, worked out without writing anything.
+
+A PlanSource holds one scan of a source folder plus the listings of the
+destination folders it has looked at, so a plan can be worked out again from
+memory (e.g. while the user ticks categories on and off) without touching the
+disk. plan_moves() runs the same classifier and conflict policy as a real run
+and returns a MovePlan: per-category counts and bytes, and the entries to move.
+A MovePlan can be saved to a small compressed plan file and executed later
+(OrganizerEngine.organize(plan=...)) without listing the source folder again.
+"""
+
+import gzip
+import json
+import os
+import time
+
+from organizer_core.classifier import Destination
+from organizer_core.collisions import RESOLVED_RENAMED, RESOLVED_REPLACED, DestinationIndex
+from organizer_core.fastcopy import is_partial
+from organizer_core.progress import format_bytes
+from organizer_core.scanner import ScanEntry, scan_directory
+
+PLAN_VERSION = 1
+CHECK_EVERY = 4096  # Entries planned between should_continue() checks
+
+
+class PlanError(ValueError):
+    """A plan file that can't be read or was written by another version."""
+
+
+class PlanSource:
+    """One scan of a source folder and the destination listings seen while planning from it.
+
+    Not thread-safe: give each worker its own, or drop it (and make a new one)
+    instead of changing it while a worker plans from it.
+    """
+
+    __slots__ = ("source_dir", "entries", "listings")
+
+    def __init__(self):
+        self.source_dir = None
+        self.entries = None
+        self.listings = {}  # Destination folder -> its names on disk, as DestinationIndex lists them
+
+    def scanned(self, source_dir):
+        return self.entries is not None and self.source_dir == source_dir
+
+    def scan(self, source_dir, should_continue=None, reserved=()):
+        """List source_dir with stat data, leaving out the names a run passes over; return False if cancelled part-way.
+
+        reserved is as in OrganizePipeline; copies still being written are left out too.
+        """
+        entries = []
+        for entry in scan_directory(source_dir, with_stat=True):
+            if entry.name in reserved or is_partial(entry.name):
+                continue
+            entries.append(entry)
+            if len(entries) % CHECK_EVERY == 0 and should_continue is not None and not should_continue():
+                return False
+        self.source_dir = source_dir
+        self.entries = entries
+        self.listings = {}
+        return True
+
+
+class MovePlan:
+    """What a run would do: the entries to move and where, and the totals per category.
+
+    moves holds (ScanEntry, Destination) pairs in planning order; categories maps
+    each category to [items, bytes]. renamed, replaced and skipped count the name
+    conflicts the policy settled; unmatched counts entries left in place.
+    """
+
+    __slots__ = ("spec", "source_dir", "created", "moves", "categories", "unmatched", "renamed",
+                 "replaced", "skipped", "unavailable_types", "uncategorized_folders")
+
+    def __init__(self, spec, source_dir, created=None):
+        self.spec = spec
+        self.source_dir = source_dir
+        self.created = time.time() if created is None else created
+        self.moves = []
+        self.categories = {}
+        self.unmatched = self.renamed = self.replaced = self.skipped = 0
+        self.unavailable_types = set()
+        self.uncategorized_folders = set()
+
+    def __len__(self):
+        return len(self.moves)
+
+    @property
+    def total_bytes(self):
+        return sum(size for _, size in self.categories.values())
+
+    def describe(self):
+        """One-line summary for the status label."""
+        text = (f"Preview: {len(self.moves):,} item(s), {format_bytes(self.total_bytes)},"
+                f" would move into {len(self.categories):,} folder(s)")
+        left = self.unmatched + self.skipped
+        if left:
+            text += f" · {left:,} left in place"
+        conflicts = self.renamed + self.replaced + self.skipped
+        if conflicts:
+            text += f" · {conflicts:,} name conflict(s)"
+        return text + ". Nothing has been moved yet."
+
+    def breakdown(self):
+        """'Category: items (bytes)' lines, one per category, in category order."""
+        return "\n".join(f"{category}: {count:,} ({format_bytes(size)})"
+                         for category, (count, size) in sorted(self.categories.items()))
+
+    def to_dict(self):
+        """Columnar form for the plan file: the folder and categories are stored once, not per entry."""
+        destinations = {}
+        names, kinds, sizes, mtimes, targets = [], [], [], [], []
+        for entry, destination in self.moves:
+            names.append(entry.name)
+            kinds.append(1 if entry.is_dir else 0)
+            sizes.append(entry.size)
+            mtimes.append(entry.mtime)
+            targets.append(destinations.setdefault(destination, len(destinations)))
+        return {
+            "version": PLAN_VERSION,
+            "job": self.spec.to_dict(),
+            "source": self.source_dir,
+            "created": self.created,
+            "destinations": [list(destination) for destination in destinations],
+            "name": names, "is_dir": kinds, "size": sizes, "mtime": mtimes, "destination": targets,
+            "unmatched": self.unmatched, "renamed": self.renamed, "replaced": self.replaced,
+            "skipped": self.skipped,
+            "unavailable_types": sorted(self.unavailable_types),
+            "uncategorized_folders": sorted(self.uncategorized_folders),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        from organizer_core.job import JobSpec
+
+        if data.get("version") != PLAN_VERSION:
+            raise PlanError(f"Unsupported plan version {data.get('version')!r}")
+        plan = cls(JobSpec.from_dict(data["job"]), data["source"], data["created"])
+        destinations = [Destination(*destination) for destination in data["destinations"]]
+        join = os.path.join
+        source_dir = plan.source_dir
+        categories = plan.categories
+        for name, is_dir, size, mtime, target in zip(data["name"], data["is_dir"], data["size"],
+                                                     data["mtime"], data["destination"]):
+            destination = destinations[target]
+            plan.moves.append((ScanEntry(name, join(source_dir, name), not is_dir, bool(is_dir), size, mtime, 0, 0),
+                               destination))
+            totals = categories.get(destination.category)
+            if totals is None:
+                totals = categories[destination.category] = [0, 0]
+            totals[0] += 1
+            totals[1] += size
+        plan.unmatched = data["unmatched"]
+        plan.renamed = data["renamed"]
+        plan.replaced = data["replaced"]
+        plan.skipped = data["skipped"]
+        plan.unavailable_types = set(data["unavailable_types"])
+        plan.uncategorized_folders = set(data["uncategorized_folders"])
+        return plan
+
+
+def plan_moves(engine, source, should_continue=None):
+    """Plan engine's job for the folder source (a scanned PlanSource) and return the MovePlan.
+
+    Nothing is created or moved: category folders that don't exist yet simply
+    have no names. Returns None if should_continue() turns False part-way.
+    """
+    spec = engine.spec
+    plan = MovePlan(spec, source.source_dir)
+    classify = engine.classify
+    index = DestinationIndex(spec.on_conflict, listings=source.listings)
+    resolve = index.resolve
+    dest_dir = spec.destination
+    folders = {}
+    moves = plan.moves
+    categories = plan.categories
+    for count, entry in enumerate(source.entries, 1):
+        if count % CHECK_EVERY == 0 and should_continue is not None and not should_continue():
+            return None
+        destination = classify(entry)
+        if destination is None:
+            plan.unmatched += 1
+            continue
+        folder = folders.get(destination.folder_name)
+        if folder is None:
+            folder = folders[destination.folder_name] = os.path.join(dest_dir, destination.folder_name)
+        target, conflict = resolve(entry, folder)
+        if target is None:
+            plan.skipped += 1
+            continue
+        if conflict == RESOLVED_RENAMED:
+            plan.renamed += 1
+        elif conflict == RESOLVED_REPLACED:
+            plan.replaced += 1
+        moves.append((entry, destination))
+        totals = categories.get(destination.category)
+        if totals is None:
+            totals = categories[destination.category] = [0, 0]
+        totals[0] += 1
+        totals[1] += entry.size
+    plan.unavailable_types = set(engine.unavailable_types)
+    plan.uncategorized_folders = set(engine.uncategorized_folders)
+    return plan
+
+
+def save_plans(path, plans):
+    """Write plans to a gzip-compressed JSON plan file (atomically: a partial file never replaces a good one)."""
+    tmp_path = path + ".tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        json.dump({"version": PLAN_VERSION, "plans": [plan.to_dict() for plan in plans]}, f,
+                  separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def load_plans(path):
+    """Read a plan file written by save_plans(); return its MovePlans."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise PlanError(f"Can't read plan file {path}: {e}")
+    if not isinstance(data, dict) or data.get("version") != PLAN_VERSION:
+        raise PlanError(f"{path} is not a plan file of this version")
+    try:
+        return [MovePlan.from_dict(plan) for plan in data["plans"]]
+    except (KeyError, TypeError, ValueError) as e:
+        raise PlanError(f"Damaged plan file {path}: {e}")
@@ -0,0 +1,94 @@
+"""Byte-level progress: totals, throughput over a moving window, and ETA."""
+
+import threading
+import time
+from collections import deque
+
+DEFAULT_WINDOW = 5.0  # Seconds of history used for the MB/s figure
+
+
+class ProgressTracker:
+    """Counts bytes to move and bytes moved, from any number of threads.
+
+    add_total() is called as work is planned, add_done() as bytes land (a whole
+    file for a rename, one chunk at a time for a copy). sample() records a
+    (time, bytes_done) point; throughput() and eta() are computed from the
+    points inside the last `window` seconds, so one slow or fast burst doesn't
+    swing the estimate.
+    """
+
+    __slots__ = ("total", "done", "window", "_samples", "_lock")
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.total = 0
+        self.done = 0
+        self.window = window
+        self._samples = deque()
+        self._lock = threading.Lock()
+
+    def add_total(self, nbytes):
+        if nbytes:
+            with self._lock:
+                self.total += nbytes
+
+    def add_done(self, nbytes):
+        if nbytes:
+            with self._lock:
+                self.done += nbytes
+
+    def sample(self, now=None):
+        """Record the current byte count; call it regularly (the pipeline does, every tick)."""
+        now = time.perf_counter() if now is None else now
+        samples = self._samples
+        samples.append((now, self.done))
+        while len(samples) > 2 and now - samples[1][0] >= self.window:
+            samples.popleft()
+
+    def fraction(self):
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    def throughput(self):
+        """Bytes per second over the moving window (0.0 until there are two samples)."""
+        samples = self._samples
+        if len(samples) < 2:
+            return 0.0
+        (t0, b0), (t1, b1) = samples[0], samples[-1]
+        return (b1 - b0) / (t1 - t0) if t1 > t0 else 0.0
+
+    def eta(self):
+        """Seconds left at the current throughput, or None when it can't be estimated."""
+        rate = self.throughput()
+        remaining = self.total - self.done
+        if remaining <= 0:
+            return 0.0
+        return remaining / rate if rate > 0 else None
+
+    def describe(self):
+        """'1.2 GB of 40.0 GB · 85.3 MB/s · ETA 7m 41s' for the status label."""
+        text = f"{format_bytes(self.done)} of {format_bytes(self.total)}"
+        rate = self.throughput()
+        if rate > 0:
+            text += f" · {format_bytes(rate)}/s"
+            eta = self.eta()
+            if eta:
+                text += f" · ETA {format_duration(eta)}"
+        return text
+
+
+def format_bytes(nbytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(nbytes) < 1024:
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:.1f} TB"
+
+
+def format_duration(seconds):
+    seconds = int(seconds + 0.5)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
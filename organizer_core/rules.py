@@ -0,0 +1,382 @@
+"""User-defined rules: send items to a folder by size, age, name pattern or path.
+
+A rule names a destination folder and any of these conditions, which must
+all hold (a list within one condition means any of its items):
+
+    {"folder": "Large Docs", "extensions": [".pdf"], "min_size": "50MB"}
+    {"folder": "Archive", "older_than": "1y"}
+    {"folder": "Invoices", "names": ["invoice_*"], "regex": "^INV-\\d+"}
+    {"folder": "From Downloads", "paths": ["*/Downloads/*"]}
+
+names and paths are case-insensitive globs on the entry's name and full path,
+regex is searched for in the name (names and regex together are one
+condition: any of them may match); sizes take B/KB/MB/GB/TB, ages a number of
+days or h/d/w/m/y; kind is "file" (the default), "folder" or "any".
+
+Rules are checked in order, before the profile's categories, and the first
+one that holds decides. A RuleSet compiles them once per run: ages become
+mtime cutoffs, and the name patterns of all rules (and the path patterns) are
+merged into one alternation, so a name no pattern matches is dismissed in one
+regex call. Only the stat data the scanner already holds is looked at.
+"""
+
+import fnmatch
+import json
+import os
+import re
+import time
+from collections import namedtuple
+
+from organizer_core.appdata import app_data_dir
+from organizer_core.classifier import Destination
+
+RULE_KINDS = ("file", "folder", "any")
+
+_SIZE_UNITS = {"": 1, "b": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4}
+_AGE_UNITS = {"": 1.0, "h": 1 / 24, "d": 1.0, "w": 7.0, "m": 30.0, "y": 365.0}  # In days
+_QUANTITY = re.compile(r"\s*(\d+(?:\.\d*)?)\s*([a-zA-Z]*)\s*")
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+# Group references (\1, (?P=name), (?(1)...)), which would point elsewhere once the pattern is merged
+_GROUP_REFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?P=|\(\?\()")
+_UNSET = object()  # Pattern not tried yet for this entry
+
+# One rule, normalized: patterns and extensions as tuples, sizes in bytes, ages in days (None: no limit)
+Rule = namedtuple("Rule", "folder names regex paths extensions min_size max_size older_than newer_than kind",
+                  defaults=((), (), (), (), None, None, None, None, "file"))
+
+
+class RuleError(ValueError):
+    """A rule that can't be used as written."""
+
+
+def parse_rules(rules):
+    """Normalize a list of rule dicts (or Rules) into a tuple of Rules; raise RuleError if one is invalid."""
+    if rules is None:
+        return ()
+    if isinstance(rules, dict) or not isinstance(rules, (list, tuple)):
+        raise RuleError("Rules must be a list of rule objects")
+    return tuple(rule if isinstance(rule, Rule) else _parse_rule(rule, number)
+                 for number, rule in enumerate(rules, 1))
+
+
+def rule_to_dict(rule):
+    """The JSON form of a Rule, without the conditions it doesn't use."""
+    data = {"folder": rule.folder}
+    for field in Rule._fields[1:]:
+        value = getattr(rule, field)
+        if value and field != "kind":
+            data[field] = list(value) if isinstance(value, tuple) else value
+    if rule.kind != "file":
+        data["kind"] = rule.kind
+    return data
+
+
+def rules_path(profile):
+    """Where the apps keep a profile's rules (pass it to the CLI with --rules)."""
+    return os.path.join(app_data_dir(), f"rules-{profile}.json")
+
+
+def load_rules(path):
+    """Read a JSON rules file; a missing file means no rules."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return ()
+    except (OSError, ValueError) as e:
+        raise RuleError(f"Can't read rules file {path}: {e}")
+    return parse_rules(data)
+
+
+def save_rules(path, rules):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump([rule_to_dict(rule) for rule in rules], f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def _parse_rule(data, number):
+    if not isinstance(data, dict):
+        raise RuleError(f"Rule {number} must be an object")
+    unknown = set(data) - set(Rule._fields)
+    if unknown:
+        raise RuleError(f"Rule {number}: unknown key(s) {', '.join(sorted(unknown))}")
+    folder = str(data.get("folder") or "").strip().strip("/\\")
+    if not folder:
+        raise RuleError(f"Rule {number} needs a 'folder'")
+    if os.path.isabs(folder) or ".." in re.split(r"[/\\]", folder):
+        raise RuleError(f"Rule {number}: 'folder' must be a folder name inside the destination, not {folder!r}")
+    kind = data.get("kind", "file")
+    if kind not in RULE_KINDS:
+        raise RuleError(f"Rule {number}: 'kind' must be one of {', '.join(RULE_KINDS)}")
+
+    regex = _strings(data.get("regex"), number, "regex")
+    for pattern in regex:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise RuleError(f"Rule {number}: bad regex {pattern!r}: {e}")
+    extensions = tuple(ext.lower() if ext.startswith(".") else "." + ext.lower()
+                       for ext in _strings(data.get("extensions"), number, "extensions") if ext.strip("."))
+    rule = Rule(folder, _strings(data.get("names"), number, "names"), regex,
+                _strings(data.get("paths"), number, "paths"), extensions,
+                _quantity(data.get("min_size"), _SIZE_UNITS, number, "min_size", int),
+                _quantity(data.get("max_size"), _SIZE_UNITS, number, "max_size", int),
+                _quantity(data.get("older_than"), _AGE_UNITS, number, "older_than", float),
+                _quantity(data.get("newer_than"), _AGE_UNITS, number, "newer_than", float),
+                kind)
+    if rule == Rule(folder, kind=kind):
+        raise RuleError(f"Rule {number} ({folder}) has no conditions, so it would take every item")
+    return rule
+
+
+def _strings(value, number, field):
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, (list, tuple)) or not all(isinstance(item, str) and item for item in value):
+        raise RuleError(f"Rule {number}: '{field}' must be a string or a list of strings")
+    return tuple(value)
+
+
+def _quantity(value, units, number, field, kind):
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise RuleError(f"Rule {number}: bad '{field}' value {value!r}")
+    if isinstance(value, (int, float)):
+        amount, scale = value, 1
+    else:
+        match = _QUANTITY.fullmatch(str(value))
+        scale = units.get(match.group(2).lower()) if match else None
+        if scale is None:
+            raise RuleError(f"Rule {number}: bad '{field}' value {value!r} (e.g. {'50MB' if kind is int else '1y'})")
+        amount = float(match.group(1))
+    if amount < 0:
+        raise RuleError(f"Rule {number}: '{field}' can't be negative")
+    return kind(amount * scale)
+
+
+# --- Compiled form ---
+class _CompiledRule:
+    __slots__ = ("index", "destination", "files", "folders", "extensions", "min_size", "max_size",
+                 "mtime_before", "mtime_after", "name_pattern", "path_pattern")
+
+
+class _Alternation:
+    """The patterns of several rules merged into one regex.
+
+    first(text) returns the position of the first rule with a pattern matching
+    text (None when none does); later rules are only tried on their own when
+    that rule was passed over for another reason. A pattern that refers to its
+    own groups is never merged (the group numbers would shift), and is always
+    tried on its own.
+    """
+
+    __slots__ = ("regex", "positions", "alone")
+
+    def __init__(self, patterns):
+        # patterns: [(rule position, regex source)], in priority order
+        self.positions = {}
+        self.alone = frozenset(position for position, source in patterns if _GROUP_REFERENCE.search(source))
+        parts = []
+        group = 1
+        for position, source in patterns:
+            if position in self.alone:
+                continue
+            self.positions[group] = position
+            parts.append(f"({source})")
+            group += 1 + re.compile(source).groups
+        try:
+            self.regex = re.compile("|".join(parts)) if parts else None
+        except re.error:
+            self.regex = None  # E.g. two rules use the same group name: each rule is tried on its own
+
+    def first(self, text):
+        if self.regex is None:
+            return -1
+        match = self.regex.match(text)
+        return None if match is None else self.positions[match.lastindex]
+
+    def holds(self, hit, rule_position, pattern, text):
+        """Whether pattern (the rule at rule_position's) matches text, given first(text) as hit."""
+        if rule_position in self.alone:
+            return pattern.match(text) is not None
+        if hit is None:
+            return False
+        if hit == rule_position:
+            return True
+        if hit > rule_position:
+            return False  # An earlier alternative would have matched first
+        return pattern.match(text) is not None
+
+
+def _pattern_source(globs, regexes):
+    """One regex, to be used with match(), for 'any of these globs or regexes'."""
+    parts = [f"(?i:{fnmatch.translate(glob)})" for glob in globs]
+    for regex in regexes:
+        flags = _GLOBAL_FLAGS.match(regex)
+        if flags:
+            regex = f"(?{flags.group(1)}:{regex[flags.end():]})"  # Leading (?i) can't stay global once merged
+        # search() semantics for match(): an anchored regex needs no scan for its start
+        anchored = regex.startswith("^") and "|" not in regex
+        parts.append(f"(?:{regex})" if anchored else f"(?s:.*?)(?:{regex})")
+    return "|".join(parts) if parts else None
+
+
+class RuleSet:
+    """Rules compiled for one run; match(entry) returns the Destination of the first rule that holds.
+
+    Only rules for the kinds of items the run organizes are kept. Ages are
+    measured from now (the time of compiling), so a run sees one clock.
+    """
+
+    def __init__(self, rules, files=True, folders=False, now=None):
+        now = time.time() if now is None else now
+        compiled = []
+        names = []
+        paths = []
+        for rule in rules:
+            takes_files = rule.kind in ("file", "any") and files
+            takes_folders = rule.kind in ("folder", "any") and folders
+            if not takes_files and not takes_folders:
+                continue
+            item = _CompiledRule()
+            item.index = len(compiled)
+            item.destination = Destination(rule.folder, rule.folder)
+            item.files = takes_files
+            item.folders = takes_folders
+            item.extensions = rule.extensions
+            item.min_size = rule.min_size
+            item.max_size = rule.max_size
+            item.mtime_before = None if rule.older_than is None else now - rule.older_than * 86400
+            item.mtime_after = None if rule.newer_than is None else now - rule.newer_than * 86400
+            name_source = _pattern_source(rule.names, rule.regex)
+            path_source = _pattern_source(rule.paths, ())
+            item.name_pattern = None if name_source is None else re.compile(name_source)
+            item.path_pattern = None if path_source is None else re.compile(path_source)
+            if name_source is not None:
+                names.append((item.index, name_source))
+            if path_source is not None:
+                paths.append((item.index, path_source))
+            compiled.append(item)
+        self._rules = tuple(compiled)
+        self._names = _Alternation(names)
+        self._paths = _Alternation(paths)
+        self.destinations = tuple(rule.destination for rule in compiled)
+        # Size and age limits decide on more than the name and inode the snapshot index keys leftovers by
+        self.uses_stat = any(rule.min_size is not None or rule.max_size is not None or
+                             rule.mtime_before is not None or rule.mtime_after is not None for rule in compiled)
+
+    def __len__(self):
+        return len(self._rules)
+
+    def match(self, entry):
+        """The Destination of the first rule entry satisfies, or None."""
+        name_hit = path_hit = _UNSET
+        lowered = None
+        names, paths = self._names, self._paths
+        for rule in self._rules:
+            if not (rule.files if entry.is_file else entry.is_dir and rule.folders):
+                continue
+            if rule.extensions:
+                if lowered is None:
+                    lowered = entry.name.lower()
+                if not lowered.endswith(rule.extensions):
+                    continue
+            if rule.min_size is not None and entry.size < rule.min_size:
+                continue
+            if rule.max_size is not None and entry.size > rule.max_size:
+                continue
+            if rule.mtime_before is not None and not entry.mtime < rule.mtime_before:
+                continue
+            if rule.mtime_after is not None and not entry.mtime >= rule.mtime_after:
+                continue
+            if rule.name_pattern is not None:
+                if name_hit is _UNSET:
+                    name_hit = names.first(entry.name)
+                if not names.holds(name_hit, rule.index, rule.name_pattern, entry.name):
+                    continue
+            if rule.path_pattern is not None:
+                path = _slashed(entry.path)
+                if path_hit is _UNSET:
+                    path_hit = paths.first(path)
+                if not paths.holds(path_hit, rule.index, rule.path_pattern, path):
+                    continue
+            return rule.destination
+        return None
+
+    def apply_to_columns(self, columns, codes, first_code):
+        """match() for a whole ScanColumns (batch runs): rows a rule takes get code first_code + its position.
+
+        Kind, size and age are checked as array masks; extensions through the
+        columns' extension ids; patterns only for the rows still in question,
+        through the same merged alternations as match().
+        """
+        import numpy
+
+        from organizer_core.batch import KIND_DIR, KIND_FILE
+
+        kinds = columns.kinds
+        ext_ids = columns.ext_ids
+        names = columns.names
+        undecided = numpy.ones(len(columns), numpy.bool_)
+        name_hits = {}
+        path_hits = {}
+        is_file = kinds == KIND_FILE
+        is_dir = kinds == KIND_DIR
+        for rule in self._rules:
+            mask = undecided & ((is_file | is_dir) if rule.files and rule.folders else is_file if rule.files
+                                else is_dir)
+            if rule.min_size is not None:
+                mask &= columns.sizes >= rule.min_size
+            if rule.max_size is not None:
+                mask &= columns.sizes <= rule.max_size
+            if rule.mtime_before is not None:
+                mask &= columns.mtimes < rule.mtime_before
+            if rule.mtime_after is not None:
+                mask &= columns.mtimes >= rule.mtime_after
+            if rule.extensions:
+                # A row's last extension settles it, unless a rule extension is compound ('.tar.gz')
+                # or the name has no extension of its own ('.pdf' alone): those rows check the name
+                exact = numpy.array([ext in rule.extensions for ext in columns.extensions], numpy.bool_)
+                unsure = numpy.array([not ext or any(wanted.endswith(ext) and wanted != ext
+                                                     for wanted in rule.extensions)
+                                      for ext in columns.extensions], numpy.bool_)
+                unsure_rows = numpy.flatnonzero(mask & unsure[ext_ids])
+                mask &= exact[ext_ids]
+                taken = [row for row in unsure_rows.tolist() if names[row].lower().endswith(rule.extensions)]
+                if taken:
+                    mask[taken] = True
+            rows = numpy.flatnonzero(mask)
+            if rule.name_pattern is not None or rule.path_pattern is not None:
+                rows = [row for row in rows.tolist() if self._patterns_hold(rule, columns, row, name_hits, path_hits)]
+            if len(rows):
+                codes[rows] = first_code + rule.index
+                undecided[rows] = False
+        return codes
+
+    def _patterns_hold(self, rule, columns, row, name_hits, path_hits):
+        name = columns.names[row]
+        if rule.name_pattern is not None:
+            hit = name_hits.get(row, _UNSET)
+            if hit is _UNSET:
+                hit = name_hits[row] = self._names.first(name)
+            if not self._names.holds(hit, rule.index, rule.name_pattern, name):
+                return False
+        if rule.path_pattern is not None:
+            path = _slashed(os.path.join(columns.source_dir, name))
+            hit = path_hits.get(row, _UNSET)
+            if hit is _UNSET:
+                hit = path_hits[row] = self._paths.first(path)
+            if not self._paths.holds(hit, rule.index, rule.path_pattern, path):
+                return False
+        return True
+
+
+def _slashed(path):
+    """Path globs are written with '/', whatever the platform."""
+    return path if os.sep == "/" else path.replace(os.sep, "/")
+
@@ -0,0 +1,71 @@
+"""Single-pass directory scanner shared by the Personal, Office and Media organizers."""
+
+import os
+import stat
+from collections import namedtuple
+
+# Compact record for one directory entry. size/mtime/inode/dev are only
+# filled in when the scan asks for stat data, otherwise they stay 0.
+ScanEntry = namedtuple("ScanEntry", "name path is_file is_dir size mtime inode dev")
+
+
+def scan_directory(source_dir, with_stat=False, skip=None):
+    """Yield a ScanEntry for every item directly inside source_dir.
+
+    The directory is listed exactly once with os.scandir. File/folder type comes
+    from the cached DirEntry type, so no extra stat call is made per entry unless
+    with_stat is requested (and on Windows even that is served from the listing).
+    skip(name, inode) is called first for each entry, with the inode the listing
+    already holds on POSIX; entries it returns True for are not yielded or stat'ed.
+    """
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            if skip is not None:
+                try:
+                    if skip(entry.name, entry.inode()):
+                        continue
+                except OSError:
+                    pass
+            try:
+                is_file = entry.is_file()
+                is_dir = not is_file and entry.is_dir()
+            except OSError:
+                # Vanished or unreadable entry: report it as neither file nor folder
+                is_file = is_dir = False
+
+            if with_stat and (is_file or is_dir):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    yield ScanEntry(entry.name, entry.path, is_file, is_dir, 0, 0.0, 0, 0)
+                    continue
+                yield ScanEntry(entry.name, entry.path, is_file, is_dir,
+                                st.st_size if is_file else 0, st.st_mtime, st.st_ino, st.st_dev)
+            else:
+                yield ScanEntry(entry.name, entry.path, is_file, is_dir, 0, 0.0, 0, 0)
+
+
+def scan_files(source_dir, with_stat=False):
+    """Return only the regular files in source_dir as a list (one listing, no recount)."""
+    return [entry for entry in scan_directory(source_dir, with_stat) if entry.is_file]
+
+
+def scan_names(source_dir, names, with_stat=False):
+    """Yield a ScanEntry for each of names inside source_dir that still exists.
+
+    Used when only a few known entries changed (e.g. by watch mode), so the rest
+    of the folder isn't listed again. Each name costs one stat call.
+    """
+    for name in names:
+        path = os.path.join(source_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        is_dir = stat.S_ISDIR(st.st_mode)
+        is_file = stat.S_ISREG(st.st_mode)
+        if with_stat:
+            yield ScanEntry(name, path, is_file, is_dir, st.st_size if is_file else 0, st.st_mtime,
+                            st.st_ino, st.st_dev)
+        else:
+            yield ScanEntry(name, path, is_file, is_dir, 0, 0.0, 0, 0)
@@ -0,0 +1,114 @@
+"""Persistent index of the entries a previous run left in a source folder."""
+
+import hashlib
+import os
+import sqlite3
+import time
+
+from organizer_core.appdata import app_data_dir
+
+DB_NAME = "snapshots.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    updated REAL NOT NULL,
+    UNIQUE (path, profile)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    source_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    classification TEXT,
+    PRIMARY KEY (source_id, name)
+) WITHOUT ROWID;
+"""
+
+
+def snapshot_signature(*settings):
+    """Stable hash of everything that decides how entries are classified.
+
+    Pass the selected categories, custom folder names, mode, etc. If any of them
+    change between runs, the old index no longer applies and is discarded.
+    """
+    return hashlib.sha1(repr(settings).encode("utf-8")).hexdigest()
+
+
+class SnapshotIndex:
+    """(name, inode, size, mtime, classification) of the entries left in one source folder.
+
+    load() returns {name: inode} for entries that the last run with the same
+    profile and signature left in place; the scanner skips entries that still
+    have that name and inode before stat'ing them, so only new, renamed or
+    replaced entries are stat'ed and classified. (Editing a file in place keeps
+    its inode; that is fine because its name, and so its category, is the
+    same.) save() writes just the delta: new leftovers are added and, after a
+    complete scan, entries that have disappeared are dropped. profile keeps
+    different organizers (Personal, Office, Media) on the same folder apart.
+    """
+
+    def __init__(self, source_dir, profile, signature, db_path=None):
+        self.source_dir = os.path.normcase(os.path.abspath(source_dir))
+        self.profile = profile
+        self.signature = signature
+        self.db_path = db_path
+        self._conn = None
+        self._source_id = None
+        self.known = {}
+
+    def _connect(self):
+        if self._conn is None:
+            if self.db_path is None:
+                self.db_path = os.path.join(app_data_dir(), DB_NAME)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def load(self):
+        """Read the previous run's leftovers; an index built with other settings is cleared."""
+        conn = self._connect()
+        row = conn.execute("SELECT id, signature FROM sources WHERE path = ? AND profile = ?",
+                           (self.source_dir, self.profile)).fetchone()
+        with conn:
+            if row is None:
+                cur = conn.execute("INSERT INTO sources (path, profile, signature, updated) VALUES (?, ?, ?, ?)",
+                                   (self.source_dir, self.profile, self.signature, time.time()))
+                self._source_id = cur.lastrowid
+            else:
+                self._source_id = row[0]
+                if row[1] != self.signature:
+                    conn.execute("DELETE FROM entries WHERE source_id = ?", (self._source_id,))
+                    conn.execute("UPDATE sources SET signature = ? WHERE id = ?", (self.signature, self._source_id))
+        self.known = dict(conn.execute("SELECT name, inode FROM entries WHERE source_id = ?",
+                                       (self._source_id,)))
+        return self.known
+
+    def save(self, leftovers, seen_known=None):
+        """Record this run's result.
+
+        leftovers is a list of (ScanEntry, classification) for new entries that
+        were left in place (classification None means no category matched).
+        seen_known is the set of known names that were seen again; pass it only
+        after a complete scan, so every other known name is treated as gone.
+        """
+        conn = self._connect()
+        with conn:
+            if seen_known is not None:
+                gone = [(self._source_id, name) for name in self.known if name not in seen_known]
+                conn.executemany("DELETE FROM entries WHERE source_id = ? AND name = ?", gone)
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries (source_id, name, inode, size, mtime, classification)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(self._source_id, entry.name, entry.inode, entry.size, entry.mtime, classification)
+                 for entry, classification in leftovers])
+            conn.execute("UPDATE sources SET updated = ? WHERE id = ?", (time.time(), self._source_id))
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
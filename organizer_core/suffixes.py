@@ -0,0 +1,63 @@
+"""Longest-suffix lookup so compound extensions such as .tar.gz can be classified."""
+
+import os
+from types import MappingProxyType
+
+
+class SuffixIndex:
+    """Resolves the longest known suffix of a file name in one pass over its tail.
+
+    os.path.splitext only ever returns the last extension ('.gz' for 'x.tar.gz'),
+    so compound entries like '.tar.gz' could never match. The index remembers how
+    long and how many dots its longest suffix has, looks only at that much of the
+    name's tail, and probes the candidate suffixes longest-first. Leading dots are
+    treated like splitext does: '.bashrc' has no extension.
+    """
+
+    __slots__ = ("table", "max_length", "max_dots")
+
+    def __init__(self, suffixes):
+        table = {suffix.lower(): value for suffix, value in suffixes.items() if suffix}
+        self.table = MappingProxyType(table)
+        self.max_length = max((len(suffix) for suffix in table), default=0)
+        self.max_dots = max((suffix.count(".") for suffix in table), default=0)
+
+    def __len__(self):
+        return len(self.table)
+
+    def match(self, name):
+        """Return (suffix, value) for the longest indexed suffix of name.
+
+        When nothing matches, the value is None and suffix is the plain
+        splitext-style extension, which is what callers report as uncategorized.
+        """
+        table = self.table
+        start = len(name) - self.max_length
+        if start < 0:
+            start = 0
+        tail = name[start:].lower()
+        # A suffix must be preceded by at least one non-dot character
+        lowest = -1
+        if name[:1] == ".":
+            lowest = max(len(name) - len(name.lstrip(".")) - start, -1)
+
+        last = tail.rfind(".")
+        if last <= lowest:
+            return os.path.splitext(name)[1].lower(), None
+
+        # Walk further dots leftwards; each hit is a longer suffix than the previous one
+        best = None
+        pos = last
+        for _ in range(self.max_dots - 1):
+            pos = tail.rfind(".", 0, pos)
+            if pos <= lowest:
+                break
+            value = table.get(tail[pos:])
+            if value is not None:
+                best = pos
+                best_value = value
+        if best is not None:
+            return tail[best:], best_value
+
+        ext = tail[last:]
+        return ext, table.get(ext)
@@ -0,0 +1,218 @@
+"""Undo a run from the UndoHistory off the GUI thread: parallel, cancellable, with progress.
+
+Moves are read back from the history a batch at a time and put back the same
+way they were made: a rename when the item's folder and its original folder
+are on the same device (one device lookup per pair of folders), a copy
+through the CopyExecutor's parallel per-device lanes otherwise. Renames are
+made in order by the thread that reads the history: the file system
+serializes renames between folders anyway, so extra rename threads would only
+add hand-off cost. When the undo ends, the moves it dealt with are dropped
+from the history in one statement (they form a range, as moves are read
+newest first); failed or cancelled ones stay, so the undo can simply be
+started again for whatever is left. After a crash nothing is dropped, and
+the next undo finds the items already put back gone from their folders.
+"""
+
+import os
+import threading
+import time
+from functools import partial
+
+from organizer_core.copier import CopyCancelled
+from organizer_core.devices import device_of
+from organizer_core.mover import MODE_COPY, MODE_RENAME, MoveEngine
+
+
+class UndoStats:
+    """Counters updated by the undo threads and read by the reporter."""
+
+    __slots__ = ("total", "restored", "copied", "missing", "failed", "started")
+
+    def __init__(self, total):
+        self.total = total
+        self.restored = self.copied = self.missing = self.failed = 0
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return max(time.perf_counter() - self.started, 1e-6)
+
+    @property
+    def finished(self):
+        return self.restored + self.missing + self.failed
+
+    def fraction(self):
+        return self.finished / self.total if self.total else 1.0
+
+    def describe(self):
+        text = (f"Restored {self.restored:,} of {self.total:,} ({self.restored / self.elapsed:,.0f}/s)")
+        if self.copied:
+            text += f" · {self.copied:,} copied back across drives"
+        if self.missing:
+            text += f" · {self.missing:,} no longer there"
+        if self.failed:
+            text += f" · {self.failed:,} failed"
+        return text
+
+
+class UndoResult:
+    """What an undo did; errors are (UndoMove, message) for items that were left where they are."""
+
+    __slots__ = ("restored", "missing", "errors", "cancelled", "stats")
+
+    def __init__(self, stats):
+        self.restored = 0
+        self.missing = 0
+        self.errors = []
+        self.cancelled = False
+        self.stats = stats
+
+
+class UndoPipeline:
+    """Puts back the moves of one history run.
+
+    Items that are no longer where the run put them are counted as missing and
+    dropped from the history; items whose original name is taken again, or
+    that can't be moved, are reported in result.errors and stay in the history.
+    on_progress(stats) is called from the thread that called run(), at most
+    every progress_interval seconds and once more at the end.
+    """
+
+    def __init__(self, history, run, should_continue=None, on_progress=None, progress_interval=0.1, mover=None):
+        self.history = history
+        self.run_id = run.id
+        self.mover = mover if mover is not None else MoveEngine(run.source_dir)
+        self.should_continue = should_continue
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.stats = UndoStats(run.items)
+        self.result = UndoResult(self.stats)
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._fatal = None
+        self._reached = None         # Lowest seq the stage has dealt with (moves come newest first)
+        self._kept = []              # seqs to keep in the history: failed or cancelled
+        self._source_dirs = set()    # Original folders known to exist
+        self._modes = {}             # (folder, original folder) -> MODE_RENAME or MODE_COPY
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        """Undo until done or cancelled and return the UndoResult."""
+        stage = threading.Thread(target=self._guard, args=(self._undo_stage,), daemon=True)
+        stage.start()
+
+        copier = self.mover.copier
+        last_report = 0.0
+        try:
+            while stage.is_alive() or copier.pending:
+                if self.should_continue is not None and not self.should_continue():
+                    self._cancel.set()
+                if self._cancel.is_set():
+                    copier.cancel()
+                if stage.is_alive():
+                    stage.join(self.progress_interval / 2)
+                else:
+                    copier.wait(self.progress_interval / 2)
+                now = time.perf_counter()
+                if self.on_progress and now - last_report >= self.progress_interval:
+                    last_report = now
+                    self.on_progress(self.stats)
+        finally:
+            self.mover.close()
+            if self._reached is not None:
+                self.history.forget(self.run_id, self._reached, self._kept)
+
+        if self._fatal is not None:
+            raise self._fatal
+        self.result.cancelled = self._cancel.is_set()
+        if self.on_progress:
+            self.on_progress(self.stats)
+        return self.result
+
+    def _guard(self, stage):
+        try:
+            stage()
+        except BaseException as e:  # Surface the first stage failure from run()
+            with self._lock:
+                if self._fatal is None:
+                    self._fatal = e
+            self._cancel.set()
+
+    # --- Stage ---
+    def _undo_stage(self):
+        move_back = self.mover.move
+        copier = self.mover.copier
+        lexists = os.path.lexists
+        for move in self.history.moves(self.run_id):
+            if self._cancel.is_set():
+                return
+            destination, source = move.destination, move.source
+            self._reached = move.seq
+            if not lexists(destination):
+                with self._lock:
+                    self.stats.missing += 1
+                    self.result.missing += 1
+                continue
+            if lexists(source):
+                # Never overwrite: something new has taken the item's old name
+                self._record_failure(move, f"'{move.source_name}' already exists in {move.source_dir}")
+                continue
+            is_dir = move.kind == "folder"
+            try:
+                self._ensure_source_dir(move.source_dir)
+                mode = self._mode(move.dest_dir, move.source_dir)
+                if mode == MODE_COPY:
+                    # Cross-device: the copy lanes run it while this thread goes on with the next move
+                    copier.submit(destination, source, None, is_dir, on_done=partial(self._copy_done, move))
+                    continue
+                mode = move_back(destination, source, mode, None, is_dir)
+            except OSError as e:
+                self._record_failure(move, str(e))
+                continue
+            self._record_restored(move, mode)
+
+    def _mode(self, folder, original):
+        key = (folder, original)
+        mode = self._modes.get(key)
+        if mode is None:
+            mode = MODE_RENAME if device_of(folder) == device_of(original) else MODE_COPY
+            with self._lock:
+                self._modes[key] = mode
+        return mode
+
+    def _ensure_source_dir(self, path):
+        if path not in self._source_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._source_dirs.add(path)
+
+    def _copy_done(self, move, future):
+        error = future.exception()
+        if error is None:
+            self._record_restored(move, MODE_COPY)
+        elif isinstance(error, CopyCancelled):
+            with self._lock:
+                self._kept.append(move.seq)
+        else:
+            self._record_failure(move, str(error))
+
+    def _record_restored(self, move, mode):
+        with self._lock:
+            self.stats.restored += 1
+            self.result.restored += 1
+            if mode == MODE_COPY:
+                self.stats.copied += 1
+
+    def _record_failure(self, move, message):
+        with self._lock:
+            self.stats.failed += 1
+            self.result.errors.append((move, message))
+            self._kept.append(move.seq)
+
+
+def undo_run(history, run, should_continue=None, on_progress=None, progress_interval=0.1):
+    """Undo run (a HistoryRun of history) and return the UndoResult."""
+    pipeline = UndoPipeline(history, run, should_continue=should_continue, on_progress=on_progress,
+                            progress_interval=progress_interval)
+    return pipeline.run()
@@ -0,0 +1,206 @@
+"""Watch a source folder and hand over new entries once they have settled.
+
+On Linux the folder is watched with inotify (through ctypes, no extra
+package); elsewhere, or if inotify is unavailable, a polling source diffs the
+listing every second. FolderWatcher coalesces bursts of events per name and
+only passes a name on when it has had no events for `settle` seconds and its
+size and mtime are unchanged between two checks, so half-downloaded files are
+left alone until they stop growing.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+DEFAULT_SETTLE = 2.0      # Seconds without events/growth before a file counts as finished
+DEFAULT_MAX_BATCH = 5000  # Names handed over per batch during a heavy burst
+POLL_INTERVAL = 1.0
+
+RESCAN = None  # Returned in an event list when names were lost and the whole folder must be checked
+
+# inotify event bits (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+               | _IN_DELETE_SELF | _IN_MOVE_SELF)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class WatchStopped(Exception):
+    """The watched folder was deleted or moved away."""
+
+
+class InotifySource:
+    """Names created, written or moved into one folder, read from an inotify descriptor."""
+
+    def __init__(self, path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK) < 0:
+            err = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(err, f"inotify_add_watch failed for {path}")
+
+    def read(self, timeout):
+        """Return the names with events within timeout seconds (RESCAN if events were dropped)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 256 * 1024)
+        except BlockingIOError:
+            return []
+        names = []
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            if mask & _IN_Q_OVERFLOW:
+                names.append(RESCAN)
+            elif mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                raise WatchStopped()
+            elif length:
+                names.append(os.fsdecode(data[offset:offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingSource:
+    """Stand-in for inotify: lists the folder every interval and reports new or changed names."""
+
+    def __init__(self, path, interval=POLL_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._listing = self._list()
+        self._next = time.monotonic() + interval
+
+    def _list(self):
+        listing = {}
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    listing[entry.name] = (st.st_ino, st.st_size, st.st_mtime)
+        except FileNotFoundError:
+            raise WatchStopped()
+        return listing
+
+    def read(self, timeout):
+        wait = self._next - time.monotonic()
+        if wait > timeout:
+            time.sleep(timeout)
+            return []
+        if wait > 0:
+            time.sleep(wait)
+        self._next = time.monotonic() + self.interval
+        previous, self._listing = self._listing, self._list()
+        return [name for name, state in self._listing.items() if previous.get(name) != state]
+
+    def close(self):
+        pass
+
+
+def open_source(path, polling=False):
+    """inotify on Linux when available, otherwise the polling source."""
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifySource(path)
+        except (OSError, AttributeError):
+            pass  # No inotify symbols, or the per-user watch limit is used up
+    return PollingSource(path)
+
+
+class FolderWatcher:
+    """Feeds settled new or changed entries of source_dir to on_batch(names).
+
+    on_batch receives a list of names, or None after an event overflow, which
+    means "check the whole folder". run() returns once should_continue()
+    is False or the folder goes away (WatchStopped is raised in that case).
+    Names for which ignore(name) is True are never tracked or handed over.
+    """
+
+    def __init__(self, source_dir, on_batch, should_continue=None, settle=DEFAULT_SETTLE,
+                 max_batch=DEFAULT_MAX_BATCH, polling=False, ignore=None):
+        self.source_dir = source_dir
+        self.on_batch = on_batch
+        self.should_continue = should_continue
+        self.ignore = ignore
+        self.settle = settle
+        self.max_batch = max_batch
+        self.polling = polling
+        self._pending = {}   # name -> time of its last event
+        self._samples = {}   # name -> (size, mtime) at the last stability check
+
+    def run(self):
+        source = open_source(self.source_dir, self.polling)
+        rescan = False
+        try:
+            while self.should_continue is None or self.should_continue():
+                names = source.read(min(0.5, self.settle / 2))
+                now = time.monotonic()
+                for name in names:
+                    if name is RESCAN:
+                        rescan = True
+                    elif self.ignore is None or not self.ignore(name):
+                        self._pending[name] = now
+                        self._samples.pop(name, None)
+                if rescan and now - max(self._pending.values(), default=0.0) >= self.settle:
+                    rescan = False
+                    self._pending.clear()
+                    self._samples.clear()
+                    self.on_batch(None)
+                    continue
+                ready = self._settled(now)
+                for start in range(0, len(ready), self.max_batch):
+                    self.on_batch(ready[start:start + self.max_batch])
+        finally:
+            source.close()
+
+    def _settled(self, now):
+        """Names quiet for `settle` seconds whose size and mtime stopped changing."""
+        ready = []
+        for name, last_event in list(self._pending.items()):
+            if now - last_event < self.settle:
+                continue
+            try:
+                st = os.stat(os.path.join(self.source_dir, name))
+            except OSError as e:
+                if e.errno in (errno.ENOENT, errno.ENOTDIR):
+                    # Gone again (temporary file, or already moved): nothing to do
+                    del self._pending[name]
+                    self._samples.pop(name, None)
+                continue
+            sample = (st.st_size, st.st_mtime)
+            if self._samples.get(name) == sample:
+                del self._pending[name]
+                del self._samples[name]
+                ready.append(name)
+            else:
+                # Still growing (or first check): look again after another settle period
+                self._samples[name] = sample
+                self._pending[name] = now
+        return ready
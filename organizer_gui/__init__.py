@@ -0,0 +1,5 @@
+"""Qt helpers shared by the Personal, Office and Media organizer windows.
+
+Import the submodules directly (organizer_gui.worker, organizer_gui.watch, ...);
+nothing is loaded here, so importing one helper doesn't pull in the others.
+"""
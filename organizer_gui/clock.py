@@ -0,0 +1,98 @@
+"""One shared clock for the time/greeting labels of every organizer window.
+
+A single precise single-shot timer fires just after each second boundary and
+calls the callbacks of subscribed widgets that can actually be seen: a tab
+that isn't the current one, or a minimized window, is skipped. When no
+subscriber is visible the timer is stopped entirely; it restarts (refreshing
+the labels at once) when a subscriber is shown or its window restored.
+Subscribers whose widget has been deleted are dropped, as Qt can still send
+events (e.g. Hide) while a window is being destroyed.
+"""
+
+import time
+
+from PyQt6 import sip
+from PyQt6.QtCore import QEvent, QObject, Qt, QTimer
+
+_WATCHED_EVENTS = (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange)
+
+
+class UiClock(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def subscribe(self, widget, callback):
+        """Call callback() every second while widget is visible and its window isn't minimized."""
+        self._subscribers[widget] = callback
+        widget.installEventFilter(self)
+        widget.destroyed.connect(lambda: self.unsubscribe(widget))
+        self._reschedule(refresh=True)
+
+    def unsubscribe(self, widget):
+        if self._subscribers.pop(widget, None) is not None:
+            if not sip.isdeleted(widget):
+                widget.removeEventFilter(self)
+            self._reschedule()
+
+    def is_running(self):
+        return self._timer.isActive()
+
+    def eventFilter(self, obj, event):
+        if event.type() in _WATCHED_EVENTS:
+            if event.type() == QEvent.Type.Show and not sip.isdeleted(obj):
+                # The widget may have been moved into another window (e.g. a Unified tab): watch that one too
+                window = obj.window()
+                if window is not obj:
+                    window.installEventFilter(self)
+            self._reschedule(refresh=event.type() != QEvent.Type.Hide)
+        return False
+
+    def _visible_callbacks(self):
+        callbacks = []
+        for widget, callback in list(self._subscribers.items()):
+            if sip.isdeleted(widget):
+                del self._subscribers[widget]  # Deleted before its destroyed signal reached us
+            elif widget.isVisible() and not widget.window().isMinimized():
+                callbacks.append(callback)
+        return callbacks
+
+    def _reschedule(self, refresh=False):
+        if sip.isdeleted(self._timer):
+            return  # The clock went first, as the application shuts down
+        callbacks = self._visible_callbacks()
+        if not callbacks:
+            self._timer.stop()
+            return
+        if refresh:
+            for callback in callbacks:
+                callback()
+        if not self._timer.isActive():
+            self._start()
+
+    def _start(self):
+        # Fire just after the next second boundary so the displayed seconds never lag or skip
+        self._timer.start(1000 - int(time.time() * 1000) % 1000 + 5)
+
+    def _tick(self):
+        callbacks = self._visible_callbacks()
+        if not callbacks:
+            return
+        for callback in callbacks:
+            callback()
+        self._start()
+
+
+_clock = None
+
+
+def shared_clock():
+    """The application-wide UiClock (created on first use; needs a QApplication)."""
+    global _clock
+    if _clock is None:
+        _clock = UiClock()
+    return _clock
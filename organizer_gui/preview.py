@@ -0,0 +1,119 @@
+"""Preview button: the dry-run plan of the current selections, kept up to date while they change."""
+
+from PyQt6.QtCore import QObject, QTimer
+
+from organizer_core.engine import OrganizerEngine
+from organizer_core.job import JobError
+from organizer_core.plan import PlanSource
+from organizer_gui.worker import start_worker
+
+REPLAN_DELAY_MS = 150  # Quiet time after a checkbox change before planning again
+
+
+def preview_job(spec, source):
+    """Return a job for start_worker that plans spec's first source from source (a PlanSource).
+
+    The job returns the MovePlan (None if cancelled or failed), which is found
+    in worker.result once the worker has finished.
+    """
+    def job(worker):
+        try:
+            plan = OrganizerEngine(spec).plan(spec.sources[0], source, should_continue=worker.should_continue)
+        except Exception as e:
+            worker.report_status(f"Error previewing: {str(e)}", "error")
+            return None
+        if plan is not None:
+            worker.report_status(plan.describe(), "info")
+        return plan
+    return job
+
+
+class PlanPreview(QObject):
+    """One window's preview: the last scan of the source folder, the plan shown, and a re-plan timer.
+
+    make_spec() snapshots the window's selections as a JobSpec (on the GUI
+    thread); on_plan(plan) receives each new MovePlan and on_status(message,
+    level) the worker's messages. The Preview button scans the folder afresh;
+    selection_changed() plans again from the kept scan, so toggling categories
+    doesn't list the folder each time.
+    """
+
+    def __init__(self, parent, make_spec, on_plan, on_status):
+        super().__init__(parent)
+        self.make_spec = make_spec
+        self.on_plan = on_plan
+        self.on_status = on_status
+        self.plan = None
+        self._source = PlanSource()
+        self._thread = None
+        self._worker = None
+        self._again = False
+        self._generation = 0  # Bumped by forget(), so a dropped preview's result is ignored
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(REPLAN_DELAY_MS)
+        self._timer.timeout.connect(self._start)
+
+    def preview(self):
+        """Scan the source folder again and plan (the Preview button)."""
+        self.forget()
+        self._start()
+
+    def selection_changed(self):
+        """Plan again shortly, from the kept scan, if a preview is showing or being made."""
+        if self.plan is not None or self._worker is not None:
+            self._timer.start()
+
+    def current(self, spec):
+        """The plan shown if it was made for exactly spec's selections, else None."""
+        return self.plan if self.plan is not None and self.plan.spec == spec else None
+
+    def forget(self):
+        """Drop the plan and the scan, e.g. once items have been moved or the folders changed."""
+        self._timer.stop()
+        self.plan = None
+        self._source = PlanSource()
+        self._again = False
+        self._generation += 1
+        if self._worker is not None:
+            self._worker.cancel()
+
+    def stop(self):
+        """Cancel a preview in progress and wait for its thread, e.g. before the window closes."""
+        self.forget()
+        if self._thread is not None:
+            self._thread.wait()
+
+    def _start(self):
+        if self._worker is not None:
+            self._again = True  # One preview at a time: plan again once this one is done
+            return
+        try:
+            spec = self.make_spec()
+        except JobError as e:
+            self.on_status(str(e), "warning")
+            return
+        if not spec.sources[0] or not spec.destination:
+            self.on_status("Please select both source and destination folders.", "warning")
+            return
+        generation = self._generation
+        self._thread, worker = start_worker(preview_job(spec, self._source))
+        self._worker = worker
+        worker.status.connect(lambda message, level: self._status(generation, message, level))
+        worker.finished.connect(lambda: self._finished(worker, generation))
+        self._thread.start()
+
+    def _status(self, generation, message, level):
+        if generation == self._generation:
+            self.on_status(message, level)
+
+    def _finished(self, worker, generation):
+        self._worker = None
+        self._thread = None
+        if self._again:
+            self._again = False
+            self._start()
+            return
+        if generation == self._generation:
+            self.plan = worker.result
+            self.on_plan(self.plan)
@@ -0,0 +1,84 @@
+"""Start-up offer to recover runs that a crash or power cut left half done."""
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QMessageBox, QProgressDialog
+
+from organizer_core.journal import interrupted_runs
+from organizer_gui.worker import start_worker
+
+_offered = set()  # Profiles already asked about in this process (Unified builds each window once)
+
+
+def schedule_recovery(window, profile):
+    """Once window is up, offer to roll back or finish the profile's interrupted runs."""
+    if profile in _offered:
+        return
+    _offered.add(profile)
+    QTimer.singleShot(0, lambda: _offer_next(window, interrupted_runs(profile)))
+
+
+def _offer_next(window, runs):
+    if not runs:
+        return
+    run, rest = runs[0], runs[1:]
+    box = QMessageBox(window)
+    box.setWindowTitle("Interrupted Run")
+    box.setIcon(QMessageBox.Icon.Warning)
+    box.setText(run.describe())
+    box.setInformativeText("Roll back puts the moved items back where they were; Finish moves the rest. "
+                           "Discard leaves everything where it is now.")
+    rollback_btn = box.addButton("Roll Back", QMessageBox.ButtonRole.AcceptRole)
+    finish_btn = box.addButton("Finish", QMessageBox.ButtonRole.AcceptRole)
+    discard_btn = box.addButton("Discard", QMessageBox.ButtonRole.DestructiveRole)
+    box.addButton("Later", QMessageBox.ButtonRole.RejectRole)
+    box.setDefaultButton(rollback_btn)
+    box.exec()
+
+    clicked = box.clickedButton()
+    if clicked is rollback_btn:
+        _run_recovery(window, run, run.rollback, "Rolling back", "restored", lambda: _offer_next(window, rest))
+        return
+    if clicked is finish_btn:
+        _run_recovery(window, run, run.finish, "Finishing", "moved", lambda: _offer_next(window, rest))
+        return
+    if clicked is discard_btn:
+        run.discard()
+    else:
+        run.close()
+    _offer_next(window, rest)
+
+
+def _run_recovery(window, run, action, title, verb, then):
+    """Run action on a worker thread behind a cancellable progress dialog, then summarize."""
+    dialog = QProgressDialog(f"{title} the interrupted run...", "Cancel", 0, 100, window)
+    dialog.setWindowTitle("Interrupted Run")
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    dialog.setMinimumDuration(300)
+    outcome = {}
+
+    def job(worker):
+        outcome["result"] = action(should_continue=worker.should_continue,
+                                   on_progress=lambda done, total: worker.report_progress(
+                                       done * 100 // max(total, 1), f"{done:,} of {total:,}"))
+        outcome["cancelled"] = not worker.should_continue()
+
+    def finished():
+        dialog.close()
+        count, problems = outcome.get("result", (0, []))
+        message = f"{count:,} item(s) {verb}."
+        if outcome.get("cancelled"):
+            message += " Stopped before the end; the rest will be offered again next time."
+        if problems:
+            shown = "\n".join(f"{move.source}: {problem}" for move, problem in problems[:10])
+            more = f"\n...and {len(problems) - 10:,} more" if len(problems) > 10 else ""
+            QMessageBox.warning(window, "Interrupted Run",
+                                f"{message}\n{len(problems):,} item(s) were left alone:\n{shown}{more}")
+        else:
+            QMessageBox.information(window, "Interrupted Run", message)
+        then()
+
+    thread, worker = start_worker(job)
+    worker.progress.connect(lambda value, detail: dialog.setValue(value))
+    worker.finished.connect(finished)
+    dialog.canceled.connect(worker.cancel)
+    thread.start()
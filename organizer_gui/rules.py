@@ -0,0 +1,95 @@
+"""Rules button: edit the JSON rules a window checks before its categories."""
+
+import json
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtWidgets import QDialog, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton, QVBoxLayout
+
+from organizer_core.rules import RuleError, load_rules, parse_rules, rule_to_dict, rules_path, save_rules
+
+RULES_HELP = (
+    "Items matching a rule go to its folder before the categories are looked at; "
+    "the first rule that holds decides. A rule needs a \"folder\" and any of: "
+    "\"extensions\", \"names\" (globs), \"regex\", \"paths\" (globs on the full path), "
+    "\"min_size\"/\"max_size\" (e.g. \"50MB\"), \"older_than\"/\"newer_than\" (e.g. \"30d\", \"1y\") "
+    "and \"kind\" (\"file\", \"folder\" or \"any\").")
+
+EXAMPLE_RULES = [
+    {"folder": "Large Docs", "extensions": [".pdf"], "min_size": "50MB"},
+    {"folder": "Archive", "older_than": "1y"},
+]
+
+
+def edit_rules(parent, profile, rules):
+    """Show the rules of profile as editable JSON; return the saved Rules, or None if cancelled."""
+    dialog = QDialog(parent)
+    dialog.setWindowTitle("Rules")
+    dialog.setMinimumWidth(560)
+    dialog.setMinimumHeight(420)
+
+    layout = QVBoxLayout(dialog)
+    layout.setContentsMargins(20, 15, 20, 15)
+    layout.setSpacing(10)
+
+    help_label = QLabel(RULES_HELP, dialog)
+    help_label.setWordWrap(True)
+    layout.addWidget(help_label)
+
+    editor = QPlainTextEdit(dialog)
+    editor.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+    editor.setPlaceholderText(json.dumps(EXAMPLE_RULES, indent=2))
+    if rules:
+        editor.setPlainText(json.dumps([rule_to_dict(rule) for rule in rules], indent=2))
+    layout.addWidget(editor)
+
+    error_label = QLabel("", dialog)
+    error_label.setWordWrap(True)
+    error_label.setStyleSheet("color: #d9534f;")
+    error_label.hide()
+    layout.addWidget(error_label)
+
+    saved = []
+
+    def save():
+        text = editor.toPlainText().strip()
+        try:
+            new_rules = parse_rules(json.loads(text)) if text else ()
+        except ValueError as e:  # Bad JSON or a RuleError
+            error_label.setText(str(e))
+            error_label.show()
+            return
+        try:
+            save_rules(rules_path(profile), new_rules)
+        except OSError as e:
+            error_label.setText(f"Can't save the rules: {e}")
+            error_label.show()
+            return
+        saved.append(new_rules)
+        dialog.accept()
+
+    button_layout = QHBoxLayout()
+    button_layout.addStretch()
+    cancel_btn = QPushButton("Cancel", dialog)
+    cancel_btn.setObjectName("SecondaryButton")
+    cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    cancel_btn.clicked.connect(dialog.reject)
+    button_layout.addWidget(cancel_btn)
+    save_btn = QPushButton("Save Rules", dialog)
+    save_btn.setObjectName("PrimaryButton")
+    save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+    save_btn.clicked.connect(save)
+    button_layout.addWidget(save_btn)
+    layout.addLayout(button_layout)
+
+    dialog.exec()
+    return saved[0] if saved else None
+
+
+def load_window_rules(window, profile):
+    """The saved rules of profile for a window starting up; () with a status warning if they can't be read."""
+    try:
+        return load_rules(rules_path(profile))
+    except RuleError as e:
+        window.update_status(f"Rules not loaded: {e}", "warning")
+        return ()
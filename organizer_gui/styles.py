@@ -0,0 +1,37 @@
+"""Stylesheet cache and per-widget restyling shared by the Personal, Office and Media windows.
+
+Each window's theme is built from its palette once and reused. State changes
+such as the organize button turning into Cancel, or the status line changing
+colour, set a dynamic property the stylesheet selects on (e.g.
+QPushButton#PrimaryButton[danger="true"]) and re-polish only that widget,
+instead of setting a new stylesheet that re-polishes the whole window.
+"""
+
+_compiled = {}
+
+
+def compiled_stylesheet(build, colors):
+    """Return build(colors), building it only once per (builder, palette)."""
+    key = (build, tuple(sorted(colors.items())))
+    sheet = _compiled.get(key)
+    if sheet is None:
+        sheet = _compiled[key] = build(colors)
+    return sheet
+
+
+def apply_stylesheet(widget, build, colors):
+    """Give widget the compiled theme; does nothing if it already has it."""
+    sheet = compiled_stylesheet(build, colors)
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)
+
+
+def set_state(widget, name, value):
+    """Set a dynamic property used by the stylesheet and re-polish just this widget."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -0,0 +1,55 @@
+"""Undo of a history run on a worker thread, shared by the Personal, Office and Media windows."""
+
+from PyQt6.QtWidgets import QMessageBox
+
+from organizer_core.undo import undo_run
+
+MAX_LISTED_FAILURES = 1000  # Lines in the failure report's details
+
+
+def undo_job(history, run):
+    """Return a job for start_worker that undoes run and reports through the worker.
+
+    The job returns the UndoResult (None if the undo could not start), which
+    the window finds in worker.result once the worker has finished.
+    """
+    def job(worker):
+        try:
+            result = undo_run(history, run, should_continue=worker.should_continue,
+                              on_progress=lambda stats: worker.report_progress(int(stats.fraction() * 100),
+                                                                                stats.describe()),
+                              progress_interval=worker.interval)
+        except Exception as e:
+            worker.report_status(f"Error undoing last action: {str(e)}", "error")
+            return None
+        worker.report_status(*describe_undo(result))
+        return result
+    return job
+
+
+def describe_undo(result):
+    """(message, level) for the status label after an undo."""
+    message = f"Undone: {result.restored:,} item(s) restored to their original location."
+    if result.missing:
+        message += f" {result.missing:,} were no longer in the destination folder."
+    if result.errors:
+        message += f" {len(result.errors):,} could not be restored and can be undone again later."
+    if result.cancelled:
+        return "Undo cancelled. " + message + " The rest can be undone later.", "warning"
+    return message, "warning" if result.errors else "success"
+
+
+def show_undo_failures(parent, result):
+    """List the items an undo had to leave where they are."""
+    if result is None or not result.errors:
+        return
+    lines = [f"{move.destination}: {message}" for move, message in result.errors[:MAX_LISTED_FAILURES]]
+    if len(result.errors) > MAX_LISTED_FAILURES:
+        lines.append(f"...and {len(result.errors) - MAX_LISTED_FAILURES:,} more")
+    box = QMessageBox(parent)
+    box.setWindowTitle("Undo")
+    box.setIcon(QMessageBox.Icon.Warning)
+    box.setText(f"{len(result.errors):,} item(s) could not be put back and were left where they are.")
+    box.setInformativeText(lines[0])
+    box.setDetailedText("\n".join(lines))
+    box.exec()
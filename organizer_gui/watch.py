@@ -0,0 +1,36 @@
+"""Keep-organized mode: after the first pass, organize new entries as they arrive."""
+
+from organizer_core.fastcopy import is_partial
+from organizer_core.watcher import FolderWatcher, WatchStopped
+
+
+def keep_organized(worker, engine, source_dir, new_undo_step):
+    """Watch source_dir and organize settled new entries until the worker is cancelled.
+
+    Runs on the worker thread. engine is the OrganizerEngine the first pass
+    used; new_undo_step() returns the on_moves callback that saves a batch's
+    completed moves as a step of the undo history.
+    """
+    organized = 0
+
+    def organize_batch(names):
+        nonlocal organized
+        result = engine.organize(source_dir, names=names, should_continue=worker.should_continue,
+                                 on_moves=new_undo_step())
+        organized += result.stats.moved
+        message = f"Keeping this folder organized · {organized:,} new item(s) sorted so far"
+        if result.errors:
+            message += f" · last batch: {len(result.errors)} could not be moved ({result.errors[0][1]})"
+        worker.report_status(message, "warning" if result.errors else "info")
+
+    # The destination's own folders (when it is inside source_dir) and copies in progress never count as new
+    reserved = engine.reserved_names(source_dir)
+
+    def ignore(name):
+        return name in reserved or is_partial(name)
+
+    worker.report_status("Keeping this folder organized: watching for new items...", "info")
+    try:
+        FolderWatcher(source_dir, organize_batch, should_continue=worker.should_continue, ignore=ignore).run()
+    except WatchStopped:
+        worker.report_status("Stopped watching: the source folder was moved or deleted.", "warning")
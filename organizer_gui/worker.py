@@ -0,0 +1,107 @@
+"""Background organizing worker: runs a job on a QThread and reports through typed signals."""
+
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+REFRESH_HZ = 30  # Most progress/status/count updates per second that reach the GUI
+
+_active = set()  # (thread, worker) pairs kept alive until the thread has finished
+
+
+class OrganizeWorker(QObject):
+    """Runs job(worker) on its own QThread.
+
+    The job may call report_progress(), report_status() and report_counts() as
+    often as it likes; they are coalesced so at most REFRESH_HZ updates per
+    second are emitted (the latest value wins) and the GUI event queue stays
+    small whatever the file count. A held-back update is sent by a small flusher
+    thread within one interval, even if the job reports nothing more (e.g. while
+    watching an idle folder), and anything pending is flushed before finished.
+    Movements and items_skipped are emitted directly, since each fires once
+    per run.
+    """
+
+    progress = pyqtSignal(int, str)     # percent, detail line
+    status = pyqtSignal(str, str)       # message, level ("info", "success", "warning", "error")
+    counts = pyqtSignal(dict)           # category -> items moved so far
+    movements = pyqtSignal(int)         # items just saved to the undo history
+    items_skipped = pyqtSignal(object)  # what had no category and was left in place, as the job reports it
+    finished = pyqtSignal()
+
+    def __init__(self, job, refresh_hz=REFRESH_HZ):
+        super().__init__()
+        self.job = job
+        self.result = None  # What job returned, once finished has been emitted
+        self.interval = 1.0 / refresh_hz
+        self._pending = {}
+        self._last_emit = 0.0
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+
+    def run(self):
+        flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        flusher.start()
+        try:
+            self.result = self.job(self)
+        finally:
+            self._done.set()
+            flusher.join()
+            self.flush()
+            self.finished.emit()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def should_continue(self):
+        return not self._cancelled.is_set()
+
+    # --- Coalesced reports ---
+    def report_progress(self, value, detail=""):
+        self._post("progress", value, detail)
+
+    def report_status(self, message, level="info"):
+        self._post("status", message, level)
+
+    def report_counts(self, counts):
+        self._post("counts", dict(counts))
+
+    def flush(self):
+        """Emit whatever is pending now, in the order it was last reported."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_emit = time.perf_counter()
+        for name, args in pending.items():
+            getattr(self, name).emit(*args)
+
+    def _flush_loop(self):
+        while not self._done.wait(self.interval):
+            if self._pending:
+                self.flush()
+
+    def _post(self, name, *args):
+        with self._lock:
+            self._pending.pop(name, None)
+            self._pending[name] = args
+            if time.perf_counter() - self._last_emit < self.interval:
+                return
+        self.flush()
+
+
+def start_worker(job):
+    """Create an OrganizeWorker for job on a new QThread and return (thread, worker).
+
+    Connect the worker's signals, then call thread.start(). Both objects are
+    kept alive here until the thread has finished, even if the caller drops them.
+    """
+    thread = QThread()
+    worker = OrganizeWorker(job)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit)
+    pair = (thread, worker)
+    _active.add(pair)
+    thread.finished.connect(lambda: _active.discard(pair))
+    return pair
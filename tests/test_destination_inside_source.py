@@ -0,0 +1,102 @@
+"""Organizing a folder into itself (or into a folder inside it) leaves the destination's own folders alone."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from organizer_core.engine import OrganizerEngine
+from organizer_core.fastcopy import partial_path
+from organizer_core.job import JobSpec
+from organizer_core.watcher import FolderWatcher
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def make_files(folder, *names):
+    for name in names:
+        with open(os.path.join(folder, name), "w") as f:
+            f.write(name)
+
+
+class DestinationInsideSourceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        data_dir = mock.patch.dict(os.environ, {"ORGANIZER_DATA_DIR": os.path.join(self.tmp, "data")})
+        data_dir.start()
+        self.addCleanup(data_dir.stop)
+        self.source = os.path.join(self.tmp, "Downloads")
+        os.makedirs(self.source)
+
+    def engine(self, dest=None, batch=False):
+        spec = JobSpec.create("personal", self.source, dest or self.source, incremental=False)
+        return OrganizerEngine(spec, batch=batch)
+
+    def test_src_equals_dst(self):
+        make_files(self.source, "a.pdf", "b.jpg")
+        os.makedirs(os.path.join(self.source, "projects"))
+        result = self.engine().organize(self.source)
+        self.assertEqual(result.stats.moved, 3)
+        self.assertEqual(sorted(os.listdir(self.source)), ["Documents", "Images", "Project Folders"])
+
+        # Second pass: 'Documents' would match the 'documents' keyword if it were scanned
+        make_files(self.source, "c.pdf", partial_path("d.mp4"))
+        engine = self.engine()
+        result = engine.organize(self.source)
+        self.assertEqual(result.stats.moved, 1)
+        self.assertEqual(result.stats.scanned, 1)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.source, "Documents"))), ["a.pdf", "c.pdf"])
+        self.assertEqual(engine.uncategorized_folders, set())
+        self.assertEqual(engine.unavailable_types, set())
+
+    @unittest.skipIf(numpy is None, "batch mode needs NumPy")
+    def test_src_equals_dst_batch_and_plan(self):
+        make_files(self.source, "a.pdf")
+        self.engine().organize(self.source)
+        make_files(self.source, "b.pdf")
+        engine = self.engine(batch=True)
+        plan = engine.plan(self.source)
+        self.assertEqual([entry.name for entry, _ in plan.moves], ["b.pdf"])
+        self.assertEqual(plan.unmatched, 0)
+        result = engine.organize(self.source)
+        self.assertEqual(result.stats.moved, 1)
+        self.assertEqual(os.listdir(self.source), ["Documents"])
+
+    def test_destination_further_inside(self):
+        dest = os.path.join(self.source, "backups", "by type")
+        os.makedirs(dest)
+        make_files(self.source, "a.pdf")
+        result = self.engine(dest).organize(self.source)
+        self.assertEqual(result.stats.moved, 1)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(os.listdir(self.source), ["backups"])
+        self.assertEqual(os.listdir(os.path.join(dest, "Documents")), ["a.pdf"])
+
+    def test_watch_ignores_reserved_names(self):
+        engine = self.engine()
+        reserved = engine.reserved_names(self.source)
+        self.assertIn("Documents", reserved)
+        batches = []
+        deadline = time.monotonic() + 10
+
+        def should_continue():
+            if not os.path.exists(os.path.join(self.source, "new.pdf")):
+                # First check: the watch is set up, so these are seen as new
+                os.makedirs(os.path.join(self.source, "Documents"))
+                make_files(self.source, "new.pdf")
+            return time.monotonic() < deadline and not batches
+
+        FolderWatcher(self.source, batches.append, should_continue=should_continue, settle=0.2,
+                      ignore=reserved.__contains__).run()
+        self.assertEqual(batches, [["new.pdf"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,11 +6,18 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    # The organizer tabs are imported by name when first shown (see ORGANIZER_TABS)
+    hiddenimports=[
+        'PersonalOrganizerBuild.PERSONAL_organizer',
+        'FILE_ORGANIZER_OFFICE_SUITE.OFFICE_organizer',
+        'FILE_ORGANIZER_CREATORS_SUITE.media_organizer',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Qt only: keep Tcl/Tk (_tcl_data, _tk_data, tcl86t/tk86t) out of the bundle
+    # NumPy is only used by batch classification (CLI --batch), never by the GUI
+    excludes=['tkinter', '_tkinter', 'numpy'],
     noarchive=False,
     optimize=0,
 )